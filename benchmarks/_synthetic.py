@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+"""
+Synthetic SAPLink nuggets, shared by benchmarks and tests.
+"""
+
+
+def synthetic_nugget(copies=1, declared_encoding='utf-8'):
+    """
+    Builds a SAPLink nugget (as text) exercising every element handled by the library.
+
+    Each copy adds one class, one interface, one program, one function group, one message
+    class and one domain, data element and structure, all suffixed by the copy number.
+    """
+    objects = []
+    for copy in range(copies):
+        objects.append(_OBJECTS.format(n=copy))
+    return (u'<?xml version="1.0" encoding="{encoding}"?>\n'
+            u'<nugget name="ZSLPUT_SYNTHETIC">\n{objects}</nugget>\n'
+            .format(encoding=declared_encoding, objects=''.join(objects)))
+
+
+_OBJECTS = u"""\
+ <CLAS CLSNAME="ZSLPUT_CL_{n}" VERSION="1" LANGU="E" DESCRIPT="Synthetic class {n}" EXPOSURE="2" STATE="1" CLSFINAL="X" CLSCCINCL="X" FIXPT="X" UNICODE="X" AUTHOR="DEVELOPER" CREATEDON="20150617" CHANGEDBY="DEVELOPER" CHANGEDON="20150618" REFCLSNAME="ZSLPUT_CL_BASE">
+  <localImplementation>*"* local class implementation for public class
+*"* use this source file for the implementation part of
+*"* local helper classes</localImplementation>
+  <localTypes>*"* use this source file for any type declarations
+TYPES ty_{n} TYPE string.</localTypes>
+  <localMacros>*"* use this source file for any macro definitions</localMacros>
+  <inheritance CLSNAME="ZSLPUT_CL_{n}" REFCLSNAME="ZSLPUT_CL_BASE" VERSION="1" STATE="1">
+   <redefinition CLSNAME="ZSLPUT_CL_{n}" REFCLSNAME="ZSLPUT_CL_BASE" VERSION="1" MTDNAME="RUN" EXPOSURE="2"/>
+  </inheritance>
+  <interfaceMethod CLSNAME="ZSLPUT_CL_{n}" CPDNAME="ZSLPUT_IF_{n}~DO" REFCLSNAME="ZSLPUT_IF_{n}">
+   <source>METHOD zslput_if_{n}~do.
+  rv_result = abap_true &amp; &lt;fs&gt;.
+ENDMETHOD.</source>
+  </interfaceMethod>
+  <publicSection>class ZSLPUT_CL_{n} definition
+  public
+  final
+  create public .
+
+public section.
+  data MV_NAME type STRING .</publicSection>
+  <protectedSection>protected section.</protectedSection>
+  <privateSection>private section.</privateSection>
+  <textPool>
+   <language SPRAS="E">
+    <textElement ID="I" KEY="001" ENTRY="Text {n}" LENGTH="20 "/>
+   </language>
+  </textPool>
+  <attribute CLSNAME="ZSLPUT_CL_{n}" CMPNAME="MV_NAME" VERSION="1" LANGU="E" DESCRIPT="Name" EXPOSURE="2" STATE="1" EDITORDER="1" ATTDECLTYP="0" ATTEXPVIRT="0" TYPTYPE="1" TYPE="STRING" SRCROW1="0" SRCCOLUMN1="0" SRCROW2="0" SRCCOLUMN2="0"/>
+  <method CLSNAME="ZSLPUT_CL_{n}" CMPNAME="RUN" VERSION="1" LANGU="E" DESCRIPT="Run it" EXPOSURE="2" STATE="1" EDITORDER="2" DISPID="0" MTDTYPE="0" MTDDECLTYP="0" BCMTDCAT="0" BCMTDSYN="0" MTDABSTRCT="" MTDFINAL="" MTDNEWEXC="" MTDOPTNL="">
+   <parameter CLSNAME="ZSLPUT_CL_{n}" CMPNAME="RUN" SCONAME="IV_VALUE" VERSION="1" LANGU="E" DESCRIPT="Value" CMPTYPE="1" MTDTYPE="0" EDITORDER="1" DISPID="0" PARDECLTYP="0" PARPASSTYP="1" TYPTYPE="1" TYPE="STRING"/>
+   <parameter CLSNAME="ZSLPUT_CL_{n}" CMPNAME="RUN" SCONAME="RT_RETURN" VERSION="1" LANGU="E" DESCRIPT="Return" CMPTYPE="1" MTDTYPE="0" EDITORDER="2" DISPID="0" PARDECLTYP="3" PARPASSTYP="0" TYPTYPE="1" TYPE="BAPIRET2_T"/>
+   <exception CLSNAME="ZSLPUT_CL_{n}" CMPNAME="RUN" SCONAME="ZCX_SLPUT" VERSION="1" LANGU="E" DESCRIPT="Error" MTDTYPE="0" EDITORDER="1"/>
+   <source>METHOD run.
+* Line with "quotes" and &lt;brackets&gt; in copy {n}
+  WRITE iv_value.
+ENDMETHOD.</source>
+  </method>
+ </CLAS>
+ <INTF CLSNAME="ZSLPUT_IF_{n}" VERSION="1" LANGU="E" DESCRIPT="Synthetic interface {n}" EXPOSURE="2" STATE="1" UNICODE="X" AUTHOR="DEVELOPER" CREATEDON="20150617">
+  <attribute CLSNAME="ZSLPUT_IF_{n}" CMPNAME="GC_VERSION" VERSION="1" LANGU="E" DESCRIPT="Version" EXPOSURE="2" STATE="1" ATTDECLTYP="2" TYPTYPE="1" TYPE="I"/>
+  <method CLSNAME="ZSLPUT_IF_{n}" CMPNAME="DO" VERSION="1" LANGU="E" DESCRIPT="Do it" EXPOSURE="2" STATE="1" MTDDECLTYP="0">
+   <parameter CLSNAME="ZSLPUT_IF_{n}" CMPNAME="DO" SCONAME="RV_RESULT" VERSION="1" LANGU="E" PARDECLTYP="3" PARPASSTYP="0" TYPTYPE="1" TYPE="ABAP_BOOL"/>
+  </method>
+ </INTF>
+ <PROG NAME="ZSLPUT_PROGRAM_{n}" VARCL="X" SUBC="1" CNAM="DEVELOPER" CDAT="20150617" UNAM="DEVELOPER" UDAT="20150618" RSTAT="K" RLOAD="E" FIXPT="X" UCCHECK="X">
+  <textPool>
+   <language SPRAS="E">
+    <textElement ID="R" ENTRY="Synthetic program {n}" LENGTH="21 "/>
+    <textElement ID="I" KEY="001" ENTRY="Hello" LENGTH="10 "/>
+   </language>
+  </textPool>
+  <source>REPORT zslput_program_{n}.
+
+START-OF-SELECTION.
+  WRITE 'Hello &amp; goodbye'(001).</source>
+ </PROG>
+ <FUGR AREA="ZSLPUT_FG_{n}" SPRAS="E" AREAT="Synthetic function group {n}">
+  <mainprogram NAME="SAPLZSLPUT_FG_{n}" VARCL="X" SUBC="F" CNAM="DEVELOPER" CDAT="20150617" UNAM="DEVELOPER" UDAT="20150618" RSTAT="K" FIXPT="X" UCCHECK="X">
+   <textPool/>
+   <source>FUNCTION-POOL zslput_fg_{n}.
+INCLUDE lzslput_fg_{n}top.</source>
+  </mainprogram>
+  <includeprograms>
+   <include NAME="LZSLPUT_FG_{n}TOP" VARCL="X" SUBC="I" CNAM="DEVELOPER">
+    <include_source>FUNCTION-POOL zslput_fg_{n}.</include_source>
+   </include>
+  </includeprograms>
+  <functionmodules>
+   <functionmodule NAME="Z_SLPUT_FM_{n}" STEXT="Synthetic function module {n}">
+    <importing PARAMETER="IV_INPUT" REFERENCE="X" TYP="STRING"/>
+    <importing PARAMETER="IV_FLAG" DEFAULT="ABAP_FALSE" OPTIONAL="X" REFERENCE="X" TYP="ABAP_BOOL"/>
+    <exporting PARAMETER="EV_OUTPUT" REFERENCE="X" TYP="STRING"/>
+    <changing PARAMETER="CV_COUNTER" REFERENCE="X" TYP="I"/>
+    <tables PARAMETER="ET_RETURN" DBSTRUCT="BAPIRET2" OPTIONAL="X"/>
+    <exceptions EXCEPTION="NOT_FOUND"/>
+    <fm_source>  ev_output = iv_input.
+  cv_counter = cv_counter + 1.</fm_source>
+   </functionmodule>
+  </functionmodules>
+ </FUGR>
+ <MSAG ARBGB="ZSLPUT_MSG_{n}" MASTERLANG="E" RESPUSER="DEVELOPER" STEXT="Synthetic messages {n}">
+  <T100 SPRSL="E" ARBGB="ZSLPUT_MSG_{n}" MSGNR="000" TEXT="&amp;1 &amp;2 &amp;3 &amp;4"/>
+  <T100 SPRSL="E" ARBGB="ZSLPUT_MSG_{n}" MSGNR="001" TEXT="Object &amp;1 not found"/>
+ </MSAG>
+ <DOMA DOMNAME="ZSLPUT_DOMAIN_{n}" MultiLanguageSupport="X">
+  <dd01v DOMNAME="ZSLPUT_DOMAIN_{n}" DDLANGUAGE="E" DATATYPE="CHAR" LENG="000010" OUTPUTLEN="000010" DECIMALS="000000" LOWERCASE="X" DDTEXT="Synthetic domain {n}" MASKLEN="0000"/>
+ </DOMA>
+ <DTEL ROLLNAME="ZSLPUT_DATAELEMENT_{n}" DDTEXT="Synthetic data element {n}" DATATYPE="CHAR" DOMNAME="ZSLPUT_DOMAIN_{n}" MultiLanguageSupport="X">
+  <dd04v ROLLNAME="ZSLPUT_DATAELEMENT_{n}" DDLANGUAGE="E" DOMNAME="ZSLPUT_DOMAIN_{n}" HEADLEN="10" SCRLEN1="10" SCRLEN2="15" SCRLEN3="20" DDTEXT="Synthetic data element {n}" REPTEXT="Heading" SCRTEXT_S="Short" SCRTEXT_M="Medium" SCRTEXT_L="Long label" DATATYPE="CHAR" LENG="000010" OUTPUTLEN="000010" DECIMALS="000000" LOWERCASE="X" REFKIND="D"/>
+ </DTEL>
+ <TABL TABNAME="ZSLPUT_STRUCTURE_{n}" DDLANGUAGE="E" TABCLASS="INTTAB" DDTEXT="Synthetic structure {n}">
+  <dd03p TABNAME="ZSLPUT_STRUCTURE_{n}" FIELDNAME="FIELD1" DDLANGUAGE="E" POSITION="0001" ROLLNAME="ZSLPUT_DATAELEMENT_{n}" INTTYPE="C" INTLEN="000020" DATATYPE="CHAR" LENG="000010" OUTPUTLEN="000010" DECIMALS="000000" MASKLEN="0000"/>
+  <dd03p TABNAME="ZSLPUT_STRUCTURE_{n}" FIELDNAME="FIELD2" DDLANGUAGE="E" POSITION="0002" ROLLNAME="ABAP_BOOL" INTTYPE="C" INTLEN="000002" DATATYPE="CHAR" LENG="000001" OUTPUTLEN="000001" DECIMALS="000000" MASKLEN="0000"/>
+ </TABL>
+"""
@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+"""
+Micro-benchmark of the element dispatch done by SAPLinkContentHandle.
+
+Events of a synthetic nugget are recorded once with expat and then replayed straight into the
+content handle, so only dispatching and handlers are measured (no XML tokenizing). The legacy
+dispatch of the baseline (upper casing the tag and looking up a flat tag map on every event)
+is replayed too, as a reference.
+
+Usage: python -m benchmarks.dispatch_benchmark [copies] [repetitions]
+"""
+
+import logging
+import sys
+import timeit
+
+from xml.parsers import expat
+
+from benchmarks._synthetic import synthetic_nugget
+from slpyser.xmlparser.SAPLinkContentHandle import SAPLinkContentHandle
+
+
+# Keys of the flat tag map of the baseline content handle, in the order it was filled: its own
+# elements, then the ones of the program, dictionary, class library and function group handlers.
+_LEGACY_TAGS = (
+    'TEXTPOOL', 'TEXTELEMENT', 'MSAG', 'T100', 'SOURCE', 'LANGUAGE',
+    'PROG',
+    'DOMA', 'DD01V', 'DTEL', 'DD04V', 'DDLANGUAGE', 'TABL', 'DD03P', 'TTYP',
+    'CLAS', 'CLASSDOCUMENTATION', 'INHERITANCE', 'INTF', 'PUBLICSECTION', 'PROTECTEDSECTION',
+    'PRIVATESECTION', 'LOCALIMPLEMENTATION', 'LOCALTYPES', 'LOCALMACROS', 'METHOD',
+    'INTERFACEMETHOD', 'PARAMETER', 'EXCEPTION', 'ATTRIBUTE', 'REDEFINITION',
+    'FUGR', 'MAINPROGRAM', 'INCLUDEPROGRAMS', 'INCLUDE', 'FUNCTIONMODULES', 'FUNCTIONMODULE',
+    'IMPORTING', 'EXPORTING', 'CHANGING', 'TABLES', 'EXCEPTIONS', 'FM_SOURCE', 'FM_SOURCE_NEW',
+)
+
+
+class LegacyDispatchContentHandle(SAPLinkContentHandle):
+    """
+    Content handle dispatching events with the code of the baseline content handle: its
+    ``startElement``, ``characters`` and ``endElement`` and its handlers of unhandled elements
+    (logging each event) are copied verbatim.
+
+    Its flat map has the same tags as the baseline one. Handlers of the baseline don't exist
+    anymore, so each tag is bound to the current handler of an element path ending with it.
+    """
+
+    def __init__(self):
+        SAPLinkContentHandle.__init__(self)
+        self.__logger = logging.getLogger(__name__)
+        by_tag = {}
+        for path, handlers in self._matrix_element_path_handler.items():
+            by_tag[path.rsplit('/', 1)[-1]] = handlers
+        self._matrix_element_case_handler = {tag: by_tag.get(tag, [None, None, None])
+                                             for tag in _LEGACY_TAGS}
+        self.__unhandled_element = [
+            self._startUnhandled,
+            self._charactersUnhandled,
+            self._endUnhandled
+        ]
+
+        # Helper attributes
+        self.__current_tag = None
+        self.__current_tag_stack = []
+
+    def startElement(self, name, attrs):
+        """Parses start element"""
+        # Upper case on name because SAPLINK haven't used same case on all elements.
+        self.__current_tag = name.upper()
+        self.__current_tag_stack.append(self.__current_tag)
+        start_element_handler = self._matrix_element_case_handler.get(self.__current_tag, self.__unhandled_element)[0]
+        if start_element_handler is not None:
+            start_element_handler(name.upper(), attrs)
+
+    def characters(self, content):
+        """
+        Parses inner contents of current element.
+        This method is called for each new line inside that element.
+        """
+        characters_handler = self._matrix_element_case_handler.get(self.__current_tag, self.__unhandled_element)[1]
+        if characters_handler is not None:
+            characters_handler(content)
+
+    def endElement(self, name):
+        """Parses end of element."""
+        if self.__current_tag != name.upper():
+            self.__logger.error('ERROR parsing file, current element was %s but closing element was %s' , self.__current_tag, name.upper())
+        end_element_handler = self._matrix_element_case_handler.get(self.__current_tag, self.__unhandled_element)[2]
+        if end_element_handler is not None:
+            end_element_handler(name.upper())
+        self.__current_tag_stack.pop()
+        # FIXME: Append None to currentTagStack to avoid little hack?
+        self.__current_tag = self.__current_tag_stack[-1] if len(self.__current_tag_stack) > 0 else None
+
+    def _startUnhandled(self, name, attrs):
+        self.__logger.warning('Start of an unhandled element: %s', name)
+
+    def _charactersUnhandled(self, content):
+        self.__logger.warning('Content of unhandled tag: %s', content)
+
+    def _endUnhandled(self, name):
+        self.__logger.warning('End of an unhandled element: %s', name)
+
+
+def record_events(nugget):
+    """
+    Parses a nugget, returning all its events as (method name, arguments) tuples.
+    """
+    events = []
+    parser = expat.ParserCreate()
+    parser.StartElementHandler = lambda name, attrs: events.append(('startElement', (name, attrs)))
+    parser.CharacterDataHandler = lambda content: events.append(('characters', (content,)))
+    parser.EndElementHandler = lambda name: events.append(('endElement', (name,)))
+    parser.Parse(nugget.encode('utf-8'), True)
+    return events
+
+
+def replay(handle_class, events):
+    """
+    Replays events into a new content handle, with its methods bound beforehand like the XML
+    backends do.
+    """
+    handle = handle_class()
+    methods = {
+        'startElement': handle.startElement,
+        'characters': handle.characters,
+        'endElement': handle.endElement,
+    }
+    for method_name, arguments in events:
+        methods[method_name](*arguments)
+
+
+def main(copies=500, repetitions=5):
+    # The legacy dispatch logs each event of unhandled elements as the baseline did; logging is
+    # disabled so those calls are measured, but not writing their output.
+    logging.disable(logging.WARNING)
+    events = record_events(synthetic_nugget(copies=copies))
+    print('Synthetic nugget with %d copies: %d events' % (copies, len(events)))
+    handle_classes = (('legacy dispatch', LegacyDispatchContentHandle),
+                      ('state dispatch', SAPLinkContentHandle))
+    best = {}
+    # Runs are interleaved, so noise from the host affects both dispatchers alike.
+    for _ in range(repetitions):
+        for label, handle_class in handle_classes:
+            seconds = timeit.timeit(lambda: replay(handle_class, events), number=1)
+            best[label] = min(seconds, best.get(label, seconds))
+    for label, _ in handle_classes:
+        print('%-18s %10.0f events/s (%.3f s)' % (label, len(events) / best[label], best[label]))
+
+if __name__ == '__main__':
+    main(*[int(argument) for argument in sys.argv[1:]])
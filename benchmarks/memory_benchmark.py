@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+"""
+Memory benchmark of the model objects built by parsing a synthetic nugget.
+
+For each model class, instances holding the same attribute values are allocated twice: as the
+slotted model class and as a plain class with a per-instance ``__dict__`` (how the model was
+declared before ``__slots__``), measuring the bytes allocated per instance. Attribute values
+are shared by both, so only the overhead of the objects themselves is compared. Since Python
+3.11 the ``__dict__`` of an instance is only allocated when it's accessed (e.g. by ``vars`` or
+pickle), so savings are bigger on older versions.
+
+Usage: python -m benchmarks.memory_benchmark [copies] [instances]
+"""
+
+import logging
+import sys
+import tracemalloc
+
+import slpyser
+from benchmarks._synthetic import synthetic_nugget
+from slpyser.model.abap_objects.AbapObject import AbapObject
+
+
+def slot_names(cls):
+    """
+    Attribute names of the slots of a class and its bases, as stored on instances.
+    """
+    names = []
+    for base in cls.__mro__:
+        for slot in base.__dict__.get('__slots__', ()):
+            if slot.startswith('__') and not slot.endswith('__'):
+                slot = '_%s%s' % (base.__name__.lstrip('_'), slot)
+            names.append(slot)
+    return names
+
+
+def collect_objects(nugget):
+    """
+    Model objects reachable from a parsed file, grouped by class.
+    """
+    objects = {}
+    seen = set()
+    pending = [nugget.classes, nugget.function_groups, nugget.programs, nugget.message_classes,
+               nugget.data_dictionary]
+    while pending:
+        current = pending.pop()
+        if id(current) in seen:
+            continue
+        seen.add(id(current))
+        if isinstance(current, dict):
+            pending.extend(current.values())
+        elif isinstance(current, (list, tuple)):
+            pending.extend(current)
+        elif isinstance(current, AbapObject) or type(current).__module__.startswith('slpyser.model'):
+            objects.setdefault(type(current), []).append(current)
+            pending.extend(getattr(current, name) for name in slot_names(type(current))
+                           if hasattr(current, name))
+    return objects
+
+
+def allocated_per_instance(factory, instances):
+    """
+    Bytes allocated by each object built by a factory.
+    """
+    built = [None] * instances
+    tracemalloc.start()
+    start = tracemalloc.get_traced_memory()[0]
+    for index in range(instances):
+        built[index] = factory()
+    allocated = tracemalloc.get_traced_memory()[0] - start
+    tracemalloc.stop()
+    return allocated / instances
+
+
+def measure(cls, sample, instances):
+    """
+    Bytes per instance of a slotted model class and of its equivalent with ``__dict__``.
+    """
+    state = [(name, getattr(sample, name)) for name in slot_names(cls) if hasattr(sample, name)]
+    dict_class = type(cls.__name__, (object,), {})
+
+    def build_slotted():
+        obj = cls.__new__(cls)
+        for name, value in state:
+            setattr(obj, name, value)
+        return obj
+
+    def build_with_dict():
+        obj = dict_class()
+        for name, value in state:
+            setattr(obj, name, value)
+        return obj
+
+    return allocated_per_instance(build_with_dict, instances), allocated_per_instance(build_slotted, instances)
+
+
+def main(copies=200, instances=10000):
+    logging.disable(logging.WARNING)
+    nugget = slpyser.parse_bytes(synthetic_nugget(copies=copies).encode('utf-8'))
+    objects = collect_objects(nugget)
+    print('Synthetic nugget with %d copies: %d model objects' % (copies, sum(map(len, objects.values()))))
+    print('%-28s %9s %10s %10s %12s' % ('class', 'objects', '__dict__', '__slots__', 'saved'))
+    total_dict = total_slots = 0
+    for cls, instances_of_class in sorted(objects.items(), key=lambda item: -len(item[1])):
+        with_dict, slotted = measure(cls, instances_of_class[0], instances)
+        count = len(instances_of_class)
+        total_dict += with_dict * count
+        total_slots += slotted * count
+        print('%-28s %9d %8.0f B %8.0f B %10.0f kB' % (cls.__name__, count, with_dict, slotted,
+                                                       (with_dict - slotted) * count / 1024))
+    print('%-28s %9s %8.0f kB %7.0f kB %10.0f kB' % ('total', '', total_dict / 1024, total_slots / 1024,
+                                                      (total_dict - total_slots) / 1024))
+
+if __name__ == '__main__':
+    main(*[int(argument) for argument in sys.argv[1:]])
@@ -1,19 +1,27 @@
 # https://docs.python.org/3/distutils/setupscript.html
+import re
+
 from setuptools import setup
 
 name = 'slpyser'
 description = 'Python 3 Library to parse SAPLink generated files, transforming it into objects.'
-version = '0.0.1'
+# Single source of the version is the package itself, read without importing it.
+with open('slpyser/__init__.py') as init_file:
+    version = re.search(r"^__version__ = '([^']+)'", init_file.read(), re.MULTILINE).group(1)
 author = 'ThalesVB'
 author_email = 'thalesvb@live.com'
 url = 'http://www.github.com/thalesvb'
 packages = [
     'slpyser',
+    'slpyser.cache',
     'slpyser.interface',
     'slpyser.model',
     'slpyser.model.abap_objects',
     'slpyser.model.saplink',
-    'slpyser.xmlparser'
+    'slpyser.storage',
+    'slpyser.xmlparser',
+    'slpyser.xmlparser.backend',
+    'slpyser.xmlparser.handler',
 ]
 
 
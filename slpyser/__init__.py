@@ -1,2 +1,8 @@
+__version__ = '0.0.1'
+
 # Make parse function available in the slpyser namespace
-from slpyser.interface.ParserInterface import parse
+from slpyser.interface.ParserInterface import parse, parse_bytes, parse_stream, parse_archive, \
+    iterparse, load_snapshot
+from slpyser.interface.BatchInterface import parse_many, parse_parallel
+from slpyser.interface.AsyncInterface import aparse, aiterparse
+from slpyser.interface.IncrementalInterface import reparse
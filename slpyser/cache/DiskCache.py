@@ -0,0 +1,242 @@
+# -*- coding: utf-8 -*-
+"""
+Persistent cache of parsed files, shared by processes through a directory.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+
+from slpyser.interface.ParserOptions import canonical_options
+from slpyser.model.saplink.SapLinkFile import NuggetFile
+from slpyser.storage.Snapshot import Snapshot
+
+
+class DiskCache(object):
+    """
+    Stores parsed files on a directory, keyed by the hash of the file contents and the parse
+    options, so a file is parsed once while it doesn't change.
+
+    Fingerprints of files are remembered by path, size and modification time, so unchanged
+    files don't need to be hashed again; when those change (e.g. a fresh checkout) the contents
+    are hashed, finding the same entry if they're the same.
+
+    Entries are written to temporary files and atomically renamed, so many processes can use the
+    same directory: readers never see partial entries and concurrent writers just replace each
+    other. Entries of other library versions are never read, and least recently used entries are
+    evicted once the directory grows over :attr:`max_size`.
+
+    Entries are :class:`~slpyser.storage.Snapshot.Snapshot` files, which only rebuild model
+    classes but are still read with :mod:`marshal`: the directory must only be writable by
+    trusted processes. Source code kept compressed or in an arena is loaded back as text.
+    """
+
+    FORMAT_VERSION = 2
+    """Version of the layout of cache entries, changed when it becomes incompatible."""
+
+    DEFAULT_MAX_SIZE = 1024 * 1024 * 1024
+    """Default limit of the cache directory size, in bytes."""
+
+    __HASH_CHUNK_SIZE = 1024 * 1024
+    __RACY_INTERVAL_NS = 2 * 1000 * 1000 * 1000
+    __ENTRY_SUFFIX = '.entry'
+    __INDEX_SUFFIX = '.index'
+
+    def __init__(self, Directory, MaxSize=DEFAULT_MAX_SIZE):
+        """
+        :param Directory: cache directory, created if needed.
+        :param MaxSize: limit of the cache directory size, in bytes.
+        """
+        self.__logger = logging.getLogger(__name__)
+        self.__directory = Directory
+        self.__max_size = MaxSize
+        # Estimated size of the directory, so it's only walked when unknown or over the limit.
+        self.__size = None
+        os.makedirs(Directory, exist_ok=True)
+
+    @property
+    def directory(self):
+        return self.__directory
+
+    @property
+    def max_size(self):
+        return self.__max_size
+
+    @staticmethod
+    def options_key(Options):
+        """
+        Part of the key of cache entries describing parse options, or None when they can't be
+        cached, see :func:`~slpyser.interface.ParserOptions.canonical_options`.
+        """
+        return canonical_options(Options)
+
+    def load(self, FilePath, Options):
+        """
+        Parsed file from cache, or None when it's not cached.
+        """
+        options_key = self.options_key(Options)
+        if options_key is None:
+            return None
+        entry_path = self.__entry_path(self.fingerprint(FilePath), options_key)
+        try:
+            with Snapshot(entry_path) as snapshot:
+                nugget = snapshot.load_nugget()
+            # Refreshes entry's position for eviction.
+            os.utime(entry_path)
+        except FileNotFoundError:
+            return None
+        except Exception as error:
+            self.__logger.warning('Discarding unreadable cache entry %s: %s', entry_path, error)
+            self.__remove(entry_path)
+            return None
+        return self.__relocate(nugget, FilePath)
+
+    def store(self, FilePath, Options, Nugget):
+        """
+        Stores a parsed file, if its options can be cached.
+        """
+        options_key = self.options_key(Options)
+        if options_key is None:
+            return
+        entry_path = self.__entry_path(self.fingerprint(FilePath), options_key)
+        Snapshot.write(entry_path, Nugget)
+        try:
+            self.__grow(os.path.getsize(entry_path))
+        except FileNotFoundError:
+            # Already evicted by another process.
+            pass
+
+    def fingerprint(self, FilePath):
+        """
+        Hash of file contents, reusing the one computed before while file's size and
+        modification time don't change.
+
+        A fingerprint taken right after the file was modified isn't reused, as another change
+        in the same instant wouldn't be noticed by its modification time.
+        """
+        stat = os.stat(FilePath)
+        signature = [stat.st_size, stat.st_mtime_ns]
+        absolute_path = os.path.abspath(FilePath)
+        index_path = os.path.join(self.__version_directory(),
+                                  hashlib.sha256(absolute_path.encode('utf-8', 'surrogateescape')).hexdigest()
+                                  + self.__INDEX_SUFFIX)
+        try:
+            with open(index_path, 'r') as index:
+                indexed = json.load(index)
+            if indexed['signature'] == signature and indexed['path'] == absolute_path \
+                    and stat.st_mtime_ns < indexed['indexed_at'] - self.__RACY_INTERVAL_NS:
+                return indexed['hash']
+        except (OSError, ValueError, KeyError):
+            pass
+
+        indexed_at = time.time_ns()
+        content_hash = hashlib.sha256()
+        with open(FilePath, 'rb') as stream:
+            for chunk in iter(lambda: stream.read(self.__HASH_CHUNK_SIZE), b''):
+                content_hash.update(chunk)
+        content_hash = content_hash.hexdigest()
+        index = json.dumps({'path': absolute_path,
+                            'signature': signature,
+                            'indexed_at': indexed_at,
+                            'hash': content_hash}).encode('utf-8')
+        self.__write(index_path, index)
+        self.__grow(len(index))
+        return content_hash
+
+    def evict(self):
+        """
+        Removes least recently used entries (of any version) until the cache directory is
+        under :attr:`max_size`, leaving some room for new entries.
+        """
+        files = []
+        total_size = 0
+        for directory, _, file_names in os.walk(self.__directory):
+            for file_name in file_names:
+                if file_name.endswith('.tmp'):
+                    # Being written by another process.
+                    continue
+                file_path = os.path.join(directory, file_name)
+                try:
+                    stat = os.stat(file_path)
+                except FileNotFoundError:
+                    continue
+                files.append((stat.st_mtime_ns, stat.st_size, file_path))
+                total_size += stat.st_size
+        if total_size > self.__max_size:
+            target_size = self.__max_size * 0.9
+            for _, size, file_path in sorted(files):
+                if total_size <= target_size:
+                    break
+                self.__remove(file_path)
+                total_size -= size
+        self.__size = total_size
+
+    def clear(self):
+        """
+        Removes all entries.
+        """
+        for directory, _, file_names in os.walk(self.__directory):
+            for file_name in file_names:
+                self.__remove(os.path.join(directory, file_name))
+        self.__size = None
+
+    def __grow(self, size):
+        """
+        Accounts for a written file, evicting entries once the directory may be over the limit.
+        Files written by other processes are only noticed when the directory is walked.
+        """
+        if self.__size is None or self.__size + size > self.__max_size:
+            self.evict()
+        else:
+            self.__size += size
+
+    def __version_directory(self):
+        # Imported here, as the package imports the cache while it's initialized.
+        import slpyser
+        directory = os.path.join(self.__directory, 'v%d-%s' % (self.FORMAT_VERSION, slpyser.__version__))
+        os.makedirs(directory, exist_ok=True)
+        return directory
+
+    def __entry_path(self, content_hash, options_key):
+        key = hashlib.sha256((content_hash + options_key).encode('utf-8')).hexdigest()
+        return os.path.join(self.__version_directory(), key + self.__ENTRY_SUFFIX)
+
+    @staticmethod
+    def __write(file_path, data):
+        """
+        Writes a file atomically.
+        """
+        handle, temp_path = tempfile.mkstemp(dir=os.path.dirname(file_path), suffix='.tmp')
+        try:
+            with os.fdopen(handle, 'wb') as temp_file:
+                temp_file.write(data)
+            os.replace(temp_path, file_path)
+        except BaseException:
+            DiskCache.__remove(temp_path)
+            raise
+
+    @staticmethod
+    def __remove(file_path):
+        try:
+            os.remove(file_path)
+        except FileNotFoundError:
+            pass
+
+    @staticmethod
+    def __relocate(nugget, FilePath):
+        """
+        Same parsed file at its current path, as the cached one may come from a copy.
+        """
+        return NuggetFile(FilePath=FilePath,
+                          ArchiveMember=nugget.archive_member,
+                          AbapClasses=nugget.classes,
+                          AbapFunctionGroups=nugget.function_groups,
+                          AbapPrograms=nugget.programs,
+                          AbapMessageClasses=nugget.message_classes,
+                          DataDictionary=nugget.data_dictionary,
+                          Encoding=nugget.encoding,
+                          ParseReport=nugget.parse_report,
+                          Fingerprints=nugget.fingerprints)
@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+"""
+In-memory cache of parsed files, for long running processes.
+"""
+
+import collections
+import os
+import sys
+import threading
+
+from slpyser.cache.DiskCache import DiskCache
+
+
+class ParseCache(object):
+    """
+    Keeps the most recently used parsed files in memory, bounded by an estimate of their size
+    and by their amount, evicting the least recently used ones.
+
+    A cached file is returned while the file's size and modification time don't change. The same
+    :class:`~slpyser.model.saplink.SapLinkFile.NuggetFile` object is returned to every caller, so
+    it shouldn't be changed. It can be shared by threads.
+    """
+
+    def __init__(self, max_bytes=None, max_entries=None):
+        """
+        :param max_bytes: limit of the estimated memory used by cached files, unbounded if not
+            informed.
+        :param max_entries: limit of cached files, unbounded if not informed.
+        """
+        self.__max_bytes = max_bytes
+        self.__max_entries = max_entries
+        self.__entries = collections.OrderedDict()
+        self.__size = 0
+        self.__hits = 0
+        self.__misses = 0
+        self.__evictions = 0
+        self.__lock = threading.RLock()
+
+    @property
+    def hits(self):
+        return self.__hits
+
+    @property
+    def misses(self):
+        return self.__misses
+
+    @property
+    def evictions(self):
+        """
+        Amount of files removed to make room for others.
+        """
+        return self.__evictions
+
+    @property
+    def size(self):
+        """
+        Estimated memory used by cached files, in bytes.
+        """
+        return self.__size
+
+    def __len__(self):
+        return len(self.__entries)
+
+    def load(self, FilePath, Options):
+        """
+        Parsed file from cache, or None when it's not cached or the file changed.
+        """
+        key = self.__key(FilePath, Options)
+        signature = self.__signature(FilePath) if key is not None else None
+        with self.__lock:
+            entry = self.__entries.get(key) if key is not None else None
+            if entry is None or entry[1] != signature:
+                self.__misses += 1
+                return None
+            self.__entries.move_to_end(key)
+            self.__hits += 1
+            return entry[0]
+
+    def store(self, FilePath, Options, Nugget):
+        """
+        Stores a parsed file, if its options can be cached and it fits on cache.
+        """
+        key = self.__key(FilePath, Options)
+        if key is None:
+            return
+        signature = self.__signature(FilePath)
+        size = self.estimate_size(Nugget)
+        with self.__lock:
+            self.__discard(key)
+            if self.__max_bytes is not None and size > self.__max_bytes:
+                return
+            self.__entries[key] = (Nugget, signature, size)
+            self.__size += size
+            while self.__entries and (
+                    (self.__max_bytes is not None and self.__size > self.__max_bytes)
+                    or (self.__max_entries is not None and len(self.__entries) > self.__max_entries)):
+                _, (_, _, evicted_size) = self.__entries.popitem(last=False)
+                self.__size -= evicted_size
+                self.__evictions += 1
+
+    def clear(self):
+        """
+        Removes all files, keeping the counters.
+        """
+        with self.__lock:
+            self.__entries.clear()
+            self.__size = 0
+
+    def __discard(self, key):
+        entry = self.__entries.pop(key, None)
+        if entry is not None:
+            self.__size -= entry[2]
+
+    @staticmethod
+    def __key(FilePath, Options):
+        options_key = DiskCache.options_key(Options)
+        if options_key is None:
+            return None
+        return (os.path.abspath(FilePath), options_key)
+
+    @staticmethod
+    def __signature(FilePath):
+        stat = os.stat(FilePath)
+        return (stat.st_size, stat.st_mtime_ns, stat.st_ino)
+
+    @staticmethod
+    def estimate_size(obj):
+        """
+        Estimated memory used by an object and everything it refers to (model objects,
+        containers and strings like source code), each object counted once.
+        """
+        seen = set()
+        pending = [obj]
+        size = 0
+        while pending:
+            current = pending.pop()
+            if id(current) in seen or isinstance(current, type):
+                continue
+            seen.add(id(current))
+            size += sys.getsizeof(current)
+            if isinstance(current, (str, bytes, int, float, bool)) or current is None:
+                continue
+            if isinstance(current, dict):
+                pending.extend(current.keys())
+                pending.extend(current.values())
+            elif isinstance(current, (list, tuple, set, frozenset)):
+                pending.extend(current)
+            else:
+                attributes = getattr(current, '__dict__', None)
+                if attributes is not None:
+                    pending.append(attributes)
+                for cls in type(current).__mro__:
+                    slots = cls.__dict__.get('__slots__', ())
+                    for slot in (slots,) if isinstance(slots, str) else slots:
+                        if slot in ('__dict__', '__weakref__'):
+                            continue
+                        if slot.startswith('__') and not slot.endswith('__'):
+                            slot = '_%s%s' % (cls.__name__.lstrip('_'), slot)
+                        value = getattr(current, slot, None)
+                        if value is not None:
+                            pending.append(value)
+        return size
@@ -0,0 +1,5 @@
+"""
+Caches of parsed SAPLink files, so unchanged files aren't parsed again.
+"""
+from slpyser.cache.DiskCache import DiskCache
+from slpyser.cache.ParseCache import ParseCache
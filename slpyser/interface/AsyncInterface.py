@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+"""
+Parsing from asyncio code, without blocking the event loop.
+
+Parsing is CPU bound, so it runs on an executor (the loop's default thread pool unless
+another one is informed), while the coroutine awaits it.
+"""
+import asyncio
+import functools
+import os
+import threading
+
+from concurrent.futures import ProcessPoolExecutor
+
+import slpyser.xmlparser.backends as backends
+
+from slpyser.interface.ParserInterface import _ParserInterface, _parser_options
+
+
+def _parse_source(Source, Options):
+    """
+    Parses a path or the contents of a file.
+    """
+    if isinstance(Source, (str, os.PathLike)):
+        return _ParserInterface.parse_file(Source, **Options)
+    return _ParserInterface.parse_bytes(Source, **Options)
+
+
+async def aparse(source, executor=None, semaphore=None, encoding=None,
+                 backend=backends.DEFAULT_BACKEND, include_types=None, name_filter=None,
+                 sources=True, intern=False):
+    """
+    Parses a file on an executor, returning the same of :func:`slpyser.parse`.
+
+    :param source: path of the SAPLink file, or its contents (any bytes-like object).
+    :param executor: :class:`concurrent.futures.Executor` running the parse, defaults to the
+        loop's one. On a :class:`~concurrent.futures.ProcessPoolExecutor`, arguments and the
+        result must be picklable (so ``sources='lazy'`` isn't supported).
+    :param semaphore: :class:`asyncio.Semaphore` shared by callers, bounding how many files
+        are parsed at the same time.
+
+    When the awaiting task is cancelled, parsing stops at the next chunk of the file (only
+    before it starts on process pools). Other parameters are the same of :func:`slpyser.parse`.
+    """
+    loop = asyncio.get_running_loop()
+    options = _parser_options(encoding, backend, include_types, name_filter, sources, intern)
+    cancel = None
+    if not isinstance(executor, ProcessPoolExecutor):
+        cancel = options['Cancel'] = threading.Event()
+    if semaphore is not None:
+        await semaphore.acquire()
+    try:
+        return await loop.run_in_executor(executor, functools.partial(_parse_source, source, options))
+    except asyncio.CancelledError:
+        if cancel is not None:
+            cancel.set()
+        raise
+    finally:
+        if semaphore is not None:
+            semaphore.release()
+
+
+async def aiterparse(FilePath, executor=None, semaphore=None, queue_size=64, encoding=None,
+                     backend=backends.DEFAULT_BACKEND, include_types=None, name_filter=None,
+                     sources=True, intern=False):
+    """
+    Asynchronous iterator over the objects of a file, as :func:`slpyser.iterparse` yields them::
+
+        async for abap_object in slpyser.aiterparse(path):
+            ...
+
+    :param executor: thread pool (objects are handed over inside the process) running the
+        parse, defaults to the loop's one.
+    :param semaphore: :class:`asyncio.Semaphore` bounding how many files are parsed at once.
+    :param queue_size: amount of parsed objects waiting for the consumer, parsing pauses once
+        it's reached.
+
+    Parsing stops at the next chunk of the file when the iteration is left (or cancelled)
+    before the end. Other parameters are the same of :func:`slpyser.parse`.
+    """
+    if isinstance(executor, ProcessPoolExecutor):
+        raise ValueError('Objects can only be streamed from a thread pool')
+    loop = asyncio.get_running_loop()
+    queue = asyncio.Queue(queue_size)
+    options = _parser_options(encoding, backend, include_types, name_filter, sources, intern)
+    cancel = options['Cancel'] = threading.Event()
+
+    def put(item):
+        # Nobody is consuming anymore once cancelled.
+        if not cancel.is_set():
+            asyncio.run_coroutine_threadsafe(queue.put(item), loop).result()
+
+    def produce():
+        try:
+            for abap_object in _ParserInterface.iterparse_file(FilePath, **options):
+                if cancel.is_set():
+                    return
+                put((abap_object, None))
+        except Exception as error:
+            put((None, error))
+        else:
+            put((None, None))
+
+    if semaphore is not None:
+        await semaphore.acquire()
+    try:
+        producer = loop.run_in_executor(executor, produce)
+        try:
+            while True:
+                abap_object, error = await queue.get()
+                if error is not None:
+                    raise error
+                if abap_object is None:
+                    break
+                yield abap_object
+        finally:
+            cancel.set()
+            # Unblocks the producer if it's waiting for room on queue.
+            while not queue.empty():
+                queue.get_nowait()
+            await asyncio.shield(producer)
+    finally:
+        if semaphore is not None:
+            semaphore.release()
@@ -0,0 +1,236 @@
+# -*- coding: utf-8 -*-
+"""
+Parsing of many SAPLink files at once, or of a big file by parts, spread across worker
+processes.
+"""
+import logging
+import mmap
+import os
+import pickle
+import traceback
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import slpyser.xmlparser.backends as backends
+
+from slpyser.interface.ParserInterface import _ParserInterface, _parser_options
+from slpyser.model.abap_objects.AbapDictionary import AbapDictionary
+from slpyser.model.saplink.ParseFailure import ParseFailure
+from slpyser.model.saplink.ParseReport import ParseReport
+from slpyser.model.saplink.SapLinkFile import NuggetFile
+from slpyser.xmlparser.Compression import Compression
+from slpyser.xmlparser.EncodingDetector import EncodingDetector
+from slpyser.xmlparser.NuggetSplitter import NuggetSplitter
+from slpyser.xmlparser.SAPLinkContentHandle import SAPLinkContentHandle
+
+_logger = logging.getLogger(__name__)
+
+
+def _parse_files(FilePaths, Options):
+    """
+    Parses a group of files inside a worker, turning failures into :class:`ParseFailure`.
+    """
+    results = []
+    for file_path in FilePaths:
+        try:
+            results.append(_ParserInterface.parse_file(file_path, **Options))
+        except Exception as error:
+            results.append(ParseFailure(FilePath=file_path,
+                                        ErrorType=type(error).__name__,
+                                        Message=str(error),
+                                        Traceback=traceback.format_exc()))
+    return results
+
+
+def _chunk_results(future, file_paths):
+    """
+    Results of a group of files, failing all of them if its worker couldn't return them (e.g.
+    it crashed).
+    """
+    try:
+        return future.result()
+    except Exception as error:
+        return [ParseFailure(FilePath=file_path,
+                             ErrorType=type(error).__name__,
+                             Message=str(error))
+                for file_path in file_paths]
+
+
+def _file_size(file_path):
+    try:
+        return os.path.getsize(file_path)
+    except OSError:
+        # Parsing will report it.
+        return 0
+
+
+def parse_many(paths, workers=None, chunksize=1, ordered=True, encoding=None,
+               backend=backends.DEFAULT_BACKEND, include_types=None, name_filter=None, sources=True,
+               intern=False):
+    """
+    Parses many files in parallel, yielding a :class:`~slpyser.model.saplink.SapLinkFile.NuggetFile`
+    for each one, or a :class:`~slpyser.model.saplink.ParseFailure.ParseFailure` when it couldn't
+    be parsed (the remaining files are still parsed).
+
+    Files are dispatched biggest first, so a huge file doesn't start last and keep the batch
+    waiting for it alone.
+
+    :param paths: paths of SAPLink files.
+    :param workers: amount of worker processes, defaults to the amount of CPUs. With a single
+        worker, files are parsed in the calling process.
+    :param chunksize: amount of files sent at once to a worker; bigger chunks lower the
+        communication overhead of batches with many small files.
+    :param ordered: when True results are yielded in the order of ``paths``, otherwise as soon
+        as they're complete.
+
+    Other parameters are the same of :func:`slpyser.parse`, except ``sources='lazy'`` (memory
+    maps can't be sent back from workers) and ``name_filter`` which must be picklable, like a
+    shell-style pattern, when there's more than one worker.
+
+    Options are checked when called, not when the first result is requested.
+    """
+    if sources == 'lazy':
+        raise ValueError('Lazy source code isn\'t supported when parsing in worker processes')
+    if chunksize < 1:
+        raise ValueError('chunksize must be at least 1')
+    workers = workers or os.cpu_count() or 1
+    if workers > 1:
+        try:
+            pickle.dumps(name_filter)
+        except Exception as error:
+            raise TypeError('name_filter must be picklable to be sent to worker processes, like '
+                            'a shell-style pattern or a module level function (%s)' % error)
+    options = _parser_options(encoding, backend, include_types, name_filter, sources, intern)
+    return _parse_many(list(paths), workers, chunksize, ordered, options)
+
+
+def _parse_many(paths, workers, chunksize, ordered, options):
+    """
+    Generator behind :func:`parse_many`, once its options are checked.
+    """
+    if workers == 1:
+        for file_path in paths:
+            yield _parse_files([file_path], options)[0]
+        return
+
+    by_size = sorted(range(len(paths)), key=lambda index: -_file_size(paths[index]))
+    chunks = [by_size[start:start + chunksize] for start in range(0, len(by_size), chunksize)]
+    executor = ProcessPoolExecutor(max_workers=workers)
+    futures = {}
+    try:
+        for chunk in chunks:
+            future = executor.submit(_parse_files, [paths[index] for index in chunk], options)
+            futures[future] = chunk
+        if ordered:
+            results = {}
+            chunk_of_index = {index: future for future, chunk in futures.items() for index in chunk}
+            for index in range(len(paths)):
+                if index not in results:
+                    future = chunk_of_index[index]
+                    chunk = futures[future]
+                    results.update(zip(chunk, _chunk_results(future, [paths[i] for i in chunk])))
+                yield results.pop(index)
+        else:
+            for future in as_completed(futures):
+                for result in _chunk_results(future, [paths[index] for index in futures[future]]):
+                    yield result
+    finally:
+        for future in futures:
+            future.cancel()
+        executor.shutdown(wait=True)
+
+
+def _parse_fragment(FilePath, Header, Start, End, Footer, Options):
+    """
+    Parses a byte range of a nugget inside a worker, wrapped as a nugget by itself, returning
+    it as a single result like :func:`_parse_files`.
+    """
+    with open(FilePath, 'rb') as stream:
+        with mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            data = b''.join((Header, buffer[Start:End], Footer))
+    try:
+        return [_ParserInterface.parse_bytes(data, **Options)]
+    except Exception as error:
+        # Parser exceptions (like SAXParseException) can't always be sent back.
+        return [ParseFailure(FilePath=FilePath,
+                             ErrorType=type(error).__name__,
+                             Message=str(error))]
+
+
+def _merge_fragments(FilePath, Encoding, fragments):
+    """
+    Merges the files parsed from each fragment of a nugget, in file order, the same way a
+    sequential parse would have stored their objects.
+    """
+    classes, function_groups, programs, message_classes = {}, {}, {}, {}
+    domains, data_elements, structures = {}, {}, {}
+    parse_report = ParseReport()
+    for fragment in fragments:
+        classes.update(fragment.classes)
+        function_groups.update(fragment.function_groups)
+        programs.update(fragment.programs)
+        message_classes.update(fragment.message_classes)
+        domains.update(fragment.data_dictionary.domains)
+        data_elements.update(fragment.data_dictionary.data_elements)
+        structures.update(fragment.data_dictionary.structures)
+        parse_report.merge(fragment.parse_report)
+    return NuggetFile(FilePath=FilePath,
+                      AbapClasses=classes,
+                      AbapFunctionGroups=function_groups,
+                      AbapMessageClasses=message_classes,
+                      AbapPrograms=programs,
+                      DataDictionary=AbapDictionary(Domains=domains,
+                                                    DataElements=data_elements,
+                                                    Structures=structures),
+                      Encoding=Encoding,
+                      ParseReport=parse_report)
+
+
+def parse_parallel(FilePath, workers=None, encoding=None, backend=backends.DEFAULT_BACKEND,
+                   include_types=None, name_filter=None, sources=True, intern=False):
+    """
+    Parses a single big nugget using many processes, with the same result of :func:`slpyser.parse`.
+
+    The file is split at top level objects (scanning its raw bytes, not parsing them) into
+    ranges of similar size, each range is parsed by a worker and their objects are merged in
+    file order. Files which can't be split (compressed, not ASCII compatible encodings, not a
+    nugget or with a split position that turns out invalid) are parsed sequentially instead.
+
+    :param workers: amount of worker processes, defaults to the amount of CPUs.
+
+    Other parameters are the same of :func:`slpyser.parse`, except ``sources='lazy'`` (memory
+    maps can't be sent back from workers) and ``name_filter`` which must be picklable.
+    """
+    if sources == 'lazy':
+        raise ValueError('Lazy source code isn\'t supported when parsing in worker processes')
+    options = _parser_options(encoding, backend, include_types, name_filter, sources, intern)
+    workers = workers or os.cpu_count() or 1
+
+    ranges = []
+    with open(FilePath, 'rb') as stream:
+        head = stream.read(EncodingDetector.SNIFF_SIZE)
+        if workers > 1 and head and Compression.detect(head) is None:
+            if encoding is None:
+                encoding = EncodingDetector.detect(head)
+            encoding = EncodingDetector.normalize(encoding)
+            if EncodingDetector.is_ascii_compatible(encoding):
+                with mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                    splitter = NuggetSplitter(Buffer=buffer, ObjectTypes=SAPLinkContentHandle().objectTypes)
+                    if splitter.splittable:
+                        ranges = splitter.split(Parts=workers)
+                        header, footer = splitter.header, splitter.footer
+    if len(ranges) < 2:
+        return _ParserInterface.parse_file(FilePath, **options)
+
+    options['Encoding'] = encoding
+    with ProcessPoolExecutor(max_workers=min(workers, len(ranges))) as executor:
+        futures = [executor.submit(_parse_fragment, FilePath, header, start, end, footer, options)
+                   for start, end in ranges]
+        fragments = [_chunk_results(future, [FilePath]) for future in futures]
+    fragments = [fragment for results in fragments for fragment in results]
+    failures = [fragment for fragment in fragments if isinstance(fragment, ParseFailure)]
+    if failures:
+        _logger.info('Parsing %s by parts failed (%s: %s), parsing it sequentially.',
+                     FilePath, failures[0].error_type, failures[0].message)
+        return _ParserInterface.parse_file(FilePath, **options)
+    return _merge_fragments(FilePath, encoding, fragments)
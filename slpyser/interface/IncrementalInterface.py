@@ -0,0 +1,197 @@
+# -*- coding: utf-8 -*-
+"""
+Parsing of a SAPLink file again, rebuilding only the objects changed since a previous parse.
+"""
+import fnmatch
+import hashlib
+import logging
+import mmap
+
+import slpyser.xmlparser.backends as backends
+
+from slpyser.interface.ParserInterface import _ParserInterface, _parser_options
+from slpyser.interface.ParserOptions import canonical_options
+from slpyser.model.abap_objects.AbapDictionary import AbapDictionary
+from slpyser.model.saplink.ChangeReport import ChangeReport
+from slpyser.model.saplink.SapLinkFile import NuggetFile
+from slpyser.xmlparser.Compression import Compression
+from slpyser.xmlparser.EncodingDetector import EncodingDetector
+from slpyser.xmlparser.NuggetSplitter import NuggetSplitter
+from slpyser.xmlparser.SAPLinkContentHandle import SAPLinkContentHandle
+
+_logger = logging.getLogger(__name__)
+
+_CONTAINERS = {
+    'CLAS': 'classes',
+    'INTF': 'classes',
+    'PROG': 'programs',
+    'FUGR': 'function_groups',
+    'MSAG': 'message_classes',
+    'DOMA': 'domains',
+    'DTEL': 'data_elements',
+    'TABL': 'structures',
+}
+"""Container of parsed objects of each object type, by tag."""
+
+
+def _containers(nugget):
+    """
+    Dictionaries of parsed objects of a file, by container name.
+    """
+    return {
+        'classes': nugget.classes,
+        'programs': nugget.programs,
+        'function_groups': nugget.function_groups,
+        'message_classes': nugget.message_classes,
+        'domains': nugget.data_dictionary.domains,
+        'data_elements': nugget.data_dictionary.data_elements,
+        'structures': nugget.data_dictionary.structures,
+    }
+
+
+def _scan_objects(Buffer, Splitter, Handle, Encoding, Options):
+    """
+    Top level objects of a nugget, as (tag, name, start, end, digest) in file order, skipping
+    the ones rejected by a name pattern. Digests depend on parse options, so objects are only
+    reused by a parse with the same options.
+    """
+    digest = hashlib.sha256(canonical_options(dict(Options, Encoding=Encoding)).encode('utf-8'))
+    name_filter = Options['NameFilter']
+    scanned = []
+    for tag, name, start, end in Splitter.objects(Handle.objectNameAttributes):
+        if name_filter is not None and not fnmatch.fnmatchcase(name or '', name_filter):
+            continue
+        object_digest = digest.copy()
+        object_digest.update(Buffer[start:end])
+        scanned.append((tag, name, start, end, object_digest.hexdigest()))
+    return scanned
+
+
+def _compare(Previous, Scanned):
+    """
+    Tells the objects which can be taken from the previous parse and reports the changes.
+    """
+    previous_fingerprints = (Previous.fingerprints if Previous is not None else None) or {}
+    previous_containers = _containers(Previous) if Previous is not None else {}
+    occurrences = {}
+    for tag, name, _, _, _ in Scanned:
+        occurrences[(tag, name)] = occurrences.get((tag, name), 0) + 1
+
+    reused = set()
+    fingerprints = {}
+    added, changed, unchanged = [], [], []
+    for tag, name, _, _, digest in Scanned:
+        key = (tag, name)
+        known = key in fingerprints
+        fingerprints[key] = digest
+        if known:
+            continue
+        if key not in previous_fingerprints:
+            added.append(key)
+        elif (previous_fingerprints[key] == digest and occurrences[key] == 1 and name is not None
+              and name in previous_containers.get(_CONTAINERS[tag], {})):
+            reused.add(key)
+            unchanged.append(key)
+        else:
+            changed.append(key)
+    removed = [key for key in previous_fingerprints if key not in fingerprints]
+    return reused, fingerprints, ChangeReport(Added=added, Changed=changed, Removed=removed,
+                                              Unchanged=unchanged)
+
+
+def _assemble(Previous, Parsed, Scanned, Reused):
+    """
+    Merges the objects taken from the previous parse with the parsed ones, in file order.
+    """
+    previous_containers = _containers(Previous) if Reused else {}
+    parsed_containers = _containers(Parsed)
+    containers = {container: {} for container in parsed_containers}
+    for tag, name, _, _, _ in Scanned:
+        container = _CONTAINERS[tag]
+        if (tag, name) in Reused:
+            containers[container][name] = previous_containers[container][name]
+        elif name in parsed_containers[container]:
+            containers[container][name] = parsed_containers[container][name]
+    # Objects whose name differs from the one found by scanning.
+    for container, parsed_objects in parsed_containers.items():
+        for name, parsed_object in parsed_objects.items():
+            containers[container].setdefault(name, parsed_object)
+    return containers
+
+
+def reparse(previous, FilePath, encoding=None, backend=backends.DEFAULT_BACKEND,
+            include_types=None, name_filter=None, sources=True, intern=False):
+    """
+    Parses a file again, running handlers only on the objects changed since a previous parse.
+
+    The raw bytes of the file are scanned for its top level objects (``CLAS``, ``PROG``,
+    ``FUGR``, DDIC objects, ...), fingerprinting each one. Objects whose fingerprint didn't
+    change are taken from ``previous``, the others are parsed, and the changes are described by
+    :attr:`~slpyser.model.saplink.SapLinkFile.NuggetFile.change_report`. The parse report only
+    covers the parsed contents.
+
+    :param previous: file returned by an earlier call, or None to parse the whole file and get
+        the fingerprints for the next call. Files without fingerprints (e.g. returned by
+        :func:`slpyser.parse`) don't have any object reused.
+
+    Other parameters are the same of :func:`slpyser.parse`, except ``sources='lazy'``. Files
+    which can't be scanned (compressed, not ASCII compatible encodings or not a nugget) and
+    callable name filters lead to a full parse without fingerprints.
+    """
+    if sources == 'lazy':
+        raise ValueError('Lazy source code can\'t be reused by another parse')
+    options = _parser_options(encoding, backend, include_types, name_filter, sources, intern)
+    handle = SAPLinkContentHandle(IncludeTypes=include_types)
+
+    with open(FilePath, 'rb') as stream:
+        head = stream.read(EncodingDetector.SNIFF_SIZE)
+        if (head and Compression.detect(head) is None
+                and canonical_options(options) is not None):
+            file_encoding = EncodingDetector.normalize(encoding or EncodingDetector.detect(head))
+            if EncodingDetector.is_ascii_compatible(file_encoding):
+                with mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                    splitter = NuggetSplitter(Buffer=buffer, ObjectTypes=handle.objectTypes)
+                    if splitter.splittable:
+                        return _reparse_nugget(previous, FilePath, buffer, splitter, handle,
+                                               file_encoding, options)
+    return _ParserInterface.parse_file(FilePath, **options)
+
+
+def _reparse_nugget(Previous, FilePath, Buffer, Splitter, Handle, Encoding, Options):
+    """
+    Parses the changed objects of a nugget, with the parts of it which aren't objects.
+    """
+    scanned = _scan_objects(Buffer, Splitter, Handle, Encoding, Options)
+    reused, fingerprints, change_report = _compare(Previous, scanned)
+
+    parts = [Splitter.header]
+    position = len(Splitter.header)
+    for tag, name, start, end, _ in scanned:
+        parts.append(Buffer[position:start])
+        if (tag, name) not in reused:
+            parts.append(Buffer[start:end])
+        position = end
+    parts.append(Buffer[position:len(Buffer) - len(Splitter.footer)])
+    parts.append(Splitter.footer)
+    try:
+        parsed = _ParserInterface.parse_bytes(b''.join(parts), **dict(Options, Encoding=Encoding))
+    except Exception as error:
+        _logger.info('Parsing changed objects of %s failed (%s: %s), parsing it as a whole.',
+                     FilePath, type(error).__name__, error)
+        parsed = _ParserInterface.parse_bytes(Buffer[:], **dict(Options, Encoding=Encoding))
+        reused = set()
+    _logger.debug('%s: %r', FilePath, change_report)
+
+    containers = _assemble(Previous, parsed, scanned, reused)
+    return NuggetFile(FilePath=FilePath,
+                      AbapClasses=containers['classes'],
+                      AbapFunctionGroups=containers['function_groups'],
+                      AbapMessageClasses=containers['message_classes'],
+                      AbapPrograms=containers['programs'],
+                      DataDictionary=AbapDictionary(Domains=containers['domains'],
+                                                    DataElements=containers['data_elements'],
+                                                    Structures=containers['structures']),
+                      Encoding=Encoding,
+                      ParseReport=parsed.parse_report,
+                      Fingerprints=fingerprints,
+                      ChangeReport=change_report)
@@ -3,30 +3,202 @@ Created on 17/06/2015
 
 @author: thales
 '''
+import zipfile
+
+import slpyser.xmlparser.backends as backends
+
+from slpyser.cache.DiskCache import DiskCache
 from slpyser.model.saplink.SapLinkFile import NuggetFile
+from slpyser.storage.Snapshot import Snapshot
 from slpyser.xmlparser.SapLinkFileParser import SapLinkFileParser
 
 
 class _ParserInterface:
     """
     Handle SAPLink file type, parsing it and returning it's respective object.
+
+    Options are the keyword arguments of :class:`~slpyser.xmlparser.SapLinkFileParser.SapLinkFileParser`.
     """
 
     @staticmethod
-    def parse_file(FilePath):
-        parser = SapLinkFileParser(FilePath=FilePath)
+    def parse_file(FilePath, **Options):
+        parser = SapLinkFileParser(FilePath=FilePath, **Options)
+        return _ParserInterface.__build_file(parser, FilePath)
+
+    @staticmethod
+    def parse_cached(FilePath, Cache, **Options):
+        file = Cache.load(FilePath, Options)
+        if file is None:
+            file = _ParserInterface.parse_file(FilePath, **Options)
+            Cache.store(FilePath, Options, file)
+        return file
+
+    @staticmethod
+    def parse_bytes(Data, **Options):
+        parser = SapLinkFileParser(Data=Data, **Options)
+        return _ParserInterface.__build_file(parser, None)
+
+    @staticmethod
+    def parse_stream(Stream, **Options):
+        parser = SapLinkFileParser(Stream=Stream, **Options)
+        file_path = getattr(Stream, 'name', None)
+        return _ParserInterface.__build_file(parser, file_path if isinstance(file_path, str) else None)
+
+    @staticmethod
+    def parse_archive(FilePath, **Options):
+        with zipfile.ZipFile(FilePath) as zip_file:
+            file_path = FilePath if isinstance(FilePath, str) else getattr(FilePath, 'name', None)
+            for member in zip_file.infolist():
+                if member.filename.endswith('/'):
+                    continue
+                with zip_file.open(member) as stream:
+                    parser = SapLinkFileParser(Stream=stream, **Options)
+                yield _ParserInterface.__build_file(parser, file_path, member.filename)
 
+    @staticmethod
+    def iterparse_file(FilePath, **Options):
+        parser = SapLinkFileParser(FilePath=FilePath, Streaming=True, **Options)
+        return parser.iterObjects()
+
+    @staticmethod
+    def __build_file(parser, FilePath, ArchiveMember=None):
         file = NuggetFile(FilePath=FilePath,
+                          ArchiveMember=ArchiveMember or parser.getArchiveMember(),
                           AbapClasses=parser.getClasses(),
                           AbapFunctionGroups=parser.getFunctionGroups(),
                           AbapMessageClasses=parser.getMessageClasses(),
                           AbapPrograms=parser.getPrograms(),
-                          DataDictionary=parser.getAbapDictionary())
+                          DataDictionary=parser.getAbapDictionary(),
+                          Encoding=parser.getEncoding(),
+                          ParseReport=parser.getParseReport(),
+                          MappedFile=parser.getMappedFile())
         return file
 
 
-def parse(FilePath):
+def _parser_options(encoding, backend, include_types, name_filter, sources, intern):
+    """
+    Maps the keyword arguments of public functions to parser's options.
+    """
+    return {
+        'Encoding': encoding,
+        'Backend': backend,
+        'IncludeTypes': include_types,
+        'NameFilter': name_filter,
+        'Sources': sources,
+        'Intern': intern,
+    }
+
+
+def parse(FilePath, encoding=None, backend=backends.DEFAULT_BACKEND, include_types=None,
+          name_filter=None, sources=True, intern=False, cache_dir=None, cache=None):
     """
     All parsing using the library should use this function to parse file
+
+    :param FilePath: path of the SAPLink file. Files compressed with gzip, bz2 or xz are
+        decompressed on the fly, as well as a zip archive holding a single file.
+    :param encoding: encoding used to decode the file. When not informed, it's detected from
+        the first bytes of the file (byte order mark, XML declaration and byte patterns).
+    :param backend: XML parser backend: 'sax' (default, standard xml.sax interface),
+        'expat' (drives pyexpat directly, with less overhead per element) or 'lxml' (C speed
+        tokenizing with bounded memory, falls back to default backend if lxml isn't installed).
+    :param include_types: object types to be parsed, e.g. ``{'CLAS', 'INTF'}``. Other objects
+        are skipped as a whole, without running their handlers nor accumulating their text.
+    :param name_filter: only objects whose name is accepted are parsed: either a callable
+        receiving the object name or a shell-style pattern such as ``'ZCL_*'``.
+    :param sources: when False, source code text is never built: only its length and line
+        count are recorded on each :class:`~slpyser.model.abap_objects.AbapSourceCode.AbapSourceCode`
+        (metadata only parsing, e.g. for signature catalogues). With ``'lazy'``, only the
+        position of source code is recorded, and it's read from the memory mapped file when
+        first accessed (``sax`` and ``expat`` backends, ASCII compatible encodings); the map is
+        closed by :meth:`~slpyser.model.saplink.SapLinkFile.NuggetFile.close` or by leaving a
+        ``with`` block on the returned file. With
+        ``'arena'``, the text of all source code is kept in a single UTF-8 buffer, and each
+        source code decodes its part when accessed (or hands it without copies through
+        :meth:`~slpyser.model.abap_objects.AbapSourceCode.AbapSourceCode.source_buffer`).
+        With ``'compressed'``, each source code is compressed (lz4 when installed, zlib
+        otherwise) and decompressed on access, keeping the most recently used ones.
+    :param intern: when True, attribute values (names, types, exposures, languages, ...) are
+        interned on a table of the parse, so repeated ones share a single string; with
+        ``'global'`` they're shared by all parses of the process. Amounts of interned and
+        distinct values are kept by ``parse_report``.
+    :param cache_dir: directory of a :class:`~slpyser.cache.DiskCache.DiskCache`, where the
+        parsed file is stored and loaded from while the file doesn't change. It can be shared by
+        many processes. Lazy source code and callable name filters aren't cached.
+    :param cache: cache object, like a :class:`slpyser.cache.ParseCache` shared by
+        the threads of a long running process, used instead of ``cache_dir``.
+    """
+    options = _parser_options(encoding, backend, include_types, name_filter, sources, intern)
+    if cache is None and cache_dir is not None:
+        cache = DiskCache(cache_dir)
+    if cache is not None:
+        return _ParserInterface.parse_cached(FilePath, cache, **options)
+    return _ParserInterface.parse_file(FilePath, **options)
+
+
+def parse_bytes(data, encoding=None, backend=backends.DEFAULT_BACKEND, include_types=None,
+                name_filter=None, sources=True, intern=False):
+    """
+    Parses a SAPLink file already in memory, without writing it to disk.
+
+    :param data: file contents as bytes or any object exposing the buffer protocol, such as
+        :class:`mmap.mmap`. It's fed into the XML parser in chunks without being copied, and
+        source code parsed with ``sources='lazy'`` is read from it later, so it must not be
+        changed or closed while parsed objects are in use.
+
+    Other parameters are the same of :func:`parse`. The returned file has no ``file_path``.
+    """
+    return _ParserInterface.parse_bytes(data, **_parser_options(encoding, backend, include_types,
+                                                                name_filter, sources, intern))
+
+
+def parse_stream(fileobj, encoding=None, backend=backends.DEFAULT_BACKEND, include_types=None,
+                 name_filter=None, sources=True, intern=False):
+    """
+    Parses a SAPLink file read in chunks from a binary file-like object (anything with a
+    ``read(size)`` method returning bytes, such as sockets' files or HTTP responses).
+
+    Other parameters are the same of :func:`parse`, except ``sources='lazy'`` which keeps
+    source code in memory, as a stream can't be read again.
+    """
+    return _ParserInterface.parse_stream(fileobj, **_parser_options(encoding, backend, include_types,
+                                                                    name_filter, sources, intern))
+
+
+def parse_archive(FilePath, encoding=None, backend=backends.DEFAULT_BACKEND, include_types=None,
+                  name_filter=None, sources=True, intern=False):
+    """
+    Parses each file inside a zip archive, yielding one :class:`~slpyser.model.saplink.SapLinkFile.NuggetFile`
+    per file (with its name at ``archive_member``) as soon as it's parsed. Files are
+    decompressed straight into the parser, without being extracted to disk.
+
+    :param FilePath: path of the zip archive, or a seekable binary file object.
+
+    Other parameters are the same of :func:`parse`, except ``sources='lazy'`` which keeps
+    source code in memory, as files inside archives can't be memory mapped.
+    """
+    return _ParserInterface.parse_archive(FilePath, **_parser_options(encoding, backend, include_types,
+                                                                      name_filter, sources, intern))
+
+
+def iterparse(FilePath, encoding=None, backend=backends.DEFAULT_BACKEND, include_types=None,
+              name_filter=None, sources=True, intern=False):
+    """
+    Parses a file yielding each object (class, interface, program, function group, message
+    class, domain, data element and structure) as soon as its parsing is complete.
+
+    Objects aren't kept by the parser after being yielded, so memory usage is bounded by the
+    biggest object instead of the whole file. Parameters are the same of :func:`parse`.
+    """
+    return _ParserInterface.iterparse_file(FilePath, **_parser_options(encoding, backend, include_types,
+                                                                       name_filter, sources, intern))
+
+
+def load_snapshot(FilePath):
+    """
+    Loads a file saved by :meth:`~slpyser.model.saplink.SapLinkFile.NuggetFile.save_snapshot`.
+    Use :class:`~slpyser.storage.Snapshot.Snapshot` to load single objects of it.
+
+    :raise ValueError: not a snapshot, or written by another library version.
     """
-    return _ParserInterface.parse_file(FilePath)
+    with Snapshot(FilePath) as snapshot:
+        return snapshot.load_nugget()
@@ -0,0 +1,23 @@
+# -*- coding: utf-8 -*-
+"""
+Canonical form of parser options, shared by everything keeping results of a parse for later
+(caches, fingerprints of objects).
+"""
+
+
+def canonical_options(Options):
+    """
+    Canonical description of parse options affecting the result, or None when they can't be
+    described (e.g. a callable name filter or lazy source code), so results parsed with them
+    can't be reused by another parse.
+
+    :param Options: parser's options, as built by the public functions.
+    """
+    name_filter = Options.get('NameFilter')
+    if Options.get('Sources') == 'lazy' or (name_filter is not None and not isinstance(name_filter, str)):
+        return None
+    include_types = Options.get('IncludeTypes')
+    if include_types is not None:
+        include_types = sorted(object_type.upper() for object_type in include_types)
+    return repr((Options.get('Encoding'), Options.get('Backend'), include_types, name_filter,
+                 Options.get('Sources', True), Options.get('Intern', False)))
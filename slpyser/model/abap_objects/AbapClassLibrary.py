@@ -22,6 +22,14 @@ class AbapClass(AbapObject):
     Representation of an ABAP class.
     """
 
+    __slots__ = (
+        '__name', '__description', '__parent_class_name', '__exposure', '__original_language',
+        '__final', '__fixed_point_arithmetic', '__unicode', '__author', '__created_on',
+        '__changed_by', '__changed_on', '__public_section', '__protected_section',
+        '__private_section', '__local_implementation', '__local_macros', '__local_types',
+        '__attributes', '__methods', '__redefined_methods', '__text_pool'
+    )
+
     def __init__(self,
                  Name,
                  Author,
@@ -264,13 +272,19 @@ class AbapClassInterface(AbapClass):
     SAPLink representation is almost like a class, so this is a first
     hackish version for class interface.
     """
-    pass
+
+    __slots__ = ()
 
 class AbapClassAttribute(AbapObject):
     """
     Atribute of a class.
     """
 
+    __slots__ = (
+        '__comp_ref_name', '__name', '__decl_type', '__typ_type', '__exposure', '__type',
+        '__description'
+    )
+
     def __init__(self,
                  ClassName,
                  AttributeName,
@@ -341,6 +355,8 @@ class AbapClassMethodParameter(AbapObject):
     Class representing a parameter of an ABAP method from an ABAP class.
     """
 
+    __slots__ = ('__name', '__declaration_type', '__pass_type', '__typ_type', '__type')
+
     def __init__(self,
                  Name,
                  DeclType,
@@ -384,6 +400,11 @@ class AbapClassMethod(AbapObject):
     Representation of a method from an ABAP class.
     """
 
+    __slots__ = (
+        '__name', '__definition_class_name', '__decl_type', '__exposure', '__description',
+        '__parameters', '__source_code'
+    )
+
     def __init__(self,
                  Name,
                  DefinitionClassName,
@@ -464,4 +485,5 @@ class AbapClassMethod(AbapObject):
 
 class AbapInterfaceMethod(AbapClassMethod):
     """Representation of a method declared/inherited from an interface."""
-    pass
+
+    __slots__ = ()
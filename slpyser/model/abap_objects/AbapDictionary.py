@@ -19,6 +19,9 @@ class AbapDictionary:
     """
     Container for elements from ABAP Dictionary (SE11).
     """
+
+    __slots__ = ('__domains', '__data_elements', '__structures')
+
     def __init__(self,
                  Domains,
                  DataElements,
@@ -64,6 +67,13 @@ class AbapDataElement(AbapObject):
     Tag DTEL subtag DD04V
     """
 
+    __slots__ = (
+        '__name', '__original_language', '__description', '__domain_used', '__data_type',
+        '__label_short', '__label_short_length', '__label_medium', '__label_medium_length',
+        '__label_long', '__label_long_length', '__label_heading', '__label_heading_length',
+        '__length', '__output_length', '__lower_case', '__decimals', '__ref_kind', '__ref_type'
+    )
+
     def __init__(self,
                  Name,
                  OriginalLanguage,
@@ -105,12 +115,93 @@ class AbapDataElement(AbapObject):
         self.__ref_kind = RefKind
         self.__ref_type = RefType
 
+    @property
+    def name(self):
+        return self.__name
+
+    @property
+    def original_language(self):
+        return self.__original_language
+
+    @property
+    def description(self):
+        return self.__description
+
+    @property
+    def domain_used(self):
+        return self.__domain_used
+
+    @property
+    def data_type(self):
+        return self.__data_type
+
+    @property
+    def label_short(self):
+        return self.__label_short
+
+    @property
+    def label_short_length(self):
+        return self.__label_short_length
+
+    @property
+    def label_medium(self):
+        return self.__label_medium
+
+    @property
+    def label_medium_length(self):
+        return self.__label_medium_length
+
+    @property
+    def label_long(self):
+        return self.__label_long
+
+    @property
+    def label_long_length(self):
+        return self.__label_long_length
+
+    @property
+    def label_heading(self):
+        return self.__label_heading
+
+    @property
+    def label_heading_length(self):
+        return self.__label_heading_length
+
+    @property
+    def length(self):
+        return self.__length
+
+    @property
+    def output_length(self):
+        return self.__output_length
+
+    @property
+    def lower_case(self):
+        return self.__lower_case
+
+    @property
+    def decimals(self):
+        return self.__decimals
+
+    @property
+    def ref_kind(self):
+        return self.__ref_kind
+
+    @property
+    def ref_type(self):
+        return self.__ref_type
+
 
 class AbapDomain(AbapObject):
     """
     Tag DOMA subtag DD01V
     """
 
+    __slots__ = (
+        '__name', '__original_language', '__description', '__data_type', '__length',
+        '__output_length', '__decimals', '__lower_case', '__mask_length'
+    )
+
     def __init__(self,
                  Name,
                  OriginalLanguage,
@@ -177,6 +268,8 @@ class AbapTypeStructure(AbapObject):
     Tag TABL
     """
 
+    __slots__ = ('__name', '__original_language', '__description', '__fields')
+
     def __init__(self,
                  Name,
                  OriginalLanguage,
@@ -212,6 +305,8 @@ class AbapTypeStructure(AbapObject):
         Tag DD03P
         """
 
+        __slots__ = ('__name', '__position', '__data_type')
+
         def __init__(self,
                      Name,
                      Position,
@@ -242,6 +337,8 @@ class AbapTypeTableType(AbapObject):
     Tag TTYP
     """
 
+    __slots__ = ('__name', '__original_language', '__description', '__row_type', '__row_kind')
+
     def __init__(self,
                  Name,
                  OriginalLanguage,
@@ -12,6 +12,10 @@ class AbapFunctionGroup(AbapObject):
     Representation of an ABAP Function Group.
     """
 
+    __slots__ = (
+        '__name', '__description', '__language', '__include_programs', '__function_modules'
+    )
+
     def __init__(self,
                  Name,
                  Description,
@@ -64,6 +68,9 @@ class AbapFunctionGroupMainProgram(AbapObject):
     """
     Main program of the function group.
     """
+
+    __slots__ = ('__name', '__source')
+
     def __init__(self,
                  Name):
         super(AbapFunctionGroupMainProgram, self).__init__()
@@ -84,6 +91,12 @@ class AbapFunctionModule(AbapObject):
     Representation of an ABAP Function Module.
     """
 
+    __slots__ = (
+        '__function_group', '__name', '__description', '__parameters_importing',
+        '__parameters_exporting', '__parameters_changing', '__parameters_tables', '__exceptions',
+        '__source_code'
+    )
+
     def __init__(self,
                  FunctionGroup,
                  Name,
@@ -139,6 +152,8 @@ class AbapFunctionModule(AbapObject):
 
     class AbapFunctionModuleParameter(AbapObject):
 
+        __slots__ = ('__name', '__is_reference', '__is_optional', '__type', '__default_value')
+
         def __init__(self,
                      Parameter,
                      IsReference,
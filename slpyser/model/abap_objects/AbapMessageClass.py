@@ -11,6 +11,10 @@ class AbapMessageClass(AbapObject):
     Representation of a Message Class.
     """
 
+    __slots__ = (
+        '__name', '__original_language', '__responsible', '__short_text', '__map_language_message'
+    )
+
     def __init__(self,
                  Name,
                  OriginalLanguage,
@@ -49,6 +53,8 @@ class AbapMessageClass(AbapObject):
 
     class Message(AbapObject):
 
+        __slots__ = ('__language', '__number', '__text')
+
         def __init__(self,
                      Language,
                      Number,
@@ -8,6 +8,8 @@ class AbapObject:
     Root class for every repository object parsed from SAPLink.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         """
         Constructor
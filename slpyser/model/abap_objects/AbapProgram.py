@@ -12,6 +12,11 @@ class AbapProgram(AbapObject):
     Representation of an ABAP program.
     """
 
+    __slots__ = (
+        '__name', '__created_by', '__created_on', '__changed_by', '__changed_on', '__type',
+        '__status', '__text_pool', '__source_code'
+    )
+
     def __init__(self,
                  Name,
                  CreatedBy,
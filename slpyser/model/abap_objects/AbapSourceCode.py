@@ -13,12 +13,144 @@ class AbapSourceCode(AbapObject):
     While parsing, the source code lines are stacked in an array, and when
     its tag closes, a join operation is performed on that array to create a
     string representation of source code.
+
+    When parsed without its contents (metadata only), just :attr:`length` and
+    :attr:`line_count` are known and :attr:`source_code` is None.
+
+    When parsed lazily, the source code is read from the file only when
+    :attr:`source_code` is first accessed.
+
+    When parsed into an arena or compressed, the source code is kept by a view
+    (a part of a buffer shared by the whole parse, or compressed bytes), and
+    it's decoded on each access of :attr:`source_code`.
     """
 
+    __slots__ = ('__source_code', '__length', '__line_count', '__loader', '__view')
+
     def __init__(self,
                  SourceCode=None):
         """
         Constructor
         """
         super(AbapSourceCode, self).__init__()
-        self.source_code = SourceCode
+        self.__source_code = SourceCode
+        self.__length = None
+        self.__line_count = None
+        self.__loader = None
+        self.__view = None
+
+    @property
+    def source_code(self):
+        """
+        Source code as a string, None if it wasn't kept by the parser.
+        """
+        if self.__loader is not None:
+            self.__source_code = self.__loader()
+            self.__loader = None
+        if self.__view is not None:
+            return self.__view.text()
+        return self.__source_code
+
+    @source_code.setter
+    def source_code(self, value):
+        self.__source_code = value
+        self.__length = None
+        self.__line_count = None
+        self.__loader = None
+        self.__view = None
+
+    @property
+    def length(self):
+        """
+        Amount of characters of source code.
+        """
+        if self.__view is not None:
+            return self.__view.length
+        if self.__length is None and self.source_code is not None:
+            return len(self.__source_code)
+        return self.__length
+
+    @property
+    def line_count(self):
+        """
+        Amount of lines of source code.
+        """
+        if self.__line_count is None:
+            source_code = self.source_code
+            if source_code is not None:
+                return self.count_lines(source_code)
+        return self.__line_count
+
+    def setMetadata(self, Length, LineCount):
+        """
+        Describes a source code whose contents weren't kept.
+        """
+        self.__source_code = None
+        self.__length = Length
+        self.__line_count = LineCount
+        self.__loader = None
+        self.__view = None
+
+    def setLoader(self, Loader):
+        """
+        Defers reading the source code to its first access.
+
+        :param Loader: callable returning the source code as a string.
+        """
+        self.__source_code = None
+        self.__length = None
+        self.__line_count = None
+        self.__loader = Loader
+        self.__view = None
+
+    def setView(self, View, LineCount):
+        """
+        Keeps the source code in another representation, like a part of a buffer shared with
+        other source code or compressed bytes.
+
+        :param View: object with the ``length`` of the source code in characters, and methods
+            ``text()`` decoding it and ``buffer()`` returning its UTF-8 bytes as a
+            :class:`memoryview`, like :class:`~slpyser.xmlparser.SourceCollector.ArenaSource`
+            or :class:`~slpyser.xmlparser.SourceCollector.CompressedSource`.
+        :param LineCount: amount of lines of source code, so it's known without decoding it.
+        """
+        self.__source_code = None
+        self.__length = None
+        self.__line_count = LineCount
+        self.__loader = None
+        self.__view = View
+
+    def source_buffer(self):
+        """
+        Source code encoded as UTF-8, as a read only :class:`memoryview`, None if it wasn't
+        kept by the parser. Source code kept in an arena is handed without being decoded nor
+        copied once the parse is complete.
+        """
+        if self.__view is not None:
+            return self.__view.buffer()
+        source_code = self.source_code
+        if source_code is None:
+            return None
+        return memoryview(source_code.encode('utf-8', 'surrogatepass')).toreadonly()
+
+    @property
+    def loaded(self):
+        """
+        Tells the source code isn't waiting to be read anymore.
+        """
+        return self.__loader is None
+
+    def __getstate__(self):
+        # Lazy source code is read first, as its loader refers to the memory map of the file.
+        self.source_code
+        return None, {'_AbapSourceCode' + slot: getattr(self, '_AbapSourceCode' + slot)
+                      for slot in AbapSourceCode.__slots__}
+
+    @staticmethod
+    def count_lines(text):
+        """
+        Amount of lines of a text, where a last line without line break is also counted.
+        """
+        if not text:
+            return 0
+        return text.count('\n') + (not text.endswith('\n'))
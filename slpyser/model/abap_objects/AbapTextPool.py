@@ -18,6 +18,8 @@ class AbapTextPool(AbapObject):
     values in other languages (or a new logon using another language).
     """
 
+    __slots__ = ('__language_mapping',)
+
     def __init__(self):
         """
         Constructor
@@ -40,6 +42,8 @@ class AbapTextElement(AbapObject):
     Text elements from TextPool
     """
 
+    __slots__ = ('__id', '__key', '__entry', '__length')
+
     def __init__(self,
                  TextId,
                  TextKey,
@@ -77,6 +81,8 @@ class AbapTextElement(AbapObject):
 
 class AbapClassDocumentation(AbapObject):
 
+    __slots__ = ('__class_object_ref', '__language_mapping')
+
     def __init__(self,
                  ClassObjectRef):
         super(AbapClassDocumentation, self).__init__()
@@ -95,6 +101,8 @@ class AbapClassDocumentation(AbapObject):
 
     class AbapTextLine(AbapObject):
 
+        __slots__ = ('__td_format', '__td_line')
+
         def __init__(self,
                      TDFormat=None,
                      TDLine=None):
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+"""
+Contains the changes found when a SAPLink file is parsed again.
+"""
+
+
+class ChangeReport(object):
+    """
+    Objects of a file compared to a previous parse of it, available through
+    :attr:`NuggetFile.change_report <slpyser.model.saplink.SapLinkFile.NuggetFile.change_report>`.
+
+    Each object is described by a tuple (type, name), like ``('CLAS', 'ZCL_MY_CLASS')``, listed
+    in file order (removed ones in the order of the previous file).
+    """
+
+    def __init__(self,
+                 Added=None,
+                 Changed=None,
+                 Removed=None,
+                 Unchanged=None):
+        self.__added = Added or []
+        self.__changed = Changed or []
+        self.__removed = Removed or []
+        self.__unchanged = Unchanged or []
+
+    @property
+    def added(self):
+        """
+        Objects not found in the previous file.
+        """
+        return self.__added
+
+    @property
+    def changed(self):
+        """
+        Objects whose contents changed, parsed again.
+        """
+        return self.__changed
+
+    @property
+    def removed(self):
+        """
+        Objects of the previous file not found anymore.
+        """
+        return self.__removed
+
+    @property
+    def unchanged(self):
+        """
+        Objects whose contents didn't change, taken from the previous file.
+        """
+        return self.__unchanged
+
+    def __bool__(self):
+        return bool(self.__added or self.__changed or self.__removed)
+
+    def __repr__(self):
+        return '<ChangeReport added=%d changed=%d removed=%d unchanged=%d>' % (
+            len(self.__added), len(self.__changed), len(self.__removed), len(self.__unchanged))
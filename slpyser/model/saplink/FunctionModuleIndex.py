@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+"""
+Contains the index of function modules of a SAPLink file.
+"""
+
+import bisect
+
+from collections.abc import Mapping
+
+
+class FunctionModuleIndex(object):
+    """
+    Function modules of all function groups of a file, available through
+    :attr:`NuggetFile.function_module_index <slpyser.model.saplink.SapLinkFile.NuggetFile.function_module_index>`.
+
+    Names are indexed on first use, but function modules are always taken from their function
+    groups, so a function module replaced or removed (or a function group removed) is noticed
+    at once. Function modules added to the file or renamed are found after :meth:`invalidate`.
+    """
+
+    def __init__(self, FunctionGroups):
+        """
+        :param FunctionGroups: function groups of the file, by name.
+        """
+        self.__groups = FunctionGroups
+        # (group key, function group) by function module name, built when first needed.
+        self.__owners = None
+        self.__names = None
+        self.__upper_names = None
+        self.__function_modules = FunctionModules(self)
+
+    def invalidate(self):
+        """
+        Indexes function modules again on next lookup, after some were added or renamed.
+        """
+        self.__owners = None
+        self.__names = None
+        self.__upper_names = None
+
+    @property
+    def function_modules(self):
+        """
+        Read only mapping of function modules, by name.
+        """
+        return self.__function_modules
+
+    def names(self):
+        """
+        Names of function modules, sorted.
+        """
+        self.__build()
+        return [name for name in self.__names if self.__owner(name) is not None]
+
+    def __len__(self):
+        return len(self.names())
+
+    def __contains__(self, name):
+        return self.__owner(name) is not None
+
+    def get(self, Name, CaseSensitive=True):
+        """
+        Function module with a name, None if there's none.
+        """
+        if not CaseSensitive:
+            Name = self.__upper_name(Name)
+        function_group = self.__owner(Name)
+        return function_group.function_modules[Name] if function_group is not None else None
+
+    def function_group(self, Name, CaseSensitive=True):
+        """
+        Function group owning the function module with a name, None if there's none.
+        """
+        if not CaseSensitive:
+            Name = self.__upper_name(Name)
+        return self.__owner(Name)
+
+    def with_prefix(self, Prefix, CaseSensitive=True):
+        """
+        Names of function modules starting with a prefix, sorted.
+        """
+        self.__build()
+        found = []
+        if CaseSensitive:
+            names = self.__names
+            position = bisect.bisect_left(names, Prefix)
+            while position < len(names) and names[position].startswith(Prefix):
+                found.append(names[position])
+                position += 1
+        else:
+            upper_names = self.__upper_names
+            Prefix = Prefix.upper()
+            position = bisect.bisect_left(upper_names, (Prefix,))
+            while position < len(upper_names) and upper_names[position][0].startswith(Prefix):
+                found.append(upper_names[position][1])
+                position += 1
+        return sorted(name for name in found if self.__owner(name) is not None)
+
+    def __build(self):
+        if self.__owners is not None:
+            return
+        owners = {}
+        for key, function_group in self.__groups.items():
+            for name in function_group.function_modules:
+                owners[name] = (key, function_group)
+        self.__names = sorted(owners)
+        # (upper case name, name) pairs sorted, for lookups ignoring case.
+        self.__upper_names = sorted((name.upper(), name) for name in owners)
+        self.__owners = owners
+
+    def __owner(self, name):
+        """
+        Function group holding a function module, as long as both are still in the file.
+        """
+        self.__build()
+        owner = self.__owners.get(name)
+        if owner is None:
+            return None
+        key, function_group = owner
+        if self.__groups.get(key) is not function_group or name not in function_group.function_modules:
+            return None
+        return function_group
+
+    def __upper_name(self, name):
+        self.__build()
+        upper = name.upper()
+        position = bisect.bisect_left(self.__upper_names, (upper,))
+        if position < len(self.__upper_names) and self.__upper_names[position][0] == upper:
+            return self.__upper_names[position][1]
+        return name
+
+
+class FunctionModules(Mapping):
+    """
+    Function modules of a :class:`FunctionModuleIndex`, by name, as a read only mapping.
+    """
+
+    def __init__(self, Index):
+        self.__index = Index
+
+    def __getitem__(self, name):
+        function_module = self.__index.get(name)
+        if function_module is None:
+            raise KeyError(name)
+        return function_module
+
+    def __contains__(self, name):
+        return name in self.__index
+
+    def __iter__(self):
+        return iter(self.__index.names())
+
+    def __len__(self):
+        return len(self.__index)
@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+"""
+Contains the failure of parsing a SAPLink file inside a batch.
+"""
+
+
+class ParseFailure(object):
+    """
+    Returned instead of a :class:`~slpyser.model.saplink.SapLinkFile.NuggetFile` when a file of
+    a batch couldn't be parsed, so one broken file doesn't abort the others.
+
+    Exceptions raised in worker processes may not survive being sent back, so only their
+    description is kept.
+    """
+
+    def __init__(self,
+                 FilePath,
+                 ErrorType,
+                 Message,
+                 Traceback=None):
+        self.__file_path = FilePath
+        self.__error_type = ErrorType
+        self.__message = Message
+        self.__traceback = Traceback
+
+    @property
+    def file_path(self):
+        return self.__file_path
+
+    @property
+    def error_type(self):
+        """
+        Name of the exception class, e.g. 'ExpatError'.
+        """
+        return self.__error_type
+
+    @property
+    def message(self):
+        return self.__message
+
+    @property
+    def traceback(self):
+        """
+        Formatted traceback of the exception, as raised in the worker.
+        """
+        return self.__traceback
+
+    def __repr__(self):
+        return 'ParseFailure(%r, %s: %s)' % (self.__file_path, self.__error_type, self.__message)
@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+"""
+Contains the report of diagnostics collected while parsing a SAPLink file.
+"""
+
+
+class ParseReport(object):
+    """
+    Diagnostics of a parsing, available through
+    :attr:`NuggetFile.parse_report <slpyser.model.saplink.SapLinkFile.NuggetFile.parse_report>`.
+    """
+
+    def __init__(self):
+        self.__unhandled = {}
+        self.__interned_values = None
+        self.__distinct_values = None
+
+    @property
+    def unhandled(self):
+        """
+        Dictionary of :class:`unhandled elements <.UnhandledElement>`, by element path.
+
+        Unhandled elements are the ones not known by the library on its context (e.g. objects
+        from SAPLink plugins not supported yet); they're skipped with their whole subtree.
+        """
+        return self.__unhandled
+
+    def add_unhandled(self, Path, ByteVolume):
+        """
+        Counts an occurrence of an unhandled element.
+        """
+        element = self.__unhandled.get(Path)
+        if element is None:
+            element = self.__unhandled[Path] = ParseReport.UnhandledElement(Path=Path)
+        element.add_occurrence(ByteVolume)
+
+    @property
+    def interned_values(self):
+        """
+        Amount of attribute values interned while parsing, None when they weren't interned.
+        """
+        return self.__interned_values
+
+    @property
+    def distinct_values(self):
+        """
+        Amount of distinct attribute values among the interned ones, None when they weren't
+        interned. Reports merged from parts of a file count values found in many parts more
+        than once.
+        """
+        return self.__distinct_values
+
+    def set_interning(self, Total, Distinct):
+        """
+        Records the statistics of attribute values interning.
+        """
+        self.__interned_values = Total
+        self.__distinct_values = Distinct
+
+    def merge(self, other):
+        """
+        Adds the diagnostics of another report, e.g. from another part of the same file.
+        """
+        if other.interned_values is not None:
+            self.__interned_values = (self.__interned_values or 0) + other.interned_values
+            self.__distinct_values = (self.__distinct_values or 0) + other.distinct_values
+        for path, other_element in other.unhandled.items():
+            element = self.__unhandled.get(path)
+            if element is None:
+                element = self.__unhandled[path] = ParseReport.UnhandledElement(Path=path)
+            element.merge(other_element)
+
+    def summary(self, Limit=10):
+        """
+        One line description of unhandled elements, the most frequent ones first.
+        """
+        elements = sorted(self.__unhandled.values(), key=lambda element: -element.occurrences)
+        described = ', '.join('%s (%d)' % (element.path, element.occurrences)
+                              for element in elements[:Limit])
+        if len(elements) > Limit:
+            described += ', ...'
+        return '%d unhandled element(s) skipped: %s' % (
+            sum(element.occurrences for element in elements), described)
+
+    class UnhandledElement(object):
+        """
+        Occurrences of an unhandled element path.
+        """
+
+        def __init__(self,
+                     Path):
+            self.__path = Path
+            self.__occurrences = 0
+            self.__byte_volume = 0
+
+        def add_occurrence(self, ByteVolume):
+            self.__occurrences += 1
+            if ByteVolume is None or self.__byte_volume is None:
+                self.__byte_volume = None
+            else:
+                self.__byte_volume += ByteVolume
+
+        def merge(self, other):
+            """
+            Adds the occurrences of the same element from another report.
+            """
+            self.__occurrences += other.occurrences
+            if other.byte_volume is None or self.__byte_volume is None:
+                self.__byte_volume = None
+            else:
+                self.__byte_volume += other.byte_volume
+
+        @property
+        def path(self):
+            """
+            Element path, from the top level object down to the element.
+            """
+            return self.__path
+
+        @property
+        def occurrences(self):
+            return self.__occurrences
+
+        @property
+        def byte_volume(self):
+            """
+            Bytes of file taken by the occurrences of the element, from the start of their start
+            tag up to the end of their end tag. None when the XML backend can't tell file
+            positions, or when the file was converted to UTF-8 before parsing (encodings expat
+            can't decode, like cp1252), as positions wouldn't be the ones on file.
+            """
+            return self.__byte_volume
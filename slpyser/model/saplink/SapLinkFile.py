@@ -3,6 +3,8 @@
 Contains models classes representing data parsed from SAPLink files.
 """
 
+from slpyser.model.saplink.FunctionModuleIndex import FunctionModuleIndex
+
 
 class SapLinkFile(object):
     """
@@ -12,13 +14,26 @@ class SapLinkFile(object):
     """
 
     def __init__(self,
-                 FilePath):
+                 FilePath=None,
+                 ArchiveMember=None):
         self.__file_path = FilePath
+        self.__archive_member = ArchiveMember
 
     @property
     def file_path(self):
+        """
+        Path of parsed file, None when it was parsed from memory or from a stream.
+        """
         return self.__file_path
 
+    @property
+    def archive_member(self):
+        """
+        Name of the file inside the zip archive at :attr:`file_path`, None if it wasn't parsed
+        from an archive.
+        """
+        return self.__archive_member
+
 
 class NuggetFile(SapLinkFile):
     """
@@ -26,30 +41,35 @@ class NuggetFile(SapLinkFile):
     """
 
     def __init__(self,
-                 FilePath,
+                 FilePath=None,
+                 ArchiveMember=None,
                  AbapClasses=None,
                  AbapFunctionGroups=None,
                  AbapPrograms=None,
                  AbapMessageClasses=None,
-                 DataDictionary=None):
+                 DataDictionary=None,
+                 Encoding=None,
+                 ParseReport=None,
+                 Fingerprints=None,
+                 ChangeReport=None,
+                 MappedFile=None):
         """
         Assemble the object with all objects parsed from file.
         """
-        super(NuggetFile, self).__init__(FilePath=FilePath)
+        super(NuggetFile, self).__init__(FilePath=FilePath, ArchiveMember=ArchiveMember)
         self.__classes = AbapClasses
         self.__function_groups = AbapFunctionGroups
         self.__programs = AbapPrograms
         self.__message_classes = AbapMessageClasses
         self.__data_dictionary = DataDictionary
+        self.__encoding = Encoding
+        self.__parse_report = ParseReport
+        self.__fingerprints = Fingerprints
+        self.__change_report = ChangeReport
+        self.__mapped_file = MappedFile
 
-        # FIXME: Storing all functions in another attribute to easy development.
-        # In the future rewrite it to find inside Function Groups on demand.
-        self.__function_modules = {
-            functionName: functionImpl
-            for function_group in self.__function_groups.values()
-            for (functionName, functionImpl) in function_group.function_modules
-            .items()
-        }
+        # Built on first use, function modules are kept by their function groups.
+        self.__function_module_index = None
 
     @property
     def classes(self):
@@ -61,7 +81,21 @@ class NuggetFile(SapLinkFile):
 
     @property
     def function_modules(self):
-        return self.__function_modules
+        """
+        Function modules of all function groups, by name.
+        """
+        return self.function_module_index.function_modules
+
+    @property
+    def function_module_index(self):
+        """
+        :class:`~slpyser.model.saplink.FunctionModuleIndex.FunctionModuleIndex` of function
+        modules, built on first access. Call its ``invalidate()`` after adding or renaming
+        function modules.
+        """
+        if self.__function_module_index is None:
+            self.__function_module_index = FunctionModuleIndex(self.__function_groups)
+        return self.__function_module_index
 
     @property
     def message_classes(self):
@@ -74,3 +108,67 @@ class NuggetFile(SapLinkFile):
     @property
     def data_dictionary(self):
         return self.__data_dictionary
+
+    @property
+    def encoding(self):
+        """
+        Encoding used to decode the file, either detected from its contents or overridden by
+        the caller.
+        """
+        return self.__encoding
+
+    @property
+    def parse_report(self):
+        """
+        Diagnostics collected while parsing, see
+        :class:`~slpyser.model.saplink.ParseReport.ParseReport`.
+        """
+        return self.__parse_report
+
+    @property
+    def fingerprints(self):
+        """
+        Content digest of each top level object, by (type, name), used by
+        :func:`slpyser.reparse` to tell unchanged objects. None unless the file was parsed by it.
+        """
+        return self.__fingerprints
+
+    @property
+    def change_report(self):
+        """
+        Objects added, changed and removed since the previous parse, see
+        :class:`~slpyser.model.saplink.ChangeReport.ChangeReport`. None unless the file was
+        parsed by :func:`slpyser.reparse`.
+        """
+        return self.__change_report
+
+    def close(self):
+        """
+        Closes the memory map of the file, from where source code parsed with
+        ``sources='lazy'`` is read. Source code not read yet can't be read anymore.
+        """
+        if self.__mapped_file is not None:
+            self.__mapped_file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def save_snapshot(self, FilePath):
+        """
+        Writes the file as a :class:`~slpyser.storage.Snapshot.Snapshot`, loaded back by
+        :func:`slpyser.load_snapshot` much faster than parsing it again.
+        """
+        from slpyser.storage.Snapshot import Snapshot
+        Snapshot.write(FilePath, self)
+
+    def __getstate__(self):
+        # The index is cheaper to build again than to store.
+        state = self.__dict__.copy()
+        state['_NuggetFile__function_module_index'] = None
+        # Memory maps can't be pickled: each lazy source code is read from it when pickled (see
+        # AbapSourceCode.__getstate__), which fails once the file was closed.
+        state['_NuggetFile__mapped_file'] = None
+        return state
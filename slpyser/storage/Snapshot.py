@@ -0,0 +1,348 @@
+# -*- coding: utf-8 -*-
+"""
+Compact binary snapshot of a parsed SAPLink file, loaded much faster than parsing it again.
+"""
+
+import importlib
+import marshal
+import mmap
+import os
+import struct
+import tempfile
+
+from slpyser.model.abap_objects.AbapDictionary import AbapDictionary
+from slpyser.model.abap_objects.AbapSourceCode import AbapSourceCode
+from slpyser.model.saplink.SapLinkFile import NuggetFile
+
+# Tags of encoded values which aren't strings (string table indexes), model objects (lists)
+# or dictionaries.
+_SCALAR, _LIST, _TUPLE, _BLOB, _REFERENCE = range(5)
+
+_SOURCE_CODE_ATTRIBUTE = '_AbapSourceCode__source_code'
+"""Attribute of :class:`AbapSourceCode` stored as a blob."""
+
+_SOURCE_VIEW_ATTRIBUTE = '_AbapSourceCode__view'
+"""Attribute of :class:`AbapSourceCode` with its part of an arena, stored as text instead."""
+
+_BLOB_LENGTH = struct.Struct('<I')
+
+
+def _object_state(obj):
+    """
+    Attributes of a model object, as (name, value) pairs.
+    """
+    if hasattr(obj, '__dict__'):
+        return list(vars(obj).items())
+    state = []
+    for cls in type(obj).__mro__:
+        for slot in cls.__dict__.get('__slots__', ()):
+            if slot == '__weakref__':
+                continue
+            if slot.startswith('__') and not slot.endswith('__'):
+                slot = '_%s%s' % (cls.__name__.lstrip('_'), slot)
+            if hasattr(obj, slot):
+                state.append((slot, getattr(obj, slot)))
+    return state
+
+
+class _SnapshotWriter(object):
+    """
+    Encodes the objects of a file into records, sharing a string table and class layouts.
+    """
+
+    def __init__(self, Stream):
+        self.__stream = Stream
+        self.__strings = {}
+        self.__schemas = {}
+
+    @property
+    def strings(self):
+        return list(self.__strings)
+
+    @property
+    def schemas(self):
+        return list(self.__schemas)
+
+    def write_record(self, obj):
+        """
+        Writes an object with everything reachable from it, returning its (offset, length).
+        """
+        self.__references = {}
+        record = marshal.dumps(self.__encode(obj))
+        offset = self.__stream.tell()
+        self.__stream.write(record)
+        return offset, len(record)
+
+    def __string(self, value):
+        index = self.__strings.get(value)
+        if index is None:
+            index = self.__strings[value] = len(self.__strings)
+        return index
+
+    def __encode(self, value):
+        if isinstance(value, str):
+            return self.__string(value)
+        if value is None:
+            return None
+        if isinstance(value, dict):
+            return {self.__encode(key): self.__encode(item) for key, item in value.items()}
+        if isinstance(value, list):
+            return (_LIST, [self.__encode(item) for item in value])
+        if isinstance(value, tuple):
+            return (_TUPLE, tuple(self.__encode(item) for item in value))
+        if isinstance(value, (bool, int, float, bytes)):
+            return (_SCALAR, value)
+        source_code = None
+        if isinstance(value, AbapSourceCode):
+            # Source code read lazily or kept in an arena is stored as text.
+            source_code = value.source_code
+
+        reference = self.__references.get(id(value))
+        if reference is not None:
+            return (_REFERENCE, reference)
+        self.__references[id(value)] = len(self.__references)
+        state = _object_state(value)
+        if source_code is not None:
+            state = [(name, source_code if name == _SOURCE_CODE_ATTRIBUTE
+                      else None if name == _SOURCE_VIEW_ATTRIBUTE else item)
+                     for name, item in state]
+        cls = type(value)
+        layout = (self.__string('%s:%s' % (cls.__module__, cls.__qualname__)),
+                  tuple(self.__string(name) for name, _ in state))
+        schema = self.__schemas.get(layout)
+        if schema is None:
+            schema = self.__schemas[layout] = len(self.__schemas)
+        encoded = [self.__encode_blob(item) if name == _SOURCE_CODE_ATTRIBUTE and item is not None
+                   else self.__encode(item)
+                   for name, item in state]
+        encoded.append(schema)
+        return encoded
+
+    def __encode_blob(self, text):
+        """
+        Source code goes to a length prefixed blob, outside of records.
+        """
+        offset = self.__stream.tell()
+        data = text.encode('utf-8', 'surrogatepass')
+        self.__stream.write(_BLOB_LENGTH.pack(len(data)))
+        self.__stream.write(data)
+        return (_BLOB, offset)
+
+
+class Snapshot(object):
+    """
+    Snapshot of a :class:`~slpyser.model.saplink.SapLinkFile.NuggetFile`, written by
+    :meth:`~slpyser.model.saplink.SapLinkFile.NuggetFile.save_snapshot` and loaded by
+    :func:`slpyser.load_snapshot`.
+
+    Each top level object is a record of nested marshal values whose strings are indexes of a
+    string table (names, types and languages are stored once) and whose source codes are length
+    prefixed UTF-8 blobs. A table of contents at the end of the file locates the record of each
+    object, so single objects are loaded without reading the others::
+
+        with Snapshot('objects.snap') as snapshot:
+            abap_class = snapshot.load('classes', 'ZCL_MY_CLASS')
+
+    Objects are rebuilt from the attributes they had, so snapshots are only read by the library
+    version that wrote them. Only classes of :mod:`slpyser.model` are rebuilt, but records are
+    read with :mod:`marshal`, which isn't meant for untrusted data: load snapshots from trusted
+    sources only.
+    """
+
+    MAGIC = b'SLPYSNAP'
+
+    FORMAT_VERSION = 1
+    """Version of the snapshot layout, changed when it becomes incompatible."""
+
+    CONTAINERS = ('classes', 'function_groups', 'programs', 'message_classes', 'domains',
+                  'data_elements', 'structures')
+    """Containers of top level objects, named after the attributes of a nugget file."""
+
+    __TRAILER = struct.Struct('<QI8s')
+
+    def __init__(self, FilePath):
+        """
+        Opens a snapshot, reading only its table of contents.
+
+        :raise ValueError: not a snapshot, or written by another library version.
+        """
+        import slpyser
+
+        with open(FilePath, 'rb') as stream:
+            try:
+                self.__buffer = mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                raise ValueError('%s is not a snapshot' % FilePath)
+        size = len(self.__buffer)
+        if size < self.__TRAILER.size:
+            self.close()
+            raise ValueError('%s is not a snapshot' % FilePath)
+        index_offset, version, magic = self.__TRAILER.unpack_from(self.__buffer, size - self.__TRAILER.size)
+        if magic != self.MAGIC or version != self.FORMAT_VERSION:
+            self.close()
+            raise ValueError('%s is not a snapshot of format version %d' % (FilePath, self.FORMAT_VERSION))
+        index = marshal.loads(self.__buffer[index_offset:size - self.__TRAILER.size])
+        if index['version'] != slpyser.__version__:
+            self.close()
+            raise ValueError('%s was written by slpyser %s' % (FilePath, index['version']))
+        self.__file_path = FilePath
+        self.__strings = index['strings']
+        self.__schemas = []
+        for cls, names in index['schemas']:
+            cls = self.__class(self.__strings[cls])
+            self.__schemas.append((cls, [self.__strings[name] for name in names],
+                                   '__dict__' in dir(cls)))
+        self.__contents = index['contents']
+        self.__file = index['file']
+
+    @property
+    def file_path(self):
+        return self.__file_path
+
+    def names(self, Container):
+        """
+        Names of the objects of a container, in file order.
+        """
+        return list(self.__contents[Container])
+
+    def load(self, Container, Name):
+        """
+        Loads a single object.
+
+        :param Container: one of :attr:`CONTAINERS`.
+        :raise KeyError: there's no such object.
+        """
+        return self.__read_record(*self.__contents[Container][Name])
+
+    def load_nugget(self):
+        """
+        Loads the whole file.
+        """
+        containers = {
+            container: {name: self.__read_record(*location) for name, location in objects.items()}
+            for container, objects in self.__contents.items()
+        }
+        file = self.__read_record(*self.__file)
+        return NuggetFile(FilePath=file['file_path'],
+                          ArchiveMember=file['archive_member'],
+                          AbapClasses=containers['classes'],
+                          AbapFunctionGroups=containers['function_groups'],
+                          AbapPrograms=containers['programs'],
+                          AbapMessageClasses=containers['message_classes'],
+                          DataDictionary=AbapDictionary(Domains=containers['domains'],
+                                                        DataElements=containers['data_elements'],
+                                                        Structures=containers['structures']),
+                          Encoding=file['encoding'],
+                          ParseReport=file['parse_report'],
+                          Fingerprints=file['fingerprints'])
+
+    def close(self):
+        self.__buffer.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @classmethod
+    def write(cls, FilePath, Nugget):
+        """
+        Writes a snapshot of a parsed file, atomically replacing ``FilePath``.
+        """
+        import slpyser
+
+        directory = os.path.dirname(os.path.abspath(FilePath))
+        handle, temp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        try:
+            with os.fdopen(handle, 'wb') as stream:
+                writer = _SnapshotWriter(stream)
+                contents = {}
+                for container in cls.CONTAINERS:
+                    objects = getattr(Nugget, container, None)
+                    if objects is None:
+                        objects = getattr(Nugget.data_dictionary, container)
+                    contents[container] = {name: writer.write_record(obj) for name, obj in objects.items()}
+                file = writer.write_record({
+                    'file_path': Nugget.file_path,
+                    'archive_member': Nugget.archive_member,
+                    'encoding': Nugget.encoding,
+                    'parse_report': Nugget.parse_report,
+                    'fingerprints': Nugget.fingerprints,
+                })
+                index_offset = stream.tell()
+                stream.write(marshal.dumps({
+                    'version': slpyser.__version__,
+                    'strings': writer.strings,
+                    'schemas': writer.schemas,
+                    'contents': contents,
+                    'file': file,
+                }))
+                stream.write(cls.__TRAILER.pack(index_offset, cls.FORMAT_VERSION, cls.MAGIC))
+            os.replace(temp_path, FilePath)
+        except BaseException:
+            os.remove(temp_path)
+            raise
+
+    @staticmethod
+    def __class(name):
+        """
+        Model class from its qualified name. Only classes defined by the modules of
+        :mod:`slpyser.model` are loaded, never other objects those modules refer to.
+        """
+        module_name, qualified_name = name.split(':')
+        if not module_name.startswith('slpyser.model.'):
+            raise ValueError('Class %s is not part of the model' % name)
+        cls = importlib.import_module(module_name)
+        for attribute in qualified_name.split('.'):
+            cls = cls.__dict__.get(attribute)
+            if not isinstance(cls, type):
+                raise ValueError('Class %s is not part of the model' % name)
+        if cls.__module__ != module_name or cls.__qualname__ != qualified_name:
+            raise ValueError('Class %s is not part of the model' % name)
+        return cls
+
+    def __read_record(self, Offset, Length):
+        strings, schemas, references = self.__strings, self.__schemas, []
+
+        def decode(value):
+            # Strings and None, by far the most frequent values, are decoded inline.
+            value_type = type(value)
+            if value_type is list:
+                cls, names, has_dict = schemas[value[-1]]
+                obj = cls.__new__(cls)
+                references.append(obj)
+                state = zip(names, [strings[item] if type(item) is int else item if item is None else decode(item)
+                                    for item in value[:-1]])
+                if has_dict:
+                    obj.__dict__.update(state)
+                else:
+                    for name, item in state:
+                        setattr(obj, name, item)
+                return obj
+            if value_type is dict:
+                return {strings[key] if type(key) is int else decode(key):
+                        strings[item] if type(item) is int else item if item is None else decode(item)
+                        for key, item in value.items()}
+            if value_type is int:
+                return strings[value]
+            if value is None:
+                return None
+
+            tag = value[0]
+            if tag == _BLOB:
+                return self.__read_blob(value[1])
+            if tag == _SCALAR:
+                return value[1]
+            if tag == _LIST:
+                return [decode(item) for item in value[1]]
+            if tag == _TUPLE:
+                return tuple(decode(item) for item in value[1])
+            return references[value[1]]
+
+        return decode(marshal.loads(self.__buffer[Offset:Offset + Length]))
+
+    def __read_blob(self, Offset):
+        start = Offset + _BLOB_LENGTH.size
+        length, = _BLOB_LENGTH.unpack_from(self.__buffer, Offset)
+        return str(self.__buffer[start:start + length], 'utf-8', 'surrogatepass')
@@ -0,0 +1,425 @@
+# -*- coding: utf-8 -*-
+"""
+SQLite database of parsed SAPLink files, queried without parsing them again.
+"""
+
+import logging
+import sqlite3
+
+from slpyser.model.abap_objects.AbapClassLibrary import AbapClassInterface, AbapInterfaceMethod
+from slpyser.model.saplink.ParseFailure import ParseFailure
+
+
+class SqliteIndex(object):
+    """
+    Normalized SQLite schema holding the objects of many nuggets, so questions like "which
+    nuggets have a class inheriting from ZCL_BASE" are answered by a query::
+
+        with SqliteIndex('nuggets.db') as index:
+            index.add_many(slpyser.parse_many(paths, sources=False))
+            index.query('SELECT n.path FROM classes c JOIN nuggets n ON n.id = c.nugget_id '
+                        'WHERE c.parent_class = ?', ('ZCL_BASE',))
+
+    Each nugget is identified by a name (its path by default); adding it again replaces its
+    rows, so an index is kept up to date by adding the files that changed. Source code isn't
+    stored. Names and types are indexed; see :attr:`SCHEMA` for tables and columns.
+    """
+
+    SCHEMA_VERSION = 1
+    """Version of the schema, stored as the database ``user_version``."""
+
+    SCHEMA = """
+        CREATE TABLE nuggets (
+            id INTEGER PRIMARY KEY,
+            path TEXT NOT NULL UNIQUE,
+            file_path TEXT,
+            archive_member TEXT,
+            encoding TEXT
+        );
+        CREATE TABLE classes (
+            id INTEGER PRIMARY KEY,
+            nugget_id INTEGER NOT NULL REFERENCES nuggets(id) ON DELETE CASCADE,
+            name TEXT NOT NULL,
+            is_interface INTEGER NOT NULL,
+            description TEXT,
+            parent_class TEXT,
+            exposure TEXT,
+            final TEXT,
+            original_language TEXT,
+            created_by TEXT,
+            created_on TEXT,
+            changed_by TEXT,
+            changed_on TEXT
+        );
+        CREATE TABLE class_attributes (
+            id INTEGER PRIMARY KEY,
+            class_id INTEGER NOT NULL REFERENCES classes(id) ON DELETE CASCADE,
+            name TEXT NOT NULL,
+            decl_type TEXT,
+            exposure TEXT,
+            typ_type TEXT,
+            type TEXT,
+            description TEXT
+        );
+        CREATE TABLE methods (
+            id INTEGER PRIMARY KEY,
+            class_id INTEGER NOT NULL REFERENCES classes(id) ON DELETE CASCADE,
+            name TEXT NOT NULL,
+            is_interface_method INTEGER NOT NULL,
+            definition_class TEXT,
+            decl_type TEXT,
+            exposure TEXT,
+            description TEXT
+        );
+        CREATE TABLE method_parameters (
+            id INTEGER PRIMARY KEY,
+            method_id INTEGER NOT NULL REFERENCES methods(id) ON DELETE CASCADE,
+            name TEXT NOT NULL,
+            declaration_type TEXT,
+            pass_type TEXT,
+            typ_type TEXT,
+            type TEXT
+        );
+        CREATE TABLE function_groups (
+            id INTEGER PRIMARY KEY,
+            nugget_id INTEGER NOT NULL REFERENCES nuggets(id) ON DELETE CASCADE,
+            name TEXT NOT NULL,
+            description TEXT,
+            language TEXT
+        );
+        CREATE TABLE function_modules (
+            id INTEGER PRIMARY KEY,
+            function_group_id INTEGER NOT NULL REFERENCES function_groups(id) ON DELETE CASCADE,
+            name TEXT NOT NULL,
+            description TEXT
+        );
+        CREATE TABLE function_module_parameters (
+            id INTEGER PRIMARY KEY,
+            function_module_id INTEGER NOT NULL REFERENCES function_modules(id) ON DELETE CASCADE,
+            kind TEXT NOT NULL,
+            name TEXT NOT NULL,
+            type TEXT,
+            is_reference TEXT,
+            is_optional TEXT,
+            default_value TEXT
+        );
+        CREATE TABLE function_module_exceptions (
+            id INTEGER PRIMARY KEY,
+            function_module_id INTEGER NOT NULL REFERENCES function_modules(id) ON DELETE CASCADE,
+            name TEXT NOT NULL
+        );
+        CREATE TABLE programs (
+            id INTEGER PRIMARY KEY,
+            nugget_id INTEGER NOT NULL REFERENCES nuggets(id) ON DELETE CASCADE,
+            name TEXT NOT NULL,
+            type TEXT,
+            status TEXT,
+            created_by TEXT,
+            created_on TEXT,
+            changed_by TEXT,
+            changed_on TEXT
+        );
+        CREATE TABLE text_elements (
+            id INTEGER PRIMARY KEY,
+            nugget_id INTEGER NOT NULL REFERENCES nuggets(id) ON DELETE CASCADE,
+            object_type TEXT NOT NULL,
+            object_name TEXT NOT NULL,
+            language TEXT,
+            text_id TEXT,
+            text_key TEXT,
+            entry TEXT,
+            length TEXT
+        );
+        CREATE TABLE message_classes (
+            id INTEGER PRIMARY KEY,
+            nugget_id INTEGER NOT NULL REFERENCES nuggets(id) ON DELETE CASCADE,
+            name TEXT NOT NULL,
+            original_language TEXT,
+            responsible TEXT,
+            short_text TEXT
+        );
+        CREATE TABLE messages (
+            id INTEGER PRIMARY KEY,
+            message_class_id INTEGER NOT NULL REFERENCES message_classes(id) ON DELETE CASCADE,
+            language TEXT,
+            number TEXT,
+            text TEXT
+        );
+        CREATE TABLE domains (
+            id INTEGER PRIMARY KEY,
+            nugget_id INTEGER NOT NULL REFERENCES nuggets(id) ON DELETE CASCADE,
+            name TEXT NOT NULL,
+            description TEXT,
+            original_language TEXT,
+            data_type TEXT,
+            length TEXT,
+            output_length TEXT,
+            decimals TEXT,
+            lower_case TEXT
+        );
+        CREATE TABLE data_elements (
+            id INTEGER PRIMARY KEY,
+            nugget_id INTEGER NOT NULL REFERENCES nuggets(id) ON DELETE CASCADE,
+            name TEXT NOT NULL,
+            description TEXT,
+            original_language TEXT,
+            domain TEXT,
+            data_type TEXT,
+            length TEXT,
+            decimals TEXT,
+            label_short TEXT,
+            label_medium TEXT,
+            label_long TEXT,
+            label_heading TEXT
+        );
+        CREATE TABLE structures (
+            id INTEGER PRIMARY KEY,
+            nugget_id INTEGER NOT NULL REFERENCES nuggets(id) ON DELETE CASCADE,
+            name TEXT NOT NULL,
+            description TEXT,
+            original_language TEXT
+        );
+        CREATE TABLE structure_fields (
+            id INTEGER PRIMARY KEY,
+            structure_id INTEGER NOT NULL REFERENCES structures(id) ON DELETE CASCADE,
+            name TEXT NOT NULL,
+            position TEXT,
+            data_type TEXT
+        );
+
+        CREATE INDEX classes_nugget ON classes(nugget_id);
+        CREATE INDEX classes_name ON classes(name);
+        CREATE INDEX classes_parent_class ON classes(parent_class);
+        CREATE INDEX class_attributes_class ON class_attributes(class_id);
+        CREATE INDEX class_attributes_type ON class_attributes(type);
+        CREATE INDEX methods_class ON methods(class_id);
+        CREATE INDEX methods_name ON methods(name);
+        CREATE INDEX method_parameters_method ON method_parameters(method_id);
+        CREATE INDEX method_parameters_type ON method_parameters(type);
+        CREATE INDEX function_groups_nugget ON function_groups(nugget_id);
+        CREATE INDEX function_groups_name ON function_groups(name);
+        CREATE INDEX function_modules_function_group ON function_modules(function_group_id);
+        CREATE INDEX function_modules_name ON function_modules(name);
+        CREATE INDEX function_module_parameters_function_module ON function_module_parameters(function_module_id);
+        CREATE INDEX function_module_parameters_type ON function_module_parameters(type);
+        CREATE INDEX function_module_exceptions_function_module ON function_module_exceptions(function_module_id);
+        CREATE INDEX programs_nugget ON programs(nugget_id);
+        CREATE INDEX programs_name ON programs(name);
+        CREATE INDEX text_elements_nugget ON text_elements(nugget_id);
+        CREATE INDEX text_elements_object ON text_elements(object_name);
+        CREATE INDEX message_classes_nugget ON message_classes(nugget_id);
+        CREATE INDEX message_classes_name ON message_classes(name);
+        CREATE INDEX messages_message_class ON messages(message_class_id);
+        CREATE INDEX domains_nugget ON domains(nugget_id);
+        CREATE INDEX domains_name ON domains(name);
+        CREATE INDEX data_elements_nugget ON data_elements(nugget_id);
+        CREATE INDEX data_elements_name ON data_elements(name);
+        CREATE INDEX data_elements_domain ON data_elements(domain);
+        CREATE INDEX structures_nugget ON structures(nugget_id);
+        CREATE INDEX structures_name ON structures(name);
+        CREATE INDEX structure_fields_structure ON structure_fields(structure_id);
+        CREATE INDEX structure_fields_data_type ON structure_fields(data_type);
+    """
+    """Statements creating the tables and indexes of the database."""
+
+    def __init__(self, FilePath):
+        """
+        Opens the database, creating its schema when it's empty.
+
+        :raise ValueError: database of another schema version.
+        """
+        self.__logger = logging.getLogger(__name__)
+        self.__connection = sqlite3.connect(FilePath)
+        self.__connection.row_factory = sqlite3.Row
+        self.__connection.execute('PRAGMA foreign_keys = ON')
+        version = self.__connection.execute('PRAGMA user_version').fetchone()[0]
+        if version == 0:
+            with self.__connection:
+                self.__connection.executescript(self.SCHEMA)
+                self.__connection.execute('PRAGMA user_version = %d' % self.SCHEMA_VERSION)
+        elif version != self.SCHEMA_VERSION:
+            self.__connection.close()
+            raise ValueError('%s has schema version %d, expected %d' % (FilePath, version,
+                                                                         self.SCHEMA_VERSION))
+
+    @property
+    def connection(self):
+        """
+        The :class:`sqlite3.Connection`, with rows returned as :class:`sqlite3.Row`.
+        """
+        return self.__connection
+
+    def add(self, Nugget, Name=None):
+        """
+        Adds a parsed file, replacing a file previously added with the same name.
+
+        :param Name: name of the file in the index, defaults to its path (and the name of the
+            member when it was parsed from an archive).
+        :return: id of the file, in table ``nuggets``.
+        """
+        with self.__connection:
+            return self.__insert(Nugget, Name)
+
+    def add_many(self, Nuggets):
+        """
+        Adds many parsed files in a single transaction, named by their paths. Failures of
+        :func:`slpyser.parse_many` are skipped.
+
+        :return: ids of the added files.
+        """
+        nugget_ids = []
+        with self.__connection:
+            for nugget in Nuggets:
+                if isinstance(nugget, ParseFailure):
+                    self.__logger.warning('Skipping %s, which failed to parse: %s', nugget.file_path,
+                                          nugget.message)
+                    continue
+                nugget_ids.append(self.__insert(nugget, None))
+        return nugget_ids
+
+    def remove(self, Name):
+        """
+        Removes a file and all of its objects.
+        """
+        with self.__connection:
+            self.__connection.execute('DELETE FROM nuggets WHERE path = ?', (Name,))
+
+    def names(self):
+        """
+        Names of the files in the index.
+        """
+        return [row[0] for row in self.__connection.execute('SELECT path FROM nuggets ORDER BY path')]
+
+    def query(self, Sql, Parameters=()):
+        """
+        Runs a query, returning all of its rows.
+        """
+        return self.__connection.execute(Sql, Parameters).fetchall()
+
+    def close(self):
+        self.__connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __insert(self, Nugget, Name):
+        if Name is None:
+            Name = Nugget.file_path
+            if Name is None:
+                raise ValueError('A name is needed for a file parsed from memory or from a stream')
+            if Nugget.archive_member is not None:
+                Name = '%s/%s' % (Name, Nugget.archive_member)
+        execute = self.__connection.execute
+        executemany = self.__connection.executemany
+
+        execute('DELETE FROM nuggets WHERE path = ?', (Name,))
+        nugget_id = execute('INSERT INTO nuggets (path, file_path, archive_member, encoding) VALUES (?, ?, ?, ?)',
+                            (Name, Nugget.file_path, Nugget.archive_member, Nugget.encoding)).lastrowid
+        text_elements = []
+
+        for abap_class in Nugget.classes.values():
+            is_interface = isinstance(abap_class, AbapClassInterface)
+            class_id = execute(
+                'INSERT INTO classes (nugget_id, name, is_interface, description, parent_class, exposure, '
+                'final, original_language, created_by, created_on, changed_by, changed_on) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                (nugget_id, abap_class.name, is_interface, abap_class.description, abap_class.parent_class,
+                 abap_class.exposure, abap_class.final, abap_class.original_language, abap_class.created_by,
+                 abap_class.created_on, abap_class.changed_by, abap_class.changed_on)).lastrowid
+            executemany(
+                'INSERT INTO class_attributes (class_id, name, decl_type, exposure, typ_type, type, description) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?)',
+                [(class_id, attribute.name, attribute.decl_type, attribute.exposure, attribute.typType,
+                  attribute.type, attribute.description) for attribute in abap_class.attributes.values()])
+            for method in abap_class.methods.values():
+                method_id = execute(
+                    'INSERT INTO methods (class_id, name, is_interface_method, definition_class, decl_type, '
+                    'exposure, description) VALUES (?, ?, ?, ?, ?, ?, ?)',
+                    (class_id, method.name, isinstance(method, AbapInterfaceMethod), method.definition_class_name,
+                     method.decl_type, method.exposure, method.description)).lastrowid
+                executemany(
+                    'INSERT INTO method_parameters (method_id, name, declaration_type, pass_type, typ_type, type) '
+                    'VALUES (?, ?, ?, ?, ?, ?)',
+                    [(method_id, parameter.name, parameter.declaration_type, parameter.pass_type,
+                      parameter.typ_type, parameter.type_) for parameter in method.parameters.values()])
+            text_elements.extend(self.__text_elements(nugget_id, 'INTF' if is_interface else 'CLAS',
+                                                      abap_class.name, abap_class.text_pool))
+
+        for function_group in Nugget.function_groups.values():
+            function_group_id = execute(
+                'INSERT INTO function_groups (nugget_id, name, description, language) VALUES (?, ?, ?, ?)',
+                (nugget_id, function_group.name, function_group.description, function_group.language)).lastrowid
+            for function_module in function_group.function_modules.values():
+                function_module_id = execute(
+                    'INSERT INTO function_modules (function_group_id, name, description) VALUES (?, ?, ?)',
+                    (function_group_id, function_module.name, function_module.description)).lastrowid
+                executemany(
+                    'INSERT INTO function_module_parameters (function_module_id, kind, name, type, is_reference, '
+                    'is_optional, default_value) VALUES (?, ?, ?, ?, ?, ?, ?)',
+                    [(function_module_id, kind, parameter.name, parameter.typ, parameter.is_reference,
+                      parameter.is_optional, parameter.default_value)
+                     for kind, parameters in (('importing', function_module.parameters_importing),
+                                              ('exporting', function_module.parameters_exporting),
+                                              ('changing', function_module.parameters_changing),
+                                              ('tables', function_module.parameters_tables))
+                     for parameter in parameters.values()])
+                executemany(
+                    'INSERT INTO function_module_exceptions (function_module_id, name) VALUES (?, ?)',
+                    [(function_module_id, exception) for exception in function_module.exceptions])
+
+        for program in Nugget.programs.values():
+            execute(
+                'INSERT INTO programs (nugget_id, name, type, status, created_by, created_on, changed_by, '
+                'changed_on) VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                (nugget_id, program.name, program.type, program.status, program.created_by, program.created_on,
+                 program.changed_by, program.changed_on))
+            text_elements.extend(self.__text_elements(nugget_id, 'PROG', program.name, program.text_pool))
+        executemany(
+            'INSERT INTO text_elements (nugget_id, object_type, object_name, language, text_id, text_key, entry, '
+            'length) VALUES (?, ?, ?, ?, ?, ?, ?, ?)', text_elements)
+
+        for message_class in Nugget.message_classes.values():
+            message_class_id = execute(
+                'INSERT INTO message_classes (nugget_id, name, original_language, responsible, short_text) '
+                'VALUES (?, ?, ?, ?, ?)',
+                (nugget_id, message_class.name, message_class.original_language, message_class.responsible,
+                 message_class.short_text)).lastrowid
+            executemany(
+                'INSERT INTO messages (message_class_id, language, number, text) VALUES (?, ?, ?, ?)',
+                [(message_class_id, message.language, message.number, message.text)
+                 for messages in message_class.language_mapping.values() for message in messages.values()])
+
+        data_dictionary = Nugget.data_dictionary
+        executemany(
+            'INSERT INTO domains (nugget_id, name, description, original_language, data_type, length, '
+            'output_length, decimals, lower_case) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)',
+            [(nugget_id, domain.name, domain.description, domain.original_language, domain.data_type,
+              domain.length, domain.output_length, domain.decimals, domain.lower_case)
+             for domain in data_dictionary.domains.values()])
+        executemany(
+            'INSERT INTO data_elements (nugget_id, name, description, original_language, domain, data_type, '
+            'length, decimals, label_short, label_medium, label_long, label_heading) '
+            'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+            [(nugget_id, data_element.name, data_element.description, data_element.original_language,
+              data_element.domain_used, data_element.data_type, data_element.length, data_element.decimals,
+              data_element.label_short, data_element.label_medium, data_element.label_long,
+              data_element.label_heading)
+             for data_element in data_dictionary.data_elements.values()])
+        for structure in data_dictionary.structures.values():
+            structure_id = execute(
+                'INSERT INTO structures (nugget_id, name, description, original_language) VALUES (?, ?, ?, ?)',
+                (nugget_id, structure.name, structure.description, structure.original_language)).lastrowid
+            executemany(
+                'INSERT INTO structure_fields (structure_id, name, position, data_type) VALUES (?, ?, ?, ?)',
+                [(structure_id, field.name, field.position, field.data_type) for field in structure.fields.values()])
+        return nugget_id
+
+    @staticmethod
+    def __text_elements(NuggetId, ObjectType, ObjectName, TextPool):
+        return [(NuggetId, ObjectType, ObjectName, language, text_element.id, text_element.key,
+                 text_element.entry, text_element.length)
+                for language, text_elements in TextPool.language_mapping.items()
+                for text_element in text_elements.values()]
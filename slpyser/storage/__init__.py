@@ -0,0 +1,3 @@
+"""
+Storage formats of parsed SAPLink files, other than the SAPLink XML.
+"""
@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+"""
+Detection and streaming decompression of compressed SAPLink files.
+
+Compressed files are recognized by their magic bytes (not by their extension) and are
+decompressed chunk by chunk while being fed into the XML parser, never touching the disk.
+"""
+
+import bz2
+import lzma
+import zlib
+
+
+class Compression(object):
+    """
+    Compression formats supported on SAPLink files.
+    """
+
+    MAGIC_SIZE = 6
+    """Amount of bytes from the beginning of the file needed to detect its compression."""
+
+    __MAGIC_BYTES = (
+        (b'\x1f\x8b', 'gzip'),
+        (b'BZh', 'bz2'),
+        (b'\xfd7zXZ\x00', 'xz'),
+        (b'PK\x03\x04', 'zip'),
+        (b'PK\x05\x06', 'zip'),
+    )
+
+    __DECOMPRESSORS = {
+        'gzip': lambda: zlib.decompressobj(16 + zlib.MAX_WBITS),
+        'bz2': bz2.BZ2Decompressor,
+        'xz': lzma.LZMADecompressor,
+    }
+
+    @classmethod
+    def detect(cls, head):
+        """
+        Detects the compression of a file from its first bytes.
+
+        :param head: first bytes of file (at least :attr:`MAGIC_SIZE` if file is big enough).
+        :return: 'gzip', 'bz2', 'xz', 'zip' or None when file isn't compressed.
+        """
+        for magic, compression in cls.__MAGIC_BYTES:
+            if head.startswith(magic):
+                return compression
+        return None
+
+    @classmethod
+    def decompress(cls, chunks, compression, chunk_size):
+        """
+        Decompresses a stream (e.g. 'gzip') chunk by chunk, yielding chunks of at most
+        ``chunk_size`` bytes, so highly compressed files don't blow up memory usage.
+
+        Concatenated streams (like ``cat a.gz b.gz``) are decompressed as a single file.
+        Archives ('zip') hold files instead of a stream, so they're not supported here.
+
+        :raise EOFError: stream is truncated.
+        """
+        new_decompressor = cls.__DECOMPRESSORS[compression]
+        decompressor = new_decompressor()
+        if compression == 'gzip':
+            return cls.__inflate(chunks, decompressor, new_decompressor, chunk_size)
+        return cls.__decompress(chunks, decompressor, new_decompressor, chunk_size)
+
+    @staticmethod
+    def __truncated():
+        return EOFError('Compressed file ended before the end-of-stream marker was reached')
+
+    @classmethod
+    def __inflate(cls, chunks, decompressor, new_decompressor, chunk_size):
+        # Whether the current decompressor got any input, as the last stream must reach its end.
+        started = False
+        for chunk in chunks:
+            data = chunk
+            while data:
+                started = True
+                decompressed = decompressor.decompress(data, chunk_size)
+                if decompressed:
+                    yield decompressed
+                if decompressor.eof:
+                    data = decompressor.unused_data
+                    decompressor = new_decompressor()
+                    started = False
+                else:
+                    data = decompressor.unconsumed_tail
+        decompressed = decompressor.flush()
+        if decompressed:
+            yield decompressed
+        if started and not decompressor.eof:
+            raise cls.__truncated()
+
+    @classmethod
+    def __decompress(cls, chunks, decompressor, new_decompressor, chunk_size):
+        started = False
+        for chunk in chunks:
+            data = chunk
+            while True:
+                started = started or bool(data)
+                decompressed = decompressor.decompress(data, chunk_size)
+                if decompressed:
+                    yield decompressed
+                if decompressor.eof:
+                    data = decompressor.unused_data
+                    decompressor = new_decompressor()
+                    started = False
+                    if not data:
+                        break
+                elif decompressor.needs_input:
+                    break
+                else:
+                    data = b''
+        if started and not decompressor.eof:
+            raise cls.__truncated()
@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+"""
+Detection of the real encoding of a SAPLink file, done before the XML parser starts.
+
+Some SAPLink plugins declare ``encoding="utf-16"`` on the XML declaration but write the file
+as UTF-8. Instead of letting the parser fail (usually near the end of a big nugget) and parsing
+it again, the first bytes of the file are inspected once to choose the right decoder:
+
+ 1. Byte order mark;
+ 2. Byte pattern of ``<?`` (UTF-16 without BOM);
+ 3. Encoding declared in XML declaration, ignoring UTF-16 declarations for files that are
+    clearly single byte based.
+"""
+
+import codecs
+import logging
+import re
+
+
+class EncodingDetector(object):
+    """
+    Chooses the encoding to be used to decode a SAPLink file.
+    """
+
+    SNIFF_SIZE = 4096
+    """Amount of bytes from the beginning of the file needed to detect its encoding."""
+
+    DEFAULT_ENCODING = 'utf-8'
+    """Encoding assumed by XML specification when nothing is declared."""
+
+    # UTF-32 marks come first, as the little endian one starts with the UTF-16 one.
+    __BOMS = (
+        (codecs.BOM_UTF32_LE, 'utf-32'),
+        (codecs.BOM_UTF32_BE, 'utf-32'),
+        (codecs.BOM_UTF8, 'utf-8'),
+        (codecs.BOM_UTF16_LE, 'utf-16'),
+        (codecs.BOM_UTF16_BE, 'utf-16'),
+    )
+
+    __BYTE_PATTERNS = (
+        (b'<\x00?\x00', 'utf-16-le'),
+        (b'\x00<\x00?', 'utf-16-be'),
+    )
+
+    __XML_DECLARATION = re.compile(br'^\s*<\?xml[^>]*?encoding\s*=\s*["\']([A-Za-z0-9._-]+)["\']')
+
+    __EXPAT_ENCODINGS = {
+        'utf-8': 'UTF-8',
+        'utf-8-sig': 'UTF-8',
+        'utf-16': 'UTF-16',
+        'utf-16-le': 'UTF-16LE',
+        'utf-16-be': 'UTF-16BE',
+        'iso8859-1': 'ISO-8859-1',
+        'latin-1': 'ISO-8859-1',
+        'ascii': 'US-ASCII',
+    }
+
+    __logger = logging.getLogger(__name__)
+
+    @classmethod
+    def detect(cls, head):
+        """
+        Detects the encoding of a file from its first bytes.
+
+        :param head: first bytes of file (at least :attr:`SNIFF_SIZE` if file is big enough).
+        :return: Python codec name of the detected encoding.
+        """
+        for bom, encoding in cls.__BOMS:
+            if head.startswith(bom):
+                return encoding
+
+        for pattern, encoding in cls.__BYTE_PATTERNS:
+            if head.startswith(pattern):
+                return encoding
+
+        declaration = cls.__XML_DECLARATION.match(head)
+        if declaration is None:
+            return cls.DEFAULT_ENCODING
+
+        declared_encoding = declaration.group(1).decode('ascii')
+        try:
+            encoding = cls.normalize(declared_encoding)
+        except LookupError:
+            cls.__logger.warning('Unknown encoding "%s" declared, using %s instead.',
+                                 declared_encoding, cls.DEFAULT_ENCODING)
+            return cls.DEFAULT_ENCODING
+
+        if encoding.startswith('utf-16') or encoding.startswith('utf-32'):
+            # The XML declaration was read as a single byte encoding, so the file can't be
+            # encoded on what it declares: a known bug of some SAPLink plugins.
+            cls.__logger.debug('File declares %s but is single byte based, using %s instead.',
+                               declared_encoding, cls.DEFAULT_ENCODING)
+            return cls.DEFAULT_ENCODING
+        return encoding
+
+    @staticmethod
+    def normalize(encoding):
+        """
+        Normalizes an encoding name to its Python codec name.
+
+        :raise LookupError: encoding is unknown.
+        """
+        return codecs.lookup(encoding).name
+
+    @classmethod
+    def expat_encoding(cls, encoding):
+        """
+        Name of an encoding natively supported by expat, or None if the encoding needs to be
+        converted before it reaches the XML parser.
+        """
+        return cls.__EXPAT_ENCODINGS.get(encoding)
+
+    @classmethod
+    def is_ascii_compatible(cls, encoding):
+        """
+        Tells if markup characters are encoded as single ASCII bytes, so the raw file contents can
+        be scanned for them.
+        """
+        return cls.expat_encoding(encoding) in ('UTF-8', 'ISO-8859-1', 'US-ASCII')
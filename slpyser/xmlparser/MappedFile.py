@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+"""
+Memory map of a parsed file, from where source code is read lazily.
+"""
+
+import mmap
+
+
+class MappedFile(object):
+    """
+    Read only memory map of a file, closed explicitly (or by a ``with`` block) instead of
+    waiting for the garbage collector::
+
+        with slpyser.parse(path, sources='lazy') as nugget:
+            ...
+
+    Reading it once closed raises ValueError.
+    """
+
+    def __init__(self, Stream):
+        """
+        :param Stream: file object of a non empty file, opened for reading in binary mode.
+        """
+        self.__map = mmap.mmap(Stream.fileno(), 0, access=mmap.ACCESS_READ)
+
+    @property
+    def closed(self):
+        return self.__map.closed
+
+    def __len__(self):
+        return len(self.__map)
+
+    def __getitem__(self, key):
+        if self.__map.closed:
+            raise ValueError('Mapped file is closed')
+        return self.__map[key]
+
+    def close(self):
+        self.__map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+"""
+Splitting of a nugget into fragments that can be parsed independently.
+"""
+
+import html
+import re
+
+
+class NuggetSplitter(object):
+    """
+    Scans the raw bytes of a nugget for the start of top level objects (``<CLAS``, ``<PROG``,
+    ...), splitting the contents of the nugget element into contiguous byte ranges.
+
+    Each range, wrapped by :attr:`header` and :attr:`footer`, is a nugget by itself. Objects
+    don't nest, so a split position found inside an object moves to the next object; in the
+    rare case it lands inside something else (like a CDATA section or an unknown element
+    holding object-like elements) the fragment before it is not well-formed and fails to parse.
+
+    Only files whose encoding is ASCII compatible can be split.
+    """
+
+    HEADER_SEARCH_SIZE = 64 * 1024
+    """Amount of bytes where the nugget start tag is looked for."""
+
+    __NUGGET_START = re.compile(br'<nugget(?:\s+[^\s=/>]+\s*=\s*(?:"[^"]*"|\'[^\']*\'))*\s*>')
+    __NUGGET_END = b'</nugget'
+    __ATTRIBUTE = re.compile(br'\s+([^\s=/>]+)\s*=\s*(?:"([^"]*)"|\'([^\']*)\')')
+
+    def __init__(self, Buffer, ObjectTypes):
+        """
+        :param Buffer: file contents, like a :class:`mmap.mmap`.
+        :param ObjectTypes: tags of top level objects.
+        """
+        self.__buffer = Buffer
+        self.__object_start = re.compile(
+            br'<(' + b'|'.join(re.escape(tag.encode('ascii')) for tag in sorted(ObjectTypes)) + br')[\s/>]')
+        self.__start_tag_end = re.compile(br'(?:\s+[^\s=/>]+\s*=\s*(?:"[^"]*"|\'[^\']*\'))*\s*(/?)>')
+        self.__header = None
+        self.__footer = None
+        nugget_start = self.__NUGGET_START.search(Buffer, 0, self.HEADER_SEARCH_SIZE)
+        if nugget_start is not None:
+            footer_start = Buffer.rfind(self.__NUGGET_END)
+            if footer_start >= nugget_start.end():
+                self.__body = (nugget_start.end(), footer_start)
+                self.__header = Buffer[:nugget_start.end()]
+                self.__footer = Buffer[footer_start:]
+
+    @property
+    def splittable(self):
+        """
+        Tells the file is a nugget, whose contents can be split.
+        """
+        return self.__header is not None
+
+    @property
+    def header(self):
+        """
+        Bytes of file up to the nugget start tag (XML declaration included).
+        """
+        return self.__header
+
+    @property
+    def footer(self):
+        """
+        Bytes of file from the nugget end tag.
+        """
+        return self.__footer
+
+    def split(self, Parts):
+        """
+        Splits the nugget contents into at most ``Parts`` ranges of similar size, each one
+        starting at a top level object (except the first one).
+
+        :return: list of (start, end) byte positions.
+        """
+        body_start, body_end = self.__body
+        part_size = (body_end - body_start) // Parts
+        boundaries = [body_start]
+        for part in range(1, Parts):
+            object_start = self.__object_start.search(self.__buffer,
+                                                      max(boundaries[-1] + 1, body_start + part * part_size),
+                                                      body_end)
+            if object_start is None:
+                break
+            boundaries.append(object_start.start())
+        boundaries.append(body_end)
+        return list(zip(boundaries[:-1], boundaries[1:]))
+
+    def objects(self, NameAttributes):
+        """
+        Scans the nugget contents for its top level objects, in file order.
+
+        An object ends at the first end tag of its type, so an end tag hidden inside a CDATA
+        section or a comment of the object ends it early; the bytes left over are not
+        well-formed on their own.
+
+        :param NameAttributes: attribute holding the name of each object type, by tag.
+        :return: iterator of (tag, name, start, end), being the object the bytes between start
+            and end. Name is None if the object has no such attribute.
+        """
+        body_start, body_end = self.__body
+        position = body_start
+        while True:
+            object_start = self.__object_start.search(self.__buffer, position, body_end)
+            if object_start is None:
+                return
+            tag = object_start.group(1)
+            start_tag_end = self.__start_tag_end.match(self.__buffer, object_start.end(1), body_end)
+            if start_tag_end is None:
+                position = object_start.end()
+                continue
+            if start_tag_end.group(1):
+                end = start_tag_end.end()
+            else:
+                end_tag = self.__buffer.find(b'</' + tag, start_tag_end.end(), body_end)
+                end = self.__buffer.find(b'>', end_tag, body_end) + 1 if end_tag >= 0 else 0
+                if end <= 0:
+                    return
+            tag = tag.decode('ascii')
+            yield (tag,
+                   self.__attribute(object_start.end(1), start_tag_end.end(), NameAttributes.get(tag)),
+                   object_start.start(),
+                   end)
+            position = end
+
+    def __attribute(self, start, end, name):
+        if name is None:
+            return None
+        for attribute in self.__ATTRIBUTE.finditer(self.__buffer, start, end):
+            if attribute.group(1).decode('ascii', 'replace') == name:
+                value = attribute.group(2) if attribute.group(2) is not None else attribute.group(3)
+                return html.unescape(value.decode('utf-8', 'replace'))
+        return None
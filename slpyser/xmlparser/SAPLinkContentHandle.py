@@ -7,6 +7,9 @@ import slpyser.xmlparser.handlers as handlers
 from slpyser.model.abap_objects.AbapDictionary import AbapDictionary
 from slpyser.model.abap_objects.AbapMessageClass import AbapMessageClass
 from slpyser.model.abap_objects.AbapTextPool import AbapTextElement
+from slpyser.model.saplink.ParseReport import ParseReport
+from slpyser.xmlparser.SourceCollector import SOURCE_COLLECTORS
+from slpyser.xmlparser.StringInterner import StringInterner
 
 
 class SAPLinkContentHandle(xml.sax.ContentHandler):
@@ -14,84 +17,110 @@ class SAPLinkContentHandle(xml.sax.ContentHandler):
     Implementation for SAX XML parser handle SAPLink file syntax.
     """
 
-    def __init__(self):
+    def __init__(self, Streaming=False, IncludeTypes=None, NameFilter=None, Sources=True, Intern=False):
         """
         Constructor
+
+        :param Streaming: when set, parsed objects aren't stored on the dictionaries returned
+            after parsing, they're kept only until :meth:`drain_objects` is called.
+        :param IncludeTypes: object types (top level tags, e.g. 'CLAS') to be parsed, all other
+            objects are skipped. All types are parsed if not informed.
+        :param NameFilter: callable receiving an object name, telling if that object is parsed.
+        :param Sources: how source code is kept, see :data:`~slpyser.xmlparser.SourceCollector.SOURCE_COLLECTORS`:
+            True keeps its text, False keeps only its length and line count, 'lazy' keeps its
+            position on file to read it on first access (see :meth:`set_source_buffer`), 'arena'
+            appends it to a buffer shared by all source code of the parse, 'compressed' keeps it
+            compressed until accessed.
+        :param Intern: how attribute values are interned, see
+            :attr:`~slpyser.xmlparser.StringInterner.StringInterner.MODES`.
         """
         self.__logger = logging.getLogger(__name__)
         xml.sax.ContentHandler.__init__(self)
-        self._matrix_element_case_handler = {
-            # TextPool elements
-            'TEXTPOOL': [
-                self._startTextPool,
-                self._charactersTextPool,
-                self._endTextPool
-            ],
-            'TEXTELEMENT': [
-                self._startTextPoolTextElement,
-                self._charactersTextPoolTextElement,
-                self._endTextPoolTextElement
-            ],
-
+        self._matrix_element_path_handler = {
             # Message Class elements
             'MSAG': [
                 self._startMessageClass,
                 None,
                 self._endMessageClass
             ],
-            'T100': [
+            'MSAG/T100': [
                 self._startMessageClassMessage,
                 None,
                 None,
             ],
-
-            # General elements
-            'SOURCE': [
-                self._startSourceCode,
-                self._charactersSourceCode,
-                self._endSourceCode
-            ],
-            'LANGUAGE': [
-                self._startTextLanguage,
-                self._charactersTextLanguage,
-                self._endTextLanguage
-            ],
         }
         """
+        Each element is declared by its context path: upper case tags from the top level object
+        (child of nugget element) down to the element itself, separated by '/'.
+        Elements outside a declared context aren't handled, neither their subtree.
+
         Each element have three handlers, declared in that order:
           1st: handle start of an element (retrieve element attributes);
           2nd: handle contents of an element (retrieve data inside element);
           3rd: handle end of an element.
         """
-        self.__unhandled_element = [
-            self._startUnhandled,
-            self._charactersUnhandled,
-            self._endUnhandled
-        ]
+        self._matrix_object_name_attribute = {
+            'MSAG': 'ARBGB',
+        }
+        """
+        Object types (top level tags) declared by handlers, with the attribute holding their name.
+        """
 
         # Attributes to be returned after parsing
         self._abap_message_classes = {}
+        self.__parse_report = ParseReport()
+        self.__streaming = Streaming
+        self.__streamed_objects = []
+
+        source_collector_class = SOURCE_COLLECTORS.get(Sources)
+        if source_collector_class is None:
+            raise ValueError('Unknown sources mode %r, available ones are: %s'
+                             % (Sources, ', '.join(repr(mode) for mode in SOURCE_COLLECTORS)))
+        self.__source_collector = source_collector_class()
+
+        if Intern not in StringInterner.MODES:
+            raise ValueError('Unknown intern mode %r, available ones are: %s'
+                             % (Intern, ', '.join(repr(mode) for mode in StringInterner.MODES)))
+        self.__interner = StringInterner(Shared=Intern == 'global') if Intern else None
 
         # Internal attributes, store references of current processed abap objects
-        self.__current_source_code_reference = None
         self.__current_text_pool_reference = None
         self.__current_class_documentation_reference = None
         self.__current_text_language = None
         self.__current_message_class = None
 
-        # Helper attributes
-        self.__current_tag = None
-        self.__current_tag_stack = []
-
         # Decoupled parsers
         self.__programs_parser = handlers.Program(owner=self)
-        self._matrix_element_case_handler.update(self.__programs_parser.map_parse())
+        self.__register_handler(self.__programs_parser)
         self.__ddic_parser = handlers.DDIC(owner=self)
-        self._matrix_element_case_handler.update(self.__ddic_parser.map_parse())
+        self.__register_handler(self.__ddic_parser)
         self.__class_library_parser = handlers.ClassLibrary(owner=self)
-        self._matrix_element_case_handler.update(self.__class_library_parser.map_parse())
+        self.__register_handler(self.__class_library_parser)
         self.__function_group_parser = handlers.FunctionGroup(owner=self)
-        self._matrix_element_case_handler.update(self.__function_group_parser.map_parse())
+        self.__register_handler(self.__function_group_parser)
+
+        # Helper attributes
+        self.__object_types = frozenset(self._matrix_object_name_attribute)
+        if IncludeTypes is not None:
+            IncludeTypes = frozenset(object_type.upper() for object_type in IncludeTypes)
+            unknown_types = IncludeTypes - self.__object_types
+            if unknown_types:
+                raise ValueError('Unknown object types %s, available ones are: %s'
+                                 % (', '.join(sorted(unknown_types)), ', '.join(sorted(self.__object_types))))
+            self.__object_types = IncludeTypes
+        self.__name_filter = NameFilter
+        self.__state = _DispatchState.compile(self.__select_paths(),
+                                              frozenset(self._matrix_object_name_attribute) - self.__object_types)
+        """State of the current element, its transitions lead to the states of child elements."""
+        self.__state_stack = [self.__state]
+        self.__current_characters_handler = None
+        self.__unhandled_depth = 0
+        """Depth inside an unhandled (or filtered out) subtree, which is skipped until its end."""
+        self.__skipped_state = None
+        self.__unhandled_path = None
+        self.__unhandled_byte_index = None
+        self.__byte_index_provider = None
+        self.__end_byte_index_provider = None
 
     @property
     def abapClasses(self):
@@ -113,34 +142,200 @@ class SAPLinkContentHandle(xml.sax.ContentHandler):
     def abapPrograms(self):
         return self.__programs_parser.parsed_programs
 
+    @property
+    def parseReport(self):
+        if self.__interner is not None:
+            self.__parse_report.set_interning(Total=self.__interner.total,
+                                              Distinct=self.__interner.distinct)
+        return self.__parse_report
+
+    @property
+    def objectTypes(self):
+        """
+        Object types (top level tags) being parsed.
+        """
+        return self.__object_types
+
+    @property
+    def objectNameAttributes(self):
+        """
+        Attribute holding the name of each object type declared by handlers (parsed or not),
+        by tag.
+        """
+        return dict(self._matrix_object_name_attribute)
+
+    def store_object(self, container, name, abap_object):
+        """
+        Stores an object whose parsing is complete, or queues it to be drained when streaming.
+
+        :param container: dictionary of parsed objects of that type, by name.
+        """
+        if self.__streaming:
+            self.__streamed_objects.append(abap_object)
+        else:
+            container[name] = abap_object
+
+    def drain_objects(self):
+        """
+        Returns the objects completed since the last call, when streaming.
+        """
+        streamed_objects = self.__streamed_objects
+        self.__streamed_objects = []
+        return streamed_objects
+
+    def set_byte_index_provider(self, provider, end_provider=None):
+        """
+        Sets a callable returning the file position (in bytes) of the current event, provided by
+        XML backends able to tell it.
+
+        :param end_provider: callable returning the file position right after the end tag of
+            the element being closed.
+        """
+        self.__byte_index_provider = provider
+        self.__end_byte_index_provider = end_provider
+
+    def set_source_buffer(self, Buffer, Encoding):
+        """
+        Sets the raw contents of the file being parsed, from where source code is read lazily.
+
+        :param Buffer: file contents supporting slicing, like :class:`mmap.mmap`.
+        :param Encoding: Python codec name of the file's encoding, which must be ASCII compatible.
+        """
+        self.__source_collector.set_source_buffer(Buffer=Buffer,
+                                                  Encoding=Encoding,
+                                                  ByteIndexProvider=self.__byte_index,
+                                                  EndByteIndexProvider=self.__end_byte_index)
+
     def startElement(self, name, attrs):
         """Parses start element"""
-        # Upper case on name because SAPLINK haven't used same case on all elements.
-        self.__current_tag = name.upper()
-        self.__current_tag_stack.append(self.__current_tag)
-        start_element_handler = self._matrix_element_case_handler.get(self.__current_tag, self.__unhandled_element)[0]
-        if start_element_handler is not None:
-            start_element_handler(name.upper(), attrs)
+        if self.__unhandled_depth:
+            self.__unhandled_depth += 1
+            return
+        state = self.__state.transitions.get(name) or self.__state.transition(name)
+        if state.skip:
+            self.__unhandled_depth = 1
+            self.__skipped_state = state
+            self.__current_characters_handler = None
+            if state is _UNHANDLED:
+                self._startUnhandled(name, attrs)
+            return
+        self.__state_stack.append(state)
+        self.__state = state
+        self.__current_characters_handler = state.characters
+        if state.start is not None:
+            if self.__interner is not None:
+                attrs = self.__interner.attributes(attrs)
+            state.start(state.tag, attrs)
 
     def characters(self, content):
         """
         Parses inner contents of current element.
         This method is called for each new line inside that element.
         """
-        characters_handler = self._matrix_element_case_handler.get(self.__current_tag, self.__unhandled_element)[1]
+        characters_handler = self.__current_characters_handler
         if characters_handler is not None:
             characters_handler(content)
 
     def endElement(self, name):
         """Parses end of element."""
-        if self.__current_tag != name.upper():
-            self.__logger.error('ERROR parsing file, current element was %s but closing element was %s' , self.__current_tag, name.upper())
-        end_element_handler = self._matrix_element_case_handler.get(self.__current_tag, self.__unhandled_element)[2]
-        if end_element_handler is not None:
-            end_element_handler(name.upper())
-        self.__current_tag_stack.pop()
-        # FIXME: Append None to currentTagStack to avoid little hack?
-        self.__current_tag = self.__current_tag_stack[-1] if len(self.__current_tag_stack) > 0 else None
+        if self.__unhandled_depth:
+            self.__unhandled_depth -= 1
+            if not self.__unhandled_depth:
+                if self.__skipped_state is _UNHANDLED:
+                    self._endUnhandled(name)
+                self.__current_characters_handler = self.__state.characters
+            return
+        state = self.__state_stack.pop()
+        if state.end is not None:
+            state.end(state.tag)
+        self.__state = self.__state_stack[-1]
+        self.__current_characters_handler = self.__state.characters
+
+    def skip_subtree(self):
+        """
+        Skips the rest of the element just started, to be called by its start handler.
+        """
+        self.__state_stack.pop()
+        self.__state = self.__state_stack[-1]
+        self.__unhandled_depth = 1
+        self.__skipped_state = _FILTERED
+        self.__current_characters_handler = None
+
+    def __register_handler(self, handler):
+        path_handlers = handler.map_parse()
+        for path in path_handlers:
+            if path in self._matrix_element_path_handler:
+                raise ValueError('Element path %s is already handled' % path)
+        self._matrix_element_path_handler.update(path_handlers)
+        self._matrix_object_name_attribute.update(handler.map_objects())
+
+    def __select_paths(self):
+        """
+        Element paths of the object types being parsed, with the name filter applied on the
+        start of objects and source code elements adapted to the source collector.
+        """
+        excluded_types = frozenset(self._matrix_object_name_attribute) - self.__object_types
+        path_handlers = {
+            path: handlers for path, handlers in self._matrix_element_path_handler.items()
+            if path.split('/', 1)[0] not in excluded_types
+        }
+        text_characters_handlers = (self.__source_collector.characters, self.charactersSourceCode)
+        for path, handlers in path_handlers.items():
+            if handlers[1] in text_characters_handlers:
+                path_handlers[path] = self.__source_collector.map_text_element(handlers)
+        if self.__name_filter is not None:
+            for object_type in self.__object_types:
+                start_handler, characters_handler, end_handler = path_handlers[object_type]
+                path_handlers[object_type] = [
+                    self.__filter_object(start_handler, self._matrix_object_name_attribute[object_type]),
+                    characters_handler,
+                    end_handler
+                ]
+        return path_handlers
+
+    def __filter_object(self, start_handler, name_attribute):
+        name_filter = self.__name_filter
+
+        def start_filtered_object(name, attrs):
+            if name_filter(attrs.get(name_attribute, '')):
+                start_handler(name, attrs)
+            else:
+                self.skip_subtree()
+        return start_filtered_object
+
+    def map_source_code(self):
+        """
+        Elements of source code, to be mounted by handlers inside their objects.
+        """
+        return {
+            'SOURCE': [
+                self._startSourceCode,
+                self.__source_collector.characters,
+                self._endSourceCode
+            ],
+        }
+
+    def map_text_pool(self):
+        """
+        Elements of text pool, to be mounted by handlers inside their objects.
+        """
+        return {
+            'TEXTPOOL': [
+                self._startTextPool,
+                None,
+                self._endTextPool
+            ],
+            'TEXTPOOL/LANGUAGE': [
+                self._startTextLanguage,
+                None,
+                self._endTextLanguage
+            ],
+            'TEXTPOOL/LANGUAGE/TEXTELEMENT': [
+                self._startTextPoolTextElement,
+                None,
+                self._endTextPoolTextElement
+            ],
+        }
 
     # Below are declared method to properly handle elements and its contents
 
@@ -159,7 +354,7 @@ class SAPLinkContentHandle(xml.sax.ContentHandler):
 
     def _endMessageClass(self, name):
         msg_class = self.__current_message_class
-        self._abap_message_classes[msg_class.name] = msg_class
+        self.store_object(self._abap_message_classes, msg_class.name, msg_class)
         self.__current_message_class = None
 
     def _startMessageClassMessage(self, name, attrs):
@@ -180,11 +375,8 @@ class SAPLinkContentHandle(xml.sax.ContentHandler):
     def _startSourceCode(self, name, attrs):
         self.__logger.debug('Start Source Code')
 
-    def _charactersSourceCode(self, content):
-        self.__current_source_code_reference.source_code.append(content)
-
     def charactersSourceCode(self, content):
-        self._charactersSourceCode(content)
+        self.__source_collector.characters(content)
 
     def _endSourceCode(self, name):
         self.__logger.debug('End Source Code')
@@ -198,9 +390,6 @@ class SAPLinkContentHandle(xml.sax.ContentHandler):
         elif self.__current_class_documentation_reference is not None:
             self.__current_class_documentation_reference.languageMappint[self.__current_text_language] = []
 
-    def _charactersTextLanguage(self, content):
-        pass
-
     def _endTextLanguage(self, name):
         self.__logger.debug('End Text Language')
         self.__current_text_language = None
@@ -208,9 +397,6 @@ class SAPLinkContentHandle(xml.sax.ContentHandler):
     def _startTextPool(self, name, attrs):
         self.__logger.debug('Start Text Pool')
 
-    def _charactersTextPool(self, content):
-        pass
-
     def _endTextPool(self, name):
         self.__logger.debug('End Text Pool')
 
@@ -230,34 +416,110 @@ class SAPLinkContentHandle(xml.sax.ContentHandler):
         else:
             self.__logger.warning('[FIXME] A text pool''s entry "%s" was found but the current abap object wasn''t expecting a text pool.', entry)
 
-    def _charactersTextPoolTextElement(self, content):
-        pass
-
     def _endTextPoolTextElement(self, name):
         self.__logger.debug('End Text Pool Text Element')
 
     def _startUnhandled(self, name, attrs):
-        self.__logger.warning('Start of an unhandled element: %s', name)
-
-    def _charactersUnhandled(self, content):
-        self.__logger.warning('Content of unhandled tag: %s', content)
+        context = self.__state.path
+        self.__unhandled_path = context + '/' + name.upper() if context else name.upper()
+        self.__unhandled_byte_index = self.__byte_index()
 
     def _endUnhandled(self, name):
-        self.__logger.warning('End of an unhandled element: %s', name)
+        byte_volume = None
+        byte_index = self.__end_byte_index()
+        if byte_index is not None and self.__unhandled_byte_index is not None:
+            byte_volume = byte_index - self.__unhandled_byte_index
+        self.__parse_report.add_unhandled(Path=self.__unhandled_path, ByteVolume=byte_volume)
+
+    def __byte_index(self):
+        if self.__byte_index_provider is None:
+            return None
+        return self.__byte_index_provider()
+
+    def __end_byte_index(self):
+        if self.__end_byte_index_provider is None:
+            return None
+        return self.__end_byte_index_provider()
 
     def set_current_source_code_reference(self, source_reference):
-        self.__current_source_code_reference = source_reference
-        source_reference.source_code = []
+        self.__source_collector.start(source_reference)
 
     def finalize_source_code(self):
         """
-        Join the source code's array into a string, and clean it's reference from parser.
+        Store the collected source code on its reference, and clean it's reference from parser.
+        """
+        self.__source_collector.end()
+
+    def finish(self):
+        """
+        Tells the whole file was parsed.
         """
-        self.__current_source_code_reference.source_code = ''.join(self.__current_source_code_reference.source_code)
-        self.__current_source_code_reference = None
+        self.__source_collector.finish()
 
     def set_current_textpool_reference(self, textpool_reference):
         self.__current_text_pool_reference = textpool_reference
 
     def finalize_textpool(self):
         self.__current_text_pool_reference = None
+
+
+class _DispatchState(object):
+    """
+    State of the parser while inside an element, compiled from the declared element paths.
+    """
+
+    __slots__ = ('tag', 'path', 'skip', 'start', 'characters', 'end', 'children', 'transitions')
+
+    def __init__(self, tag=None, path='', skip=False):
+        self.tag = tag
+        self.path = path
+        """Element path, as declared by handlers."""
+        self.skip = skip
+        """Tells the element is skipped with all its subtree."""
+        self.start = None
+        self.characters = None
+        self.end = None
+        self.children = {}
+        """Declared child states, by upper case tag."""
+        self.transitions = {}
+        """Child states by each tag spelling seen on file, filled on its first occurrence."""
+
+    def transition(self, name):
+        """
+        Resolves the child state of a tag spelling, caching it for next occurrences.
+        """
+        # Upper case on name because SAPLINK haven't used same case on all elements.
+        state = self.children.get(name.upper(), _UNHANDLED)
+        self.transitions[name] = state
+        return state
+
+    @classmethod
+    def compile(cls, path_handlers, filtered_types=()):
+        """
+        Builds the state table from element paths, returning the state of document root.
+
+        Top level objects are accepted both as children of nugget element and as root element.
+        Objects of filtered types are skipped (without being reported as unhandled).
+        """
+        nugget = cls('NUGGET')
+        for object_type in filtered_types:
+            nugget.children[object_type] = _FILTERED
+        for path, handlers in path_handlers.items():
+            state = nugget
+            for tag in path.split('/'):
+                child = state.children.get(tag)
+                if child is None:
+                    child = state.children[tag] = cls(tag, state.path + '/' + tag if state.path else tag)
+                state = child
+            state.start, state.characters, state.end = handlers
+        root = cls()
+        root.children.update(nugget.children)
+        root.children[nugget.tag] = nugget
+        return root
+
+
+_UNHANDLED = _DispatchState(skip=True)
+"""State of elements not declared on their context."""
+
+_FILTERED = _DispatchState(skip=True)
+"""State of objects filtered out by type."""
@@ -5,37 +5,237 @@ Created on 17/06/2015
 '''
 
 import codecs
-import xml.sax
+import fnmatch
+import io
+import itertools
+import logging
+import os
+import zipfile
+import slpyser.xmlparser.backends as backends
 
-from xml.sax._exceptions import SAXParseException
+from slpyser.xmlparser.Compression import Compression
+from slpyser.xmlparser.EncodingDetector import EncodingDetector
+from slpyser.xmlparser.MappedFile import MappedFile
 from slpyser.xmlparser.SAPLinkContentHandle import SAPLinkContentHandle
 
 
+class ParseCancelled(Exception):
+    """
+    Raised by a parsing which was cancelled before reaching the end of file.
+    """
+    pass
+
+
 class SapLinkFileParser(object):
     """
     Parser implementation.
     It do the dirty job of open file, use custom Content handle to parse
     SAPLink syntax and output all recognizable objects from that file.
+
+    Files compressed with gzip, bz2 or xz are decompressed while parsed, and a zip archive
+    holding a single file has that file parsed (see :func:`slpyser.parse_archive` for others).
     """
 
-    def __init__(self, FilePath):
+    CHUNK_SIZE = 1024 * 1024
+    """Amount of bytes read from file and fed into XML parser at once."""
+
+    def __init__(self, FilePath=None, Encoding=None, Backend=backends.DEFAULT_BACKEND, Streaming=False,
+                 IncludeTypes=None, NameFilter=None, Sources=True, Data=None, Stream=None,
+                 Cancel=None, Intern=False):
         """
         This constructor already do the parsing, less work for you!
+        Unless it's streaming, then parsing happens while iterating :meth:`iterObjects`.
+
+        :param FilePath: path of the SAPLink file. Either it, ``Data`` or ``Stream`` is informed.
+        :param Encoding: encoding used to decode the file, overriding the detected one.
+        :param Backend: name of the XML parser backend, see :data:`slpyser.xmlparser.backends.BACKENDS`.
+        :param Streaming: parsed objects are yielded by :meth:`iterObjects` as soon as they're
+            complete, instead of being kept until the end of file.
+        :param IncludeTypes: object types (e.g. 'CLAS', 'PROG') to be parsed, other objects are
+            skipped without being built.
+        :param NameFilter: callable receiving an object name and telling if it's parsed, or a
+            shell-style pattern (e.g. 'ZCL_*') object names must match.
+        :param Sources: how source code is kept: True keeps its text, False keeps only its
+            length and line count, 'lazy' keeps its position to read it from a memory mapped
+            file on first access, 'arena' keeps its text in a buffer shared by the whole parse,
+            'compressed' keeps it compressed until accessed.
+        :param Data: contents of the SAPLink file, as bytes or any object exposing the buffer
+            protocol (like :class:`mmap.mmap`), fed into XML parser without being copied.
+        :param Stream: binary file-like object, from where SAPLink file is read in chunks.
+        :param Cancel: event (like :class:`threading.Event`) checked before each chunk is parsed,
+            once it's set parsing stops raising :class:`ParseCancelled`.
+        :param Intern: attribute values are interned, so repeated ones share a single string:
+            True uses a table of this parse, 'global' shares them with other parses.
         """
+        if sum(source is not None for source in (FilePath, Data, Stream)) != 1:
+            raise ValueError('Exactly one of FilePath, Data or Stream must be informed')
+        self.__logger = logging.getLogger(__name__)
+        self.__backend_class = backends.BACKENDS.get(Backend)
+        if self.__backend_class is None:
+            raise ValueError('Unknown backend "%s", available ones are: %s'
+                             % (Backend, ', '.join(sorted(backends.BACKENDS))))
+        if not self.__backend_class.is_available():
+            self.__logger.warning('Backend "%s" is not available, using "%s" instead.',
+                                  Backend, backends.DEFAULT_BACKEND)
+            self.__backend_class = backends.BACKENDS[backends.DEFAULT_BACKEND]
 
-        parser = xml.sax.make_parser()
-        # turn off namepsaces
-        parser.setFeature(xml.sax.handler.feature_namespaces, 0)
+        self.__file_path = FilePath
+        self.__data = Data
+        self.__stream = Stream
+        self.__archive_member = None
+        self.__cancel = Cancel
+        self.__encoding = Encoding
+        self.__sources = Sources
+        self.__mapped_file = None
         # override handler
-        self.__handler = SAPLinkContentHandle()
-        parser.setContentHandler(self.__handler)
+        if isinstance(NameFilter, str):
+            pattern = NameFilter
+            NameFilter = lambda name: fnmatch.fnmatchcase(name, pattern)
+        self.__handler = SAPLinkContentHandle(Streaming=Streaming,
+                                              IncludeTypes=IncludeTypes,
+                                              NameFilter=NameFilter,
+                                              Sources=Sources,
+                                              Intern=Intern)
+        if not Streaming:
+            for _ in self.iterObjects():
+                pass
+
+    def iterObjects(self):
+        """
+        Parses the file, yielding each object once its parsing is complete when streaming.
+        """
+        if self.__data is not None:
+            with memoryview(self.__data) as view:
+                head = view[:max(EncodingDetector.SNIFF_SIZE, self.CHUNK_SIZE)]
+                chunks = (view[offset:offset + self.CHUNK_SIZE]
+                          for offset in range(len(head), len(view), self.CHUNK_SIZE))
+                archive = lambda: io.BytesIO(self.__data)
+                for abap_object in self.__parse(head, chunks, archive, self.__data):
+                    yield abap_object
+        elif self.__stream is not None:
+            for abap_object in self.__parse_stream(self.__stream):
+                yield abap_object
+        else:
+            with open(self.__file_path, 'rb') as stream:
+                mapped_file = None
+                if self.__sources == 'lazy' and os.fstat(stream.fileno()).st_size:
+                    # The map outlives the file, until it's closed by its owner.
+                    mapped_file = MappedFile(stream)
+                complete = False
+                try:
+                    for abap_object in self.__parse_stream(stream, mapped_file):
+                        yield abap_object
+                    complete = True
+                finally:
+                    # Kept open only for the parsed file reading source code lazily from it,
+                    # not when parsing failed or was abandoned.
+                    if mapped_file is not None and (not complete or self.__mapped_file is not mapped_file):
+                        mapped_file.close()
+                        self.__mapped_file = None
+
+    def __parse_stream(self, stream, source_buffer=None):
+        head = stream.read(max(EncodingDetector.SNIFF_SIZE, self.CHUNK_SIZE))
+        if not isinstance(head, bytes):
+            raise TypeError('SAPLink file must be read as bytes, not %s' % type(head).__name__)
+        chunks = iter(lambda: stream.read(self.CHUNK_SIZE), b'')
+        return self.__parse(head, chunks, lambda: stream, source_buffer)
+
+    def __parse(self, head, chunks, archive, source_buffer=None):
+        """
+        Feeds all chunks of the file into XML parser, decoding them only once with the chosen
+        encoding, and yields objects drained from content handle after each chunk.
+
+        :param head: first chunk of the file, used to detect its compression and encoding.
+        :param chunks: remaining chunks of the file.
+        :param archive: callable returning the file as a seekable file object, used when it's
+            a zip archive.
+        :param source_buffer: raw file contents, from where source code is read lazily.
+        """
+        compression = Compression.detect(bytes(head[:Compression.MAGIC_SIZE]))
+        if compression == 'zip':
+            for abap_object in self.__parse_archive(archive()):
+                yield abap_object
+            return
+        if compression is not None:
+            chunks = Compression.decompress(itertools.chain((head,), chunks), compression,
+                                            self.CHUNK_SIZE)
+            head = next(chunks, b'')
+            while len(head) < EncodingDetector.SNIFF_SIZE:
+                chunk = next(chunks, None)
+                if chunk is None:
+                    break
+                head += chunk
+            source_buffer = None
+
+        if self.__encoding is None:
+            self.__encoding = EncodingDetector.detect(bytes(head[:EncodingDetector.SNIFF_SIZE]))
+        else:
+            self.__encoding = EncodingDetector.normalize(self.__encoding)
+        chunks = itertools.chain((head,), chunks)
+
+        expat_encoding = EncodingDetector.expat_encoding(self.__encoding)
+        transcoded = expat_encoding is None
+        if transcoded:
+            # Expat can't decode it by itself, so its contents are converted to UTF-8.
+            chunks = self.__transcode(chunks, self.__encoding)
+            expat_encoding = EncodingDetector.expat_encoding('utf-8')
+
+        backend = self.__backend_class(content_handle=self.__handler, encoding=expat_encoding)
+        if not transcoded:
+            # Positions on the converted contents aren't positions on the file.
+            self.__handler.set_byte_index_provider(backend.byte_index, backend.end_byte_index)
+        if self.__sources == 'lazy' and source_buffer is None:
+            self.__logger.warning('Source code can\'t be read lazily from a stream or a '
+                                  'compressed file, keeping it in memory.')
+        elif source_buffer is not None:
+            if backend.has_byte_index() and EncodingDetector.is_ascii_compatible(self.__encoding):
+                self.__handler.set_source_buffer(Buffer=source_buffer, Encoding=self.__encoding)
+                if isinstance(source_buffer, MappedFile):
+                    self.__mapped_file = source_buffer
+            else:
+                self.__logger.warning('Source code can\'t be read lazily with backend %s and '
+                                      'encoding %s, keeping it in memory.',
+                                      type(backend).__name__, self.__encoding)
         try:
-            parser.parse(FilePath)
-        except (SAXParseException, UnicodeDecodeError):
-            # Some plugins of SAPLink have encoding declared as UTF-16 but
-            # default parser can't open it.
-            # It opens OK using UTF-8
-            parser.parse(codecs.open(FilePath, 'r', 'utf-8'))
+            for chunk in chunks:
+                if self.__cancel is not None and self.__cancel.is_set():
+                    raise ParseCancelled('Parsing was cancelled')
+                backend.feed(chunk)
+                for abap_object in self.__handler.drain_objects():
+                    yield abap_object
+            backend.close()
+            self.__handler.finish()
+        finally:
+            self.__handler.set_byte_index_provider(None)
+        for abap_object in self.__handler.drain_objects():
+            yield abap_object
+
+        parse_report = self.__handler.parseReport
+        if parse_report.unhandled:
+            self.__logger.warning(parse_report.summary())
+
+    def __parse_archive(self, archive):
+        """
+        Parses the single file inside a zip archive.
+        """
+        if not getattr(archive, 'seekable', lambda: False)():
+            raise ValueError('Zip archives can only be parsed from seekable streams')
+        with zipfile.ZipFile(archive) as zip_file:
+            members = [member for member in zip_file.infolist() if not member.filename.endswith('/')]
+            if len(members) != 1:
+                raise ValueError('Zip archive holds %d files, use slpyser.parse_archive to parse '
+                                 'each one' % len(members))
+            self.__archive_member = members[0].filename
+            with zip_file.open(members[0]) as member:
+                for abap_object in self.__parse_stream(member):
+                    yield abap_object
+
+    @staticmethod
+    def __transcode(chunks, encoding):
+        decoder = codecs.getincrementaldecoder(encoding)()
+        for chunk in chunks:
+            yield decoder.decode(chunk).encode('utf-8')
+        yield decoder.decode(b'', True).encode('utf-8')
 
     def getAbapDictionary(self):
         """
@@ -49,6 +249,25 @@ class SapLinkFileParser(object):
 
         return self.__handler.abapClasses
 
+    def getArchiveMember(self):
+        """
+        Name of the file parsed inside a zip archive, None if the file isn't a zip archive.
+        """
+        return self.__archive_member
+
+    def getMappedFile(self):
+        """
+        :class:`~slpyser.xmlparser.MappedFile.MappedFile` from where source code is read lazily,
+        None when it isn't read from a memory map owned by the parser.
+        """
+        return self.__mapped_file
+
+    def getEncoding(self):
+        """
+        Encoding used to decode the file, either detected or overridden.
+        """
+        return self.__encoding
+
     def getFunctionGroups(self):
 
         return self.__handler.abapFunctionGroups
@@ -57,6 +276,13 @@ class SapLinkFileParser(object):
 
         return self.__handler.abapMessageClasses
 
+    def getParseReport(self):
+        """
+        Diagnostics collected while parsing.
+        """
+        return self.__handler.parseReport
+
     def getPrograms(self):
 
         return self.__handler.abapPrograms
+
@@ -0,0 +1,449 @@
+# -*- coding: utf-8 -*-
+"""
+Collectors of source code text, chosen by the ``sources`` mode of the parser.
+
+Source code is by far the biggest content of a SAPLink file, so how its text is kept decides
+most of the memory (and a good share of the CPU) used by a parse.
+"""
+
+import collections
+import re
+import threading
+import weakref
+import zlib
+
+from xml.parsers import expat
+
+from slpyser.xmlparser.EncodingDetector import EncodingDetector
+
+try:
+    import lz4.frame as lz4_frame
+except ImportError:
+    lz4_frame = None
+
+
+class SourceCollector(object):
+    """
+    Keeps the whole source code: text chunks are stacked and joined once its element ends.
+    """
+
+    def __init__(self):
+        self._reference = None
+        self.__chunks = None
+
+    def start(self, reference):
+        """
+        Starts collecting the text of a :class:`~slpyser.model.abap_objects.AbapSourceCode.AbapSourceCode`.
+        """
+        self._reference = reference
+        self.__chunks = []
+
+    def characters(self, content):
+        self.__chunks.append(content)
+
+    def end(self):
+        """
+        Stores the collected text on source code reference, and cleans it from collector.
+        """
+        self._reference.source_code = ''.join(self.__chunks)
+        self._reference = None
+        self.__chunks = None
+
+    def map_text_element(self, path_handlers):
+        """
+        Adapts the handlers of an element holding source code text, when the collector needs to
+        know its boundaries.
+        """
+        return path_handlers
+
+    def set_source_buffer(self, Buffer, Encoding, ByteIndexProvider, EndByteIndexProvider):
+        """
+        Informs the raw contents of the file being parsed, for collectors reading source code
+        straight from them, and callables telling the file position of the current event and
+        the one right after the end tag of the element being closed.
+        """
+        pass
+
+    def finish(self):
+        """
+        Tells the whole file was parsed, no more source code will be collected.
+        """
+        pass
+
+
+class SourceMetadataCollector(SourceCollector):
+    """
+    Keeps only length and line count of source code, its text is discarded as it's read.
+    """
+
+    def __init__(self):
+        super(SourceMetadataCollector, self).__init__()
+        self.__length = 0
+        self.__line_breaks = 0
+        self.__last_character = ''
+
+    def start(self, reference):
+        self._reference = reference
+        self.__length = 0
+        self.__line_breaks = 0
+        self.__last_character = ''
+
+    def characters(self, content):
+        if content:
+            self.__length += len(content)
+            self.__line_breaks += content.count('\n')
+            self.__last_character = content[-1]
+
+    def end(self):
+        line_count = self.__line_breaks
+        if self.__length and self.__last_character != '\n':
+            line_count += 1
+        self._reference.setMetadata(Length=self.__length, LineCount=line_count)
+        self._reference = None
+
+
+class LazySourceCollector(SourceCollector):
+    """
+    Keeps only the byte positions of source code elements: their text is read from the file
+    buffer, usually memory mapped, when the source code is first accessed.
+
+    Needs a buffer of the file with an ASCII compatible encoding and a backend telling byte
+    positions, otherwise whole source code is kept as :class:`SourceCollector` does.
+    """
+
+    def __init__(self):
+        super(LazySourceCollector, self).__init__()
+        self.__buffer = None
+        self.__encoding = None
+        self.__byte_index = None
+        self.__end_byte_index = None
+        self.__prolog_end = None
+        self.__segments = None
+        self.__element_start = None
+
+    def set_source_buffer(self, Buffer, Encoding, ByteIndexProvider, EndByteIndexProvider):
+        self.__buffer = Buffer
+        self.__encoding = Encoding
+        self.__byte_index = ByteIndexProvider
+        self.__end_byte_index = EndByteIndexProvider
+        self.__prolog_end = LazySource.prolog_end(Buffer)
+
+    def map_text_element(self, path_handlers):
+        start_handler, characters_handler, end_handler = path_handlers
+
+        def start_text_element(name, attrs):
+            if start_handler is not None:
+                start_handler(name, attrs)
+            if self.__buffer is not None:
+                self.__element_start = self.__byte_index()
+
+        def end_text_element(name):
+            if self.__buffer is not None and self.__segments is not None:
+                self.__segments.append((self.__element_start, self.__end_byte_index()))
+            if end_handler is not None:
+                end_handler(name)
+        return [start_text_element, characters_handler, end_text_element]
+
+    def start(self, reference):
+        if self.__buffer is None:
+            super(LazySourceCollector, self).start(reference)
+        else:
+            self._reference = reference
+            self.__segments = []
+
+    def characters(self, content):
+        if self.__buffer is None:
+            super(LazySourceCollector, self).characters(content)
+
+    def end(self):
+        if self.__buffer is None:
+            super(LazySourceCollector, self).end()
+        else:
+            self._reference.setLoader(LazySource(self.__buffer, self.__encoding, self.__prolog_end,
+                                                 tuple(self.__segments)))
+            self._reference = None
+            self.__segments = None
+
+
+class LazySource(object):
+    """
+    Reads source code from elements of a file buffer, feeding each element (after the prolog of
+    the file, with its declarations) into expat again, so text is reported as on parsing.
+    """
+
+    __slots__ = ('__buffer', '__encoding', '__prolog_end', '__segments')
+
+    __PROLOG = re.compile(br'(?:\xef\xbb\xbf)?(?:\s+|<\?.*?\?>|<!--.*?-->|<!DOCTYPE[^\[>]*(?:\[.*?\])?\s*>)*', re.S)
+
+    def __init__(self, buffer, encoding, prolog_end, segments):
+        """
+        :param buffer: file contents, supporting slicing (e.g. a
+            :class:`~slpyser.xmlparser.MappedFile.MappedFile`).
+        :param encoding: Python codec name of file's encoding.
+        :param prolog_end: byte position where the root element starts.
+        :param segments: byte positions where each element starts and where its end tag ends.
+        """
+        self.__buffer = buffer
+        self.__encoding = encoding
+        self.__prolog_end = prolog_end
+        self.__segments = segments
+
+    @classmethod
+    def prolog_end(cls, buffer):
+        """
+        Byte position where the root element of a file starts, in an ASCII compatible encoding.
+        """
+        head_size = 4096
+        while True:
+            head = buffer[:head_size]
+            end = cls.__PROLOG.match(head).end()
+            if end < len(head) or len(head) < head_size:
+                return end
+            head_size *= 4
+
+    def __call__(self):
+        texts = []
+        prolog = self.__buffer[:self.__prolog_end]
+        for element_start, element_end in self.__segments:
+            parser = expat.ParserCreate(EncodingDetector.expat_encoding(self.__encoding))
+            parser.buffer_text = True
+            parser.CharacterDataHandler = texts.append
+            parser.Parse(prolog, False)
+            parser.Parse(self.__buffer[element_start:element_end], True)
+        return ''.join(texts)
+
+
+class ArenaSourceCollector(SourceCollector):
+    """
+    Appends the text of all source code of a parse to a single :class:`SourceArena`, each
+    source code keeping just its position there.
+    """
+
+    def __init__(self):
+        super(ArenaSourceCollector, self).__init__()
+        self.__arena = SourceArena()
+        self.__offset = 0
+        self.__length = 0
+        self.__line_breaks = 0
+        self.__last_character = ''
+
+    def start(self, reference):
+        self._reference = reference
+        self.__offset = self.__arena.size
+        self.__length = 0
+        self.__line_breaks = 0
+        self.__last_character = ''
+
+    def characters(self, content):
+        if content:
+            self.__arena.append(content)
+            self.__length += len(content)
+            self.__line_breaks += content.count('\n')
+            self.__last_character = content[-1]
+
+    def end(self):
+        line_count = self.__line_breaks
+        if self.__length and self.__last_character != '\n':
+            line_count += 1
+        self._reference.setView(ArenaSource(self.__arena, self.__offset,
+                                            self.__arena.size - self.__offset, self.__length),
+                                LineCount=line_count)
+        self._reference = None
+
+    def finish(self):
+        self.__arena.close()
+
+
+class SourceArena(object):
+    """
+    Contiguous buffer with source code text, encoded as UTF-8.
+
+    While the parse goes on, text is appended and slices are copied on access. Once closed, the
+    buffer doesn't change anymore and slices are views of it, without copies.
+    """
+
+    __slots__ = ('__buffer', '__closed')
+
+    def __init__(self):
+        self.__buffer = bytearray()
+        self.__closed = False
+
+    @property
+    def size(self):
+        """
+        Amount of bytes in the arena.
+        """
+        return len(self.__buffer)
+
+    def append(self, text):
+        if self.__closed:
+            raise ValueError('Source arena is closed')
+        self.__buffer += text.encode('utf-8', 'surrogatepass')
+
+    def close(self):
+        """
+        Stops appending text, so slices can refer to the buffer.
+        """
+        self.__closed = True
+
+    def view(self, offset, size):
+        """
+        Read only :class:`memoryview` of bytes of the arena.
+        """
+        if self.__closed:
+            # Resizing a bytearray with exported views fails, which can't happen anymore.
+            return memoryview(self.__buffer)[offset:offset + size].toreadonly()
+        return memoryview(bytes(self.__buffer[offset:offset + size]))
+
+    def text(self, offset, size):
+        """
+        Text decoded from bytes of the arena.
+        """
+        return str(self.__buffer[offset:offset + size], 'utf-8', 'surrogatepass')
+
+
+class ArenaSource(object):
+    """
+    Position of a source code in a :class:`SourceArena`.
+    """
+
+    __slots__ = ('__arena', '__offset', '__size', '__length')
+
+    def __init__(self, arena, offset, size, length):
+        """
+        :param arena: arena holding the text.
+        :param offset: byte position where the text starts.
+        :param size: amount of bytes of the text.
+        :param length: amount of characters of the text.
+        """
+        self.__arena = arena
+        self.__offset = offset
+        self.__size = size
+        self.__length = length
+
+    @property
+    def length(self):
+        return self.__length
+
+    def text(self):
+        return self.__arena.text(self.__offset, self.__size)
+
+    def buffer(self):
+        return self.__arena.view(self.__offset, self.__size)
+
+
+class CompressedSourceCollector(SourceCollector):
+    """
+    Keeps each source code compressed, see :class:`CompressedSource`.
+    """
+
+    def end(self):
+        reference = self._reference
+        super(CompressedSourceCollector, self).end()
+        reference.setView(CompressedSource.compress(reference.source_code),
+                          LineCount=reference.line_count)
+
+
+class CompressedSource(object):
+    """
+    Source code text compressed with lz4 (when installed) or zlib, decompressed when accessed.
+
+    The most recently decompressed texts of the process are kept, so code reading the same
+    source code many times in a row doesn't pay for decompressing it again. They're kept by weak
+    references to their sources, so they go away with the parsed file.
+    """
+
+    __slots__ = ('__codec', '__data', '__length', '__weakref__')
+
+    CODECS = {'zlib': (zlib.compress, zlib.decompress)}
+    """Compression functions and their inverses, by codec name."""
+    if lz4_frame is not None:
+        CODECS['lz4'] = (lz4_frame.compress, lz4_frame.decompress)
+
+    CODEC = 'lz4' if lz4_frame is not None else 'zlib'
+    """Codec compressing new source code."""
+
+    RECENT_SIZE = 64
+    """Amount of decompressed texts kept."""
+
+    __recent = collections.OrderedDict()
+    __recent_lock = threading.Lock()
+    # References of collected sources whose text couldn't be removed at once, as the lock was held.
+    __forgotten = []
+
+    def __init__(self, codec, data, length):
+        """
+        :param codec: name of the codec, see :attr:`CODECS`.
+        :param data: compressed UTF-8 bytes of the text.
+        :param length: amount of characters of the text.
+        """
+        self.__codec = codec
+        self.__data = data
+        self.__length = length
+
+    @classmethod
+    def compress(cls, text):
+        compress = cls.CODECS[cls.CODEC][0]
+        return cls(cls.CODEC, compress(text.encode('utf-8', 'surrogatepass')), len(text))
+
+    @property
+    def length(self):
+        return self.__length
+
+    @property
+    def compressed_size(self):
+        """
+        Amount of bytes of compressed text.
+        """
+        return len(self.__data)
+
+    def text(self):
+        recent = self.__recent
+        with self.__recent_lock:
+            self.__remove_forgotten()
+            reference = weakref.ref(self)
+            text = recent.get(reference)
+            if text is not None:
+                recent.move_to_end(reference)
+                return text
+        text = str(self.__decompress(), 'utf-8', 'surrogatepass')
+        with self.__recent_lock:
+            recent[weakref.ref(self, CompressedSource.__forget)] = text
+            while len(recent) > self.RECENT_SIZE:
+                recent.popitem(last=False)
+        return text
+
+    def buffer(self):
+        return memoryview(self.__decompress()).toreadonly()
+
+    def __decompress(self):
+        return self.CODECS[self.__codec][1](self.__data)
+
+    @classmethod
+    def __forget(cls, reference):
+        """
+        Removes the text of a collected source. The garbage collector may run it while the lock
+        is held (even by the same thread), so it's left for the next access then.
+        """
+        if cls.__recent_lock.acquire(False):
+            try:
+                cls.__recent.pop(reference, None)
+            finally:
+                cls.__recent_lock.release()
+        else:
+            cls.__forgotten.append(reference)
+
+    @classmethod
+    def __remove_forgotten(cls):
+        while cls.__forgotten:
+            cls.__recent.pop(cls.__forgotten.pop(), None)
+
+
+SOURCE_COLLECTORS = {
+    True: SourceCollector,
+    False: SourceMetadataCollector,
+    'lazy': LazySourceCollector,
+    'arena': ArenaSourceCollector,
+    'compressed': CompressedSourceCollector,
+}
+"""Collectors available, by ``sources`` mode."""
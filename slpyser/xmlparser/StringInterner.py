@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+"""
+Interning of attribute values repeated across a SAPLink file.
+"""
+
+import sys
+
+
+class StringInterner(object):
+    """
+    Table of distinct attribute values found while parsing, so repeated values (exposures,
+    languages, users, type names like ``STRING``, ...) share a single string instead of each
+    element holding a fresh copy. Shared strings also compare faster, as equal ones are the
+    same object.
+    """
+
+    MODES = (False, True, 'global')
+    """Interning modes: disabled, with a table of its own for each parse or shared by all
+    parses of the process (through :func:`sys.intern`)."""
+
+    def __init__(self, Shared=False):
+        """
+        :param Shared: new values are interned with :func:`sys.intern`, so they're shared with
+            other parses (and with anything else interned by the process).
+        """
+        self.__table = {}
+        self.__shared = Shared
+        self.__total = 0
+
+    @property
+    def total(self):
+        """
+        Amount of values interned, repeated ones included.
+        """
+        return self.__total
+
+    @property
+    def distinct(self):
+        """
+        Amount of distinct values interned.
+        """
+        return len(self.__table)
+
+    def attributes(self, attrs):
+        """
+        Dictionary of element attributes (a mapping, like the ones given by XML backends) with
+        their values interned.
+        """
+        table = self.__table
+        interned_attrs = {}
+        for name, value in attrs.items():
+            interned = table.get(value)
+            if interned is None:
+                interned = table[value] = sys.intern(value) if self.__shared else value
+            interned_attrs[name] = interned
+        self.__total += len(interned_attrs)
+        return interned_attrs
@@ -0,0 +1,88 @@
+from abc import abstractmethod
+import abc
+import sys
+
+if sys.version_info >= (3, 4):
+    ABC = abc.ABC
+else:
+    ABC = abc.ABCMeta('ABC', (), {})
+
+class AbstractBackend(ABC):
+    """
+    Feeds the contents of a SAPLink file into a XML parser, which reports elements to a
+    :class:`~slpyser.xmlparser.SAPLinkContentHandle.SAPLinkContentHandle`.
+
+    File contents are pushed in chunks, so backends never need the whole file in memory.
+    """
+
+    # Start of an end tag and its closing character, in UTF-8 (and single byte encodings),
+    # UTF-16LE and UTF-16BE.
+    _END_TAGS = ((b'</', b'>'), (b'<\x00/\x00', b'>\x00'), (b'\x00<\x00/', b'\x00>'))
+
+    def __init__(self,
+                 content_handle,
+                 encoding):
+        """
+        :param content_handle: :class:`~slpyser.xmlparser.SAPLinkContentHandle.SAPLinkContentHandle` object.
+        :param encoding: expat name of the encoding used to decode the chunks, overriding the one
+            declared on file.
+        """
+        self._content_handle = content_handle
+        self._encoding = encoding
+
+    @classmethod
+    def is_available(cls):
+        """
+        Tells if the libraries needed by this backend are installed.
+        """
+        return True
+
+    @classmethod
+    def has_byte_index(cls):
+        """
+        Tells if :meth:`byte_index` reports the file position of each event while it happens.
+        """
+        return False
+
+    def byte_index(self):
+        """
+        File position (in bytes) of the event being reported to the content handle, or None if
+        the backend can't tell it.
+        """
+        return None
+
+    def end_byte_index(self):
+        """
+        File position (in bytes) right after the end tag of the element being closed, to be
+        called while its end is reported, or None if the backend can't tell it.
+        """
+        return None
+
+    @classmethod
+    def _end_tag_end(cls, byte_index, context):
+        """
+        Position right after the end tag reported at a byte index, from the input context of
+        expat at that event (its input from the current event on).
+
+        Expat reports the end of an empty element tag (``<tag/>``) once the tag was consumed,
+        at the position where the end tag would start otherwise.
+        """
+        if context is not None:
+            for end_tag, close in cls._END_TAGS:
+                if context.startswith(end_tag):
+                    return byte_index + context.index(close, len(end_tag)) + len(close)
+        return byte_index
+
+    @abstractmethod
+    def feed(self, data):
+        """
+        Parses the next chunk (bytes) of the file.
+        """
+        pass
+
+    @abstractmethod
+    def close(self):
+        """
+        Signals the end of file, finishing the parsing.
+        """
+        pass
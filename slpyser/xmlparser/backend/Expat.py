@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+"""
+Backend driving :mod:`pyexpat` directly, without the :mod:`xml.sax` layer.
+"""
+
+from xml.parsers import expat
+
+from .AbstractBackend import AbstractBackend
+
+
+class ExpatBackend(AbstractBackend):
+    """
+    Binds the content handle methods straight into expat callbacks.
+
+    Compared to :class:`~slpyser.xmlparser.backend.Sax.SaxBackend`, there is no intermediate
+    method call per event and attributes are handed over as plain dictionaries instead of
+    being wrapped into an ``AttributesImpl`` object for each element. Text is buffered by expat,
+    so contiguous character data is reported in a single call.
+    """
+
+    BUFFER_SIZE = 256 * 1024
+    """Size of expat's character data buffer."""
+
+    def __init__(self, content_handle, encoding):
+        super(ExpatBackend, self).__init__(content_handle=content_handle, encoding=encoding)
+        parser = expat.ParserCreate(encoding)
+        parser.buffer_text = True
+        parser.buffer_size = self.BUFFER_SIZE
+        parser.ordered_attributes = False
+        parser.StartElementHandler = content_handle.startElement
+        parser.CharacterDataHandler = content_handle.characters
+        parser.EndElementHandler = content_handle.endElement
+        self.__parser = parser
+
+    @classmethod
+    def has_byte_index(cls):
+        return True
+
+    def byte_index(self):
+        return self.__parser.CurrentByteIndex
+
+    def end_byte_index(self):
+        parser = self.__parser
+        return self._end_tag_end(parser.CurrentByteIndex, parser.GetInputContext())
+
+    def feed(self, data):
+        self.__parser.Parse(data, False)
+
+    def close(self):
+        self.__parser.Parse(b'', True)
+        # Break the reference cycle between expat callbacks and the content handle.
+        self.__parser = None
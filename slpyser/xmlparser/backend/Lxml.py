@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+"""
+Backend using :mod:`lxml`, when it's installed.
+"""
+
+from .AbstractBackend import AbstractBackend
+
+try:
+    from lxml import etree
+except ImportError:
+    etree = None
+
+
+class LxmlBackend(AbstractBackend):
+    """
+    Tokenizes the file with lxml's pull parser, following the start and end of elements only
+    to know their depth.
+
+    Once a top level element is complete, its subtree is replayed into the content handle (so
+    the same handlers build the model objects) and then cleared, together with any sibling
+    already processed. Memory usage is bounded by the biggest object of the file, not the file
+    itself. Elements of types not being parsed are skipped by the content handle, so only their
+    start and end are replayed.
+
+    A root element which is an object itself (a single object file, like SAPLink ``.slnk``
+    files) has each of its children replayed in full instead.
+    """
+
+    def __init__(self, content_handle, encoding):
+        super(LxmlBackend, self).__init__(content_handle=content_handle, encoding=encoding)
+        self.__parser = etree.XMLPullParser(events=('start', 'end'),
+                                            encoding=encoding,
+                                            huge_tree=True)
+        self.__object_types = content_handle.objectTypes
+        self.__depth = 0
+        self.__root_object = False
+
+    @classmethod
+    def is_available(cls):
+        return etree is not None
+
+    def feed(self, data):
+        # lxml accepts only bytes, not other buffers like memoryview.
+        self.__parser.feed(bytes(data))
+        self.__process_events()
+
+    def close(self):
+        self.__parser.close()
+        self.__process_events()
+        self.__parser = None
+
+    def __process_events(self):
+        handle = self._content_handle
+        depth = self.__depth
+        for event, element in self.__parser.read_events():
+            if event == 'start':
+                depth += 1
+                if depth == 1:
+                    self.__root_object = element.tag.upper() in self.__object_types
+                    handle.startElement(element.tag, element.attrib)
+                continue
+            depth -= 1
+            if depth == 0:
+                handle.endElement(element.tag)
+            elif depth == 1:
+                if self.__root_object or element.tag.upper() in self.__object_types:
+                    self.__replay(element)
+                else:
+                    handle.startElement(element.tag, element.attrib)
+                    handle.endElement(element.tag)
+                element.clear()
+                parent = element.getparent()
+                while element.getprevious() is not None:
+                    del parent[0]
+        self.__depth = depth
+
+    def __replay(self, element):
+        """
+        Reports an element and its subtree to the content handle.
+        """
+        handle = self._content_handle
+        handle.startElement(element.tag, element.attrib)
+        if element.text:
+            handle.characters(element.text)
+        for child in element:
+            if isinstance(child.tag, str):
+                self.__replay(child)
+            if child.tail:
+                handle.characters(child.tail)
+        handle.endElement(element.tag)
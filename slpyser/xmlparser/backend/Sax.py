@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+"""
+Backend using the standard :mod:`xml.sax` interface.
+"""
+
+import xml.sax
+
+from xml.parsers import expat
+from xml.sax import xmlreader
+from .AbstractBackend import AbstractBackend
+
+
+class SaxBackend(AbstractBackend):
+    """
+    Drives a SAX incremental reader, which reports elements through the ContentHandler
+    interface.
+    """
+
+    def __init__(self, content_handle, encoding):
+        super(SaxBackend, self).__init__(content_handle=content_handle, encoding=encoding)
+        self.__parser = _ExpatReader()
+        self.__parser.setContentHandler(content_handle)
+        source = xmlreader.InputSource()
+        source.setEncoding(encoding)
+        self.__parser.prepareParser(source)
+
+    @classmethod
+    def has_byte_index(cls):
+        return True
+
+    def byte_index(self):
+        return self.__parser.getByteIndex()
+
+    def end_byte_index(self):
+        return self._end_tag_end(self.__parser.getByteIndex(), self.__parser.getInputContext())
+
+    def feed(self, data):
+        self.__parser.feed(data)
+
+    def close(self):
+        self.__parser.close()
+
+
+class _ExpatReader(xmlreader.IncrementalParser, xmlreader.Locator):
+    """
+    SAX incremental reader built on :mod:`pyexpat`, without namespace processing.
+
+    Unlike the reader of :mod:`xml.sax.expatreader`, it honors the encoding of the InputSource
+    given to :meth:`prepareParser` when it's fed incrementally, and tells the byte position of
+    the current event.
+    """
+
+    def __init__(self):
+        xmlreader.IncrementalParser.__init__(self)
+        self.__parser = None
+        self.__system_id = None
+        self.__public_id = None
+
+    def prepareParser(self, source):
+        self.__system_id = source.getSystemId()
+        self.__public_id = source.getPublicId()
+        # Element names are interned by expat, as the standard reader does.
+        parser = expat.ParserCreate(source.getEncoding(), intern={})
+        parser.ordered_attributes = False
+        parser.StartElementHandler = self.__start_element
+        parser.EndElementHandler = self.__end_element
+        parser.CharacterDataHandler = self.__characters
+        parser.ProcessingInstructionHandler = self.__processing_instruction
+        self.__parser = parser
+        handler = self.getContentHandler()
+        handler.setDocumentLocator(self)
+        handler.startDocument()
+
+    def feed(self, data):
+        try:
+            self.__parser.Parse(data, False)
+        except expat.ExpatError as error:
+            self.__fail(error)
+
+    def close(self):
+        try:
+            self.__parser.Parse(b'', True)
+        except expat.ExpatError as error:
+            self.__fail(error)
+        self.getContentHandler().endDocument()
+        # Break the reference cycle between expat callbacks and the reader.
+        self.__parser = None
+
+    def reset(self):
+        self.__parser = None
+
+    def getByteIndex(self):
+        """
+        File position (in bytes) of the current event.
+        """
+        return self.__parser.CurrentByteIndex
+
+    def getInputContext(self):
+        """
+        Input of the parser from the current event on, see
+        :meth:`xml.parsers.expat.xmlparser.GetInputContext`.
+        """
+        return self.__parser.GetInputContext()
+
+    def getColumnNumber(self):
+        return self.__parser.CurrentColumnNumber if self.__parser is not None else None
+
+    def getLineNumber(self):
+        return self.__parser.CurrentLineNumber if self.__parser is not None else 1
+
+    def getPublicId(self):
+        return self.__public_id
+
+    def getSystemId(self):
+        return self.__system_id
+
+    def __fail(self, error):
+        exception = xml.sax.SAXParseException(expat.ErrorString(error.code), error, self)
+        self.getErrorHandler().fatalError(exception)
+
+    def __start_element(self, name, attrs):
+        self.getContentHandler().startElement(name, xmlreader.AttributesImpl(attrs))
+
+    def __end_element(self, name):
+        self.getContentHandler().endElement(name)
+
+    def __characters(self, content):
+        self.getContentHandler().characters(content)
+
+    def __processing_instruction(self, target, data):
+        self.getContentHandler().processingInstruction(target, data)
@@ -0,0 +1,5 @@
+"""
+Implementation of backends which drive a XML parser over SAPLink files.
+
+Every backend should inherit the :py:class:AbstractBackend class
+"""
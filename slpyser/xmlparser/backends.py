@@ -0,0 +1,13 @@
+# Make backends available in the slpyser.xmlparser namespace
+from slpyser.xmlparser.backend.Sax import SaxBackend as Sax
+from slpyser.xmlparser.backend.Expat import ExpatBackend as Expat
+from slpyser.xmlparser.backend.Lxml import LxmlBackend as Lxml
+
+BACKENDS = {
+    'sax': Sax,
+    'expat': Expat,
+    'lxml': Lxml,
+}
+"""Backends selectable by name when parsing a file."""
+
+DEFAULT_BACKEND = 'sax'
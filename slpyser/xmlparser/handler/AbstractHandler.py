@@ -20,11 +20,32 @@ class AbstractHandler(ABC):
     @abstractmethod
     def map_parse(self):
         """
-        Should return a Dictionary which maps a tag with three methods to be run at:
+        Should return a Dictionary which maps an element path with three methods to be run at:
         * Start of an element (handles the attributes)
         * Characters of an element (handles all the caracters inside that element which doesn't do part in a nested element)
         * End of an element.
 
+        Element paths are the upper case tags from the top level object down to the element,
+        separated by '/' (e.g. 'CLAS/METHOD/PARAMETER'), so each element is only handled on the
+        context it belongs to.
+
         :rtype: Dictionary
         """
         pass
+
+    def map_objects(self):
+        """
+        Should return a Dictionary which maps the object types (top level tags) created by this
+        handler with the attribute holding their name, allowing them to be filtered.
+
+        :rtype: Dictionary
+        """
+        return {}
+
+    @staticmethod
+    def _mount(context, path_handlers):
+        """
+        Prefixes all element paths with a context path, e.g. to place the owner's source code
+        or text pool elements inside an object.
+        """
+        return {context + '/' + path: handlers for path, handlers in path_handlers.items()}
@@ -22,14 +22,15 @@ class ClassLibraryHandler(AbstractHandler):
     def parsed_classes(self):
         return self.__abap_classes
 
-    def map_parse(self):
+    def map_objects(self):
         return {
-            # Classes specific elements
-            'CLAS': [
-                self._startClass,
-                None,
-                self._endClass
-            ],
+            'CLAS': 'CLSNAME',
+            'INTF': 'CLSNAME',
+        }
+
+    def map_parse(self):
+        # Class and interface share their components
+        components = {
             'CLASSDOCUMENTATION': [
                 None,
                 None,
@@ -40,10 +41,10 @@ class ClassLibraryHandler(AbstractHandler):
                 None,
                 self._endClassInheritance
             ],
-            'INTF': [
-                self._startClassInterface,
+            'INHERITANCE/REDEFINITION': [
+                self._startClassMethodRedefinition,
                 None,
-                self._endClassInterface
+                self._endClassMethodRedefinition
             ],
             'PUBLICSECTION': [
                 self._startClassPublicSection,
@@ -80,32 +81,47 @@ class ClassLibraryHandler(AbstractHandler):
                 None,
                 self._endClassMethod
             ],
-            'INTERFACEMETHOD': [
-                self._startInterfaceMethod,
-                None,
-                self._endInterfaceMethod,
-            ],
-            'PARAMETER': [
+            'METHOD/PARAMETER': [
                 self._startClassMethodParameter,
                 None,
                 None,
             ],
-            'EXCEPTION': [
+            'METHOD/EXCEPTION': [
                 self._startClassMethodParameter,
                 None,
                 None,
             ],
+            'INTERFACEMETHOD': [
+                self._startInterfaceMethod,
+                None,
+                self._endInterfaceMethod,
+            ],
             'ATTRIBUTE': [
                 self._startClassAttribute,
                 None,
                 self._endClassAttribute
             ],
-            'REDEFINITION': [
-                self._startClassMethodRedefinition,
+        }
+        components.update(self._mount('METHOD', self.__owner.map_source_code()))
+        components.update(self._mount('INTERFACEMETHOD', self.__owner.map_source_code()))
+        components.update(self.__owner.map_text_pool())
+
+        path_handlers = {
+            # Classes specific elements
+            'CLAS': [
+                self._startClass,
                 None,
-                self._endClassMethodRedefinition
+                self._endClass
+            ],
+            'INTF': [
+                self._startClassInterface,
+                None,
+                self._endClassInterface
             ],
         }
+        path_handlers.update(self._mount('CLAS', components))
+        path_handlers.update(self._mount('INTF', components))
+        return path_handlers
 
     def _startClass(self, name, attrs):
         self.__logger.debug('Start Class')
@@ -141,7 +157,7 @@ class ClassLibraryHandler(AbstractHandler):
 
     def _endClass(self, name):
         self.__logger.debug('End class ' + name)
-        self.__abap_classes[self.__current_class.name] = self.__current_class
+        self.__owner.store_object(self.__abap_classes, self.__current_class.name, self.__current_class)
         self.__current_class = None
         self.__owner.finalize_textpool()
 
@@ -217,7 +233,7 @@ class ClassLibraryHandler(AbstractHandler):
 
     def _endClassInterface(self, name):
         self.__logger.debug('End class interface')
-        self.__abap_classes[self.__current_class.name] = self.__current_class
+        self.__owner.store_object(self.__abap_classes, self.__current_class.name, self.__current_class)
         self.__current_class = None
         self.__owner.finalize_textpool()
 
@@ -30,16 +30,23 @@ class DDICHandler(AbstractHandler):
     def parsed_structures(self):
         return self._abap_ddic_structures
 
+    def map_objects(self):
+        return {
+            'DOMA': 'DOMNAME',
+            'DTEL': 'ROLLNAME',
+            'TABL': 'TABNAME',
+        }
+
     def map_parse(self):
         # ABAP Dictionary
-        return {
+        path_handlers = {
             # # Domain
             'DOMA' : [
                 self._startDomainDeclaration,
                 None,
                 self._endDomainDeclaration,
             ],
-            'DD01V' : [
+            'DOMA/DD01V' : [
                 self._startDomainDefinition,
                 None,
                 self._endDomainDefinition,
@@ -50,36 +57,32 @@ class DDICHandler(AbstractHandler):
                 None,
                 self._endDataElementDeclaration
             ],
-            'DD04V' : [
+            'DTEL/DD04V' : [
                 self._startDataElementDefinition,
                 None,
                 self._endDataElementDefinition
             ],
 
-            'DDLANGUAGE' : [
-                None,
-                None,
-                None
-            ],
-
             # # Structure
             'TABL' : [
                 self._startStructure,
                 None,
                 self._endStructure
             ],
-            'DD03P' : [
+            'TABL/DD03P' : [
                 self._startStructureField,
                 None,
                 None
             ],
-            # # Table Type
-            'TTYP' : [
+            # Table types (TTYP) aren't parsed, so they're reported as unhandled objects.
+        }
+        for ddic_object in ('DOMA', 'DTEL', 'TABL'):
+            path_handlers[ddic_object + '/DDLANGUAGE'] = [
                 None,
                 None,
                 None
-            ],
-        }
+            ]
+        return path_handlers
 
     def _startDataElementDeclaration(self, name, attrs):
         self.__logger.debug('Start data element declaration')
@@ -143,7 +146,7 @@ class DDICHandler(AbstractHandler):
                                        RefKind=ref_kind,
                                        RefType=ref_type)
 
-        self._abap_ddic_data_element[name] = data_element
+        self.__owner.store_object(self._abap_ddic_data_element, name, data_element)
 
     def _endDataElementDefinition(self, name):
         self.__logger.debug('End data element definition')
@@ -178,7 +181,7 @@ class DDICHandler(AbstractHandler):
                             LowerCase=lower_case,
                             MaskLength=mask_length)
 
-        self._abap_ddic_domain[domain_name] = domain
+        self.__owner.store_object(self._abap_ddic_domain, domain_name, domain)
 
     def _endDomainDefinition(self, name):
         self.__logger.debug('End domain definition')
@@ -195,7 +198,8 @@ class DDICHandler(AbstractHandler):
 
     def _endStructure(self, name):
         self.__logger.debug('End Structure')
-        self._abap_ddic_structures[self.__current_data_element.name] = self.__current_data_element
+        self.__owner.store_object(self._abap_ddic_structures, self.__current_data_element.name,
+                                  self.__current_data_element)
         self.__current_data_element = None
 
     def _startStructureField(self, name, attrs):
@@ -22,75 +22,82 @@ class FunctionGroupHandler(AbstractHandler):
     def parsed_function_groups(self):
         return self._abap_function_groups
 
-    def map_parse(self):
+    def map_objects(self):
         return {
+            'FUGR': 'AREA',
+        }
+
+    def map_parse(self):
+        path_handlers = {
             # Function Groups and Function Modules specific elements
             'FUGR': [
                 self._startFunctionGroup,
                 None,
                 self._endFunctionGroup
             ],
-            'MAINPROGRAM': [
+            'FUGR/MAINPROGRAM': [
                 self._startFunctionGroupMainProgram,
                 None,
                 self._endFunctionGroupMainProgram
             ],
-            'INCLUDEPROGRAMS': [
+            'FUGR/INCLUDEPROGRAMS': [
                 None,
                 None,
                 None
             ],
-            'INCLUDE': [
+            'FUGR/INCLUDEPROGRAMS/INCLUDE': [
                 None,
                 None,
                 None
             ],
-            'FUNCTIONMODULES': [
+            'FUGR/FUNCTIONMODULES': [
                 None,
                 None,
                 None
             ],
-            'FUNCTIONMODULE': [
+            'FUGR/FUNCTIONMODULES/FUNCTIONMODULE': [
                 self._startFunctionModule,
                 None,
                 self._endFunctionModule
             ],
-            'IMPORTING': [
+            'FUGR/FUNCTIONMODULES/FUNCTIONMODULE/IMPORTING': [
                 self._startFunctionModuleParameter,
                 None,
                 self._endFunctionModuleParameter
             ],
-            'EXPORTING': [
+            'FUGR/FUNCTIONMODULES/FUNCTIONMODULE/EXPORTING': [
                 self._startFunctionModuleParameter,
                 None,
                 self._endFunctionModuleParameter
             ],
-            'CHANGING': [
+            'FUGR/FUNCTIONMODULES/FUNCTIONMODULE/CHANGING': [
                 self._startFunctionModuleParameter,
                 None,
                 self._endFunctionModuleParameter
             ],
-            'TABLES': [
+            'FUGR/FUNCTIONMODULES/FUNCTIONMODULE/TABLES': [
                 self._startFunctionModuleParameter,
                 None,
                 self._endFunctionModuleParameter
             ],
-            'EXCEPTIONS': [
+            'FUGR/FUNCTIONMODULES/FUNCTIONMODULE/EXCEPTIONS': [
                 self._startFunctionModuleException,
                 None,
                 None
             ],
-            'FM_SOURCE': [
+            'FUGR/FUNCTIONMODULES/FUNCTIONMODULE/FM_SOURCE': [
                 self._startFunctionModuleSourceCode,
                 self.__owner.charactersSourceCode,
                 self._endFunctionModuleSourceCode
             ],
-            'FM_SOURCE_NEW': [
+            'FUGR/FUNCTIONMODULES/FUNCTIONMODULE/FM_SOURCE_NEW': [
                 self._startFunctionModuleSourceCode,
                 self.__owner.charactersSourceCode,
                 self._endFunctionModuleSourceCode
             ],
         }
+        path_handlers.update(self._mount('FUGR/MAINPROGRAM', self.__owner.map_source_code()))
+        return path_handlers
 
     def _startFunctionGroup(self, name, attrs):
         self.__logger.debug('Start function group')
@@ -105,7 +112,8 @@ class FunctionGroupHandler(AbstractHandler):
 
     def _endFunctionGroup(self, name):
         self.__logger.debug('End function group')
-        self._abap_function_groups[self.__current_function_group.name] = self.__current_function_group
+        self.__owner.store_object(self._abap_function_groups, self.__current_function_group.name,
+                                  self.__current_function_group)
         self.__current_function_group = None
 
     def _startFunctionGroupMainProgram(self, name, attrs):
@@ -166,13 +174,13 @@ class FunctionGroupHandler(AbstractHandler):
                                                                             IsOptional=optional,
                                                                             Type=typ,
                                                                             DefaultValue=default_value)
-        if name == 'importing':
+        if name == 'IMPORTING':
             self.__current_function_module.parameters_importing[parameter] = function_parameter
-        elif name == 'exporting':
+        elif name == 'EXPORTING':
             self.__current_function_module.parameters_exporting[parameter] = function_parameter
-        elif name == 'changing':
+        elif name == 'CHANGING':
             self.__current_function_module.parameters_changing[parameter] = function_parameter
-        elif name == 'tables':
+        elif name == 'TABLES':
             self.__current_function_module.parameters_tables[parameter] = function_parameter
 
     def _endFunctionModuleParameter(self, name):
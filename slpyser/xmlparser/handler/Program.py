@@ -23,13 +23,24 @@ class ProgramHandler(AbstractHandler):
         """
         Tags used by programs.
         """
-        return {
+        path_handlers = {
             'PROG': [
                 self.__start_program,
                 None,
                 self.__end_program
             ],
         }
+        path_handlers.update(self._mount('PROG', self._owner.map_source_code()))
+        path_handlers.update(self._mount('PROG', self._owner.map_text_pool()))
+        return path_handlers
+
+    def map_objects(self):
+        """
+        Programs are named by NAME attribute.
+        """
+        return {
+            'PROG': 'NAME',
+        }
 
     @property
     def parsed_programs(self):
@@ -65,7 +76,7 @@ class ProgramHandler(AbstractHandler):
 
     def __end_program(self, name):
         self.__logger.debug('End program' + name)
-        self.__abap_programs[self.__current_program.name] = self.__current_program
+        self._owner.store_object(self.__abap_programs, self.__current_program.name, self.__current_program)
         self._owner.finalize_source_code()
         self._owner.finalize_textpool()
         self.__current_program = None
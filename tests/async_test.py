@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import os
+import threading
+import unittest
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from unittest import mock
+from tests.context import slpyser, Util
+from slpyser.xmlparser.SapLinkFileParser import SapLinkFileParser, ParseCancelled
+from slpyser.xmlparser.backend.Sax import SaxBackend
+
+class TestAsync(unittest.TestCase):
+
+
+    def setUp(self):
+        self.data = Util.synthetic_nugget(copies=2).encode('utf-8')
+        self.file_path = Util.write_temp_file(self.data)
+        self.addCleanup(os.remove, self.file_path)
+        self.expected = Util.dump_model(slpyser.parse(self.file_path).classes)
+
+    def test_aparse(self):
+        async def parse_all():
+            semaphore = asyncio.Semaphore(1)
+            with ProcessPoolExecutor(max_workers=1) as executor:
+                return await asyncio.gather(
+                    slpyser.aparse(self.file_path, semaphore=semaphore),
+                    slpyser.aparse(self.data, semaphore=semaphore, backend='expat'),
+                    slpyser.aparse(self.file_path, executor=executor, semaphore=semaphore))
+        for parsed_data in asyncio.run(parse_all()):
+            self.assertEqual(Util.dump_model(parsed_data.classes), self.expected)
+
+    def test_aiterparse(self):
+        async def collect():
+            return [abap_object async for abap_object in slpyser.aiterparse(self.file_path, queue_size=1)]
+        objects = asyncio.run(collect())
+        self.assertEqual([abap_object.name for abap_object in objects],
+                         [abap_object.name for abap_object in slpyser.iterparse(self.file_path)])
+
+        async def take_first():
+            async for abap_object in slpyser.aiterparse(self.file_path, queue_size=1):
+                return abap_object.name
+        self.assertEqual(asyncio.run(take_first()), 'ZSLPUT_CL_0')
+
+    def test_cancel(self):
+        fed, resume = threading.Event(), threading.Event()
+        feed = SaxBackend.feed
+
+        def feed_and_wait(backend, data):
+            # Parsing pauses after the first chunk, until the task was cancelled.
+            feed(backend, data)
+            fed.set()
+            resume.wait(10)
+
+        class RecordingExecutor(ThreadPoolExecutor):
+            futures = []
+
+            def submit(self, *args, **kwargs):
+                future = super(RecordingExecutor, self).submit(*args, **kwargs)
+                self.futures.append(future)
+                return future
+
+        async def cancel_parse(executor):
+            loop = asyncio.get_running_loop()
+            task = asyncio.ensure_future(slpyser.aparse(self.file_path, executor=executor))
+            await loop.run_in_executor(None, fed.wait)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+            resume.set()
+            # Parsing stops at the next chunk instead of reaching the end of file.
+            with self.assertRaises(ParseCancelled):
+                await asyncio.wrap_future(executor.futures[0])
+
+        with mock.patch.object(SapLinkFileParser, 'CHUNK_SIZE', 4096), \
+                mock.patch.object(SaxBackend, 'feed', feed_and_wait):
+            with RecordingExecutor(max_workers=1) as executor:
+                asyncio.run(cancel_parse(executor))
+
+
+if __name__ == '__main__':
+    unittest.main()
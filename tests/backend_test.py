@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+
+import os
+import re
+import unittest
+from unittest import mock
+from tests.context import slpyser, Util
+from slpyser.xmlparser.backends import Lxml
+
+class TestBackend(unittest.TestCase):
+
+
+    def setUp(self):
+        self.file_path = Util.write_temp_file(Util.synthetic_nugget(copies=3))
+        self.addCleanup(os.remove, self.file_path)
+
+    def test_expat_backend_matches_sax(self):
+        sax_data = slpyser.parse(self.file_path, backend='sax')
+        expat_data = slpyser.parse(self.file_path, backend='expat')
+        self.assertEqual(Util.dump_model(expat_data), Util.dump_model(sax_data))
+        self.assertEqual(len(expat_data.classes), 6)
+
+    def test_expat_backend_utf16(self):
+        file_path = Util.write_temp_file(Util.synthetic_nugget(declared_encoding='utf-16').encode('utf-16'))
+        self.addCleanup(os.remove, file_path)
+        self.assertEqual(Util.dump_model(slpyser.parse(file_path, backend='expat')),
+                         Util.dump_model(slpyser.parse(file_path, backend='sax')))
+
+    @unittest.skipIf(not Lxml.is_available(), 'lxml is not installed')
+    def test_lxml_backend_matches_sax(self):
+        self.assertEqual(Util.dump_model(slpyser.parse(self.file_path, backend='lxml')),
+                         Util.dump_model(slpyser.parse(self.file_path, backend='sax')))
+
+    def test_single_object_file(self):
+        # Like SAPLink .slnk files, the object is the root element (tags in any case).
+        abap_class = re.search(r'<CLAS .*?</CLAS>', Util.synthetic_nugget(), re.DOTALL).group(0)
+        for root in (abap_class, abap_class.replace('<CLAS ', '<clas ').replace('</CLAS>', '</clas>')):
+            file_path = Util.write_temp_file('<?xml version="1.0" encoding="utf-8"?>\n' + root,
+                                             suffix='.slnk')
+            self.addCleanup(os.remove, file_path)
+            expected = slpyser.parse(file_path, backend='sax')
+            method = expected.classes['ZSLPUT_CL_0'].methods['RUN']
+            self.assertTrue(method.parameters)
+            self.assertTrue(method.source_code.source_code)
+            backends = ['expat', 'lxml'] if Lxml.is_available() else ['expat']
+            for backend in backends:
+                self.assertEqual(Util.dump_model(slpyser.parse(file_path, backend=backend).classes),
+                                 Util.dump_model(expected.classes), backend)
+
+    def test_unavailable_backend_fallback(self):
+        with mock.patch.object(Lxml, 'is_available', return_value=False):
+            parsed_data = slpyser.parse(self.file_path, backend='lxml')
+        self.assertEqual(len(parsed_data.classes), 6)
+
+    def test_unknown_backend(self):
+        with self.assertRaises(ValueError):
+            slpyser.parse(self.file_path, backend='unknown')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+
+import os
+import unittest
+from tests.context import slpyser, Util
+from slpyser.model.saplink.ParseFailure import ParseFailure
+
+class TestParseMany(unittest.TestCase):
+
+
+    def setUp(self):
+        self.file_paths = []
+        for copies in (1, 3, 2):
+            self.file_paths.append(Util.write_temp_file(Util.synthetic_nugget(copies=copies)))
+        self.file_paths.insert(1, Util.write_temp_file('<nugget><PROG NAME="BROKEN"></nugget>'))
+        for file_path in self.file_paths:
+            self.addCleanup(os.remove, file_path)
+
+    def test_parse_many(self):
+        expected = [Util.dump_model(slpyser.parse(file_path).programs)
+                    for file_path in self.file_paths if file_path != self.file_paths[1]]
+        for workers, chunksize in ((1, 1), (2, 1), (2, 3)):
+            results = list(slpyser.parse_many(self.file_paths, workers=workers, chunksize=chunksize))
+            self.assertEqual([result.file_path for result in results], self.file_paths)
+            failure = results.pop(1)
+            self.assertIsInstance(failure, ParseFailure)
+            self.assertEqual(failure.error_type, 'SAXParseException')
+            self.assertEqual([Util.dump_model(result.programs) for result in results], expected)
+
+        results = list(slpyser.parse_many(self.file_paths, workers=2, ordered=False))
+        self.assertEqual(sorted(result.file_path for result in results), sorted(self.file_paths))
+
+    def test_lazy_sources(self):
+        with self.assertRaises(ValueError):
+            slpyser.parse_many(self.file_paths, sources='lazy')
+
+    def test_invalid_options(self):
+        with self.assertRaises(ValueError):
+            slpyser.parse_many(self.file_paths, chunksize=0)
+        with self.assertRaises(TypeError):
+            slpyser.parse_many(self.file_paths, workers=2, name_filter=lambda name: True)
+        # Parsing in the calling process doesn't need to pickle it.
+        results = list(slpyser.parse_many(self.file_paths[:1], workers=1,
+                                          name_filter=lambda name: name.endswith('_0')))
+        self.assertEqual(sorted(results[0].programs), ['ZSLPUT_PROGRAM_0'])
+
+
+if __name__ == '__main__':
+    unittest.main()
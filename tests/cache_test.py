@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+
+import os
+import pickle
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+from tests.context import slpyser, Util
+from slpyser.cache.DiskCache import DiskCache
+from slpyser.interface.ParserInterface import _ParserInterface
+
+class TestDiskCache(unittest.TestCase):
+
+
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.cache_dir)
+        self.file_path = self.write_temp_file(Util.synthetic_nugget(copies=2))
+        self.expected = Util.dump_model(slpyser.parse(self.file_path).classes)
+
+    def write_temp_file(self, data):
+        file_path = Util.write_temp_file(data)
+        self.addCleanup(os.remove, file_path)
+        # Old enough for its fingerprint to be reused.
+        os.utime(file_path, ns=(10 ** 18, 10 ** 18))
+        return file_path
+
+    def parse(self, file_path, **options):
+        """
+        Parses with cache, telling if the file was really parsed.
+        """
+        with mock.patch.object(_ParserInterface, 'parse_file', wraps=_ParserInterface.parse_file) as parse_file:
+            parsed_data = slpyser.parse(file_path, cache_dir=self.cache_dir, **options)
+        return parsed_data, parse_file.called
+
+    def test_hit(self):
+        parsed_data, parsed = self.parse(self.file_path)
+        self.assertTrue(parsed)
+        parsed_data, parsed = self.parse(self.file_path)
+        self.assertFalse(parsed)
+        self.assertEqual(parsed_data.file_path, self.file_path)
+        self.assertEqual(Util.dump_model(parsed_data.classes), self.expected)
+        self.assertEqual(parsed_data.function_modules['Z_SLPUT_FM_0'].name, 'Z_SLPUT_FM_0')
+
+        # Options are part of the key.
+        parsed_data, parsed = self.parse(self.file_path, include_types=['PROG'])
+        self.assertTrue(parsed)
+        self.assertEqual(parsed_data.classes, {})
+        _, parsed = self.parse(self.file_path, name_filter=lambda name: True)
+        self.assertTrue(parsed)
+
+        # Same contents on another path are found by their hash.
+        with open(self.file_path, 'rb') as stream:
+            copy_path = self.write_temp_file(stream.read())
+        parsed_data, parsed = self.parse(copy_path)
+        self.assertFalse(parsed)
+        self.assertEqual(parsed_data.file_path, copy_path)
+
+    def test_invalidation(self):
+        self.parse(self.file_path)
+        with open(self.file_path, 'ab') as stream:
+            stream.write(b'\n')
+        os.utime(self.file_path, ns=(10 ** 18 + 1, 10 ** 18 + 1))
+        _, parsed = self.parse(self.file_path)
+        self.assertTrue(parsed)
+
+        with mock.patch.object(slpyser, '__version__', '999'):
+            _, parsed = self.parse(self.file_path)
+        self.assertTrue(parsed)
+
+        # Broken entries are discarded.
+        for directory, _, file_names in os.walk(self.cache_dir):
+            for file_name in file_names:
+                if file_name.endswith('.entry'):
+                    with open(os.path.join(directory, file_name), 'wb') as entry:
+                        entry.write(b'garbage')
+        with self.assertLogs('slpyser.cache.DiskCache', level='WARNING'):
+            parsed_data, parsed = self.parse(self.file_path)
+        self.assertTrue(parsed)
+        self.assertEqual(Util.dump_model(parsed_data.classes), self.expected)
+
+    def test_untrusted_entry(self):
+        self.parse(self.file_path)
+        for directory, _, file_names in os.walk(self.cache_dir):
+            for file_name in file_names:
+                if file_name.endswith('.entry'):
+                    with open(os.path.join(directory, file_name), 'wb') as entry:
+                        entry.write(pickle.dumps(_Exploit()))
+        with self.assertLogs('slpyser.cache.DiskCache', level='WARNING'):
+            _, parsed = self.parse(self.file_path)
+        self.assertTrue(parsed)
+        self.assertFalse(_Exploit.ran)
+
+    def test_eviction(self):
+        cache = DiskCache(self.cache_dir, MaxSize=1)
+        _ParserInterface.parse_cached(self.file_path, cache, Sources=True)
+        entries = [file_name for _, _, file_names in os.walk(self.cache_dir) for file_name in file_names]
+        self.assertEqual(entries, [])
+
+    def test_eviction_walks(self):
+        cache = DiskCache(self.cache_dir)
+        with mock.patch('os.walk', wraps=os.walk) as walk:
+            _ParserInterface.parse_cached(self.file_path, cache, Sources=True)
+            _ParserInterface.parse_cached(self.file_path, cache, Sources=False)
+        # Only walked once to learn the directory size, which is then accounted on writes.
+        self.assertEqual(walk.call_count, 1)
+
+
+class _Exploit(object):
+    """
+    Pickle running code when it's loaded.
+    """
+
+    ran = False
+
+    def __reduce__(self):
+        return (setattr, (_Exploit, 'ran', True))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+
+import bz2
+import gzip
+import io
+import lzma
+import os
+import unittest
+import zipfile
+from unittest import mock
+from tests.context import slpyser, Util
+from slpyser.xmlparser.SapLinkFileParser import SapLinkFileParser
+
+class TestCompression(unittest.TestCase):
+
+
+    def setUp(self):
+        self.data = Util.synthetic_nugget(copies=2).encode('utf-8')
+        self.expected = Util.dump_model(slpyser.parse_bytes(self.data).classes)
+
+    def write_temp_file(self, data, suffix):
+        file_path = Util.write_temp_file(data, suffix=suffix)
+        self.addCleanup(os.remove, file_path)
+        return file_path
+
+    def test_streams(self):
+        for suffix, compress in (('.gz', gzip.compress), ('.bz2', bz2.compress), ('.xz', lzma.compress)):
+            compressed_data = compress(self.data)
+            # Extension doesn't matter, compression is detected by magic bytes.
+            file_path = self.write_temp_file(compressed_data, suffix='.nugg')
+            with mock.patch.object(SapLinkFileParser, 'CHUNK_SIZE', 500):
+                parsed_data = slpyser.parse(file_path)
+            self.assertEqual(Util.dump_model(parsed_data.classes), self.expected, suffix)
+
+            parsed_data = slpyser.parse_stream(io.BytesIO(compressed_data), backend='expat')
+            self.assertEqual(Util.dump_model(parsed_data.classes), self.expected, suffix)
+
+            with self.assertLogs('slpyser.xmlparser.SapLinkFileParser', level='WARNING'):
+                parsed_data = slpyser.parse_bytes(compressed_data, sources='lazy')
+            self.assertEqual(Util.dump_model(parsed_data.classes), self.expected, suffix)
+
+        utf16_data = Util.synthetic_nugget(copies=2, declared_encoding='utf-16').encode('utf-16')
+        parsed_data = slpyser.parse_bytes(gzip.compress(utf16_data))
+        self.assertEqual(parsed_data.encoding, 'utf-16')
+        self.assertEqual(Util.dump_model(parsed_data.classes), self.expected)
+
+    def test_truncated(self):
+        for compress in (gzip.compress, bz2.compress, lzma.compress):
+            compressed_data = compress(self.data)
+            truncated_data = compressed_data[:len(compressed_data) // 2]
+            with self.assertRaises(EOFError, msg=compress.__module__):
+                slpyser.parse_bytes(truncated_data)
+            # Chopping the trailer only, all data is decompressed but its end is still missing.
+            with self.assertRaises(EOFError, msg=compress.__module__):
+                slpyser.parse_bytes(compressed_data[:-4])
+
+    def test_archive(self):
+        archive = io.BytesIO()
+        with zipfile.ZipFile(archive, 'w', zipfile.ZIP_DEFLATED) as zip_file:
+            zip_file.writestr('first.nugg', self.data)
+        file_path = self.write_temp_file(archive.getvalue(), suffix='.zip')
+        parsed_data = slpyser.parse(file_path)
+        self.assertEqual(parsed_data.archive_member, 'first.nugg')
+        self.assertEqual(Util.dump_model(parsed_data.classes), self.expected)
+
+        with zipfile.ZipFile(archive, 'a', zipfile.ZIP_DEFLATED) as zip_file:
+            zip_file.writestr('folder/', b'')
+            zip_file.writestr('folder/second.nugg.gz', gzip.compress(self.data))
+        file_path = self.write_temp_file(archive.getvalue(), suffix='.zip')
+        self.assertRaises(ValueError, slpyser.parse, file_path)
+
+        parsed_files = list(slpyser.parse_archive(file_path, include_types=['PROG']))
+        self.assertEqual([parsed_file.archive_member for parsed_file in parsed_files],
+                         ['first.nugg', 'folder/second.nugg.gz'])
+        for parsed_file in parsed_files:
+            self.assertEqual(parsed_file.file_path, file_path)
+            self.assertEqual(sorted(parsed_file.programs), ['ZSLPUT_PROGRAM_0', 'ZSLPUT_PROGRAM_1'])
+
+
+if __name__ == '__main__':
+    unittest.main()
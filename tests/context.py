@@ -1,10 +1,12 @@
 # -*- coding: utf-8 -*-
 
 import os
+import tempfile
 import sys
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 import slpyser
+from benchmarks import _synthetic
 
 class Util:
 
@@ -28,3 +30,48 @@ class Util:
     @staticmethod
     def file_path(file_name):
         return os.path.abspath(os.path.join(Util.__dir_test_data(), file_name))
+
+    @staticmethod
+    def synthetic_nugget(copies=1, declared_encoding='utf-8'):
+        """
+        Builds a SAPLink nugget (as text) exercising every element handled by the library, see
+        :func:`benchmarks._synthetic.synthetic_nugget`.
+        """
+        return _synthetic.synthetic_nugget(copies=copies, declared_encoding=declared_encoding)
+
+    @staticmethod
+    def write_temp_file(data, suffix='.nugg'):
+        """
+        Writes data (bytes or text, encoded as UTF-8) into a temporary file and returns its path.
+        """
+        if not isinstance(data, bytes):
+            data = data.encode('utf-8')
+        handle, path = tempfile.mkstemp(suffix=suffix)
+        with os.fdopen(handle, 'wb') as temp_file:
+            temp_file.write(data)
+        return path
+
+    @staticmethod
+    def dump_model(obj):
+        """
+        Converts a parsed object (and everything reachable through its properties) into plain
+        dicts, lists and strings, so two parse results can be compared with assertEqual.
+        """
+        if isinstance(obj, dict):
+            return {key: Util.dump_model(value) for key, value in obj.items()}
+        if isinstance(obj, (list, tuple)):
+            return [Util.dump_model(value) for value in obj]
+        if obj is None or isinstance(obj, (str, int, float, bool)):
+            return obj
+        dumped = {'__class__': type(obj).__name__}
+        for cls in type(obj).__mro__:
+            for attribute, value in vars(cls).items():
+                if (isinstance(value, property) and attribute not in dumped
+                        and attribute not in Util.__DUMP_SKIPPED_PROPERTIES):
+                    dumped[attribute] = Util.dump_model(getattr(obj, attribute))
+        if hasattr(obj, 'source_code') and not isinstance(type(obj).__dict__.get('source_code'), property):
+            dumped['source_code'] = Util.dump_model(obj.source_code)
+        return dumped
+
+    # Back references (function group of a function module) and file-level data.
+    __DUMP_SKIPPED_PROPERTIES = ('function_group', 'file_path', 'parse_report')
@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+
+import os
+import unittest
+from tests.context import slpyser, Util
+
+class TestDispatch(unittest.TestCase):
+
+
+    def parse_nugget(self, nugget):
+        file_path = Util.write_temp_file(nugget)
+        self.addCleanup(os.remove, file_path)
+        return slpyser.parse(file_path)
+
+    def test_elements_handled_on_their_context(self):
+        # Class documentation languages must not reset the text pool of the class, and sources
+        # from unknown elements must not end up in the program source code.
+        nugget = Util.synthetic_nugget().replace(
+            '  <attribute CLSNAME="ZSLPUT_CL_0"',
+            '  <classDocumentation OBJECT="ZSLPUT_CL_0">\n'
+            '   <language SPRAS="E"><textLine TDFORMAT="U1" TDLINE="Doc"/></language>\n'
+            '  </classDocumentation>\n'
+            '  <attribute CLSNAME="ZSLPUT_CL_0"', 1).replace(
+            '  <source>REPORT zslput_program_0.',
+            '  <dynpros><dynpro><source>PROCESS BEFORE OUTPUT.</source></dynpro></dynpros>\n'
+            '  <source>REPORT zslput_program_0.', 1)
+        parsed_data = self.parse_nugget(nugget)
+
+        text_pool = parsed_data.classes['ZSLPUT_CL_0'].text_pool.language_mapping
+        self.assertIn('I', text_pool['E'])
+        source_code = parsed_data.programs['ZSLPUT_PROGRAM_0'].source_code.source_code
+        self.assertTrue(source_code.startswith('REPORT zslput_program_0.'))
+        self.assertNotIn('PROCESS BEFORE OUTPUT', source_code)
+
+    def test_function_module_parameters(self):
+        parsed_data = self.parse_nugget(Util.synthetic_nugget())
+        function_module = parsed_data.function_modules['Z_SLPUT_FM_0']
+        self.assertEqual(sorted(function_module.parameters_importing), ['IV_FLAG', 'IV_INPUT'])
+        self.assertEqual(list(function_module.parameters_exporting), ['EV_OUTPUT'])
+        self.assertEqual(list(function_module.parameters_changing), ['CV_COUNTER'])
+        self.assertEqual(list(function_module.parameters_tables), ['ET_RETURN'])
+        self.assertEqual(function_module.source_code.source_code,
+                         '  ev_output = iv_input.\n  cv_counter = cv_counter + 1.')
+
+    def test_single_object_file(self):
+        # SAPLink files of a single object have it as root element, instead of nugget.
+        nugget = Util.synthetic_nugget()
+        program = nugget[nugget.index(' <PROG '):nugget.index('</PROG>') + len('</PROG>')]
+        parsed_data = self.parse_nugget('<?xml version="1.0" encoding="utf-8"?>\n' + program)
+        self.assertEqual(list(parsed_data.programs), ['ZSLPUT_PROGRAM_0'])
+
+
+if __name__ == '__main__':
+    unittest.main()
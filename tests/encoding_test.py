@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+
+import codecs
+import os
+import unittest
+from tests.context import slpyser, Util
+
+class TestEncoding(unittest.TestCase):
+
+
+    def parse_data(self, data, **kwargs):
+        file_path = Util.write_temp_file(data)
+        self.addCleanup(os.remove, file_path)
+        return slpyser.parse(file_path, **kwargs)
+
+    def assert_contents(self, parsed_data):
+        self.assertIn('ZSLPUT_CL_0', parsed_data.classes)
+        self.assertIn('ZSLPUT_PROGRAM_0', parsed_data.programs)
+        self.assertIn('<brackets>', parsed_data.classes['ZSLPUT_CL_0'].methods['RUN'].source_code.source_code)
+
+    def test_utf8(self):
+        parsed_data = self.parse_data(Util.synthetic_nugget().encode('utf-8'))
+        self.assert_contents(parsed_data)
+        self.assertEqual(parsed_data.encoding, 'utf-8')
+
+    def test_mislabeled_utf16(self):
+        # Some SAPLink plugins declare UTF-16 but write the file as UTF-8.
+        data = Util.synthetic_nugget(declared_encoding='utf-16').encode('utf-8')
+        parsed_data = self.parse_data(data)
+        self.assert_contents(parsed_data)
+        self.assertEqual(parsed_data.encoding, 'utf-8')
+
+    def test_utf16_with_bom(self):
+        data = Util.synthetic_nugget(declared_encoding='utf-16').encode('utf-16')
+        parsed_data = self.parse_data(data)
+        self.assert_contents(parsed_data)
+        self.assertEqual(parsed_data.encoding, 'utf-16')
+
+    def test_utf32_with_bom(self):
+        for data in (Util.synthetic_nugget(declared_encoding='utf-32').encode('utf-32'),
+                     codecs.BOM_UTF32_BE + Util.synthetic_nugget(declared_encoding='utf-32').encode('utf-32-be')):
+            for backend in ('sax', 'expat'):
+                parsed_data = self.parse_data(data, backend=backend)
+                self.assert_contents(parsed_data)
+                self.assertEqual(parsed_data.encoding, 'utf-32')
+
+    def test_utf16_without_bom(self):
+        data = Util.synthetic_nugget(declared_encoding='utf-16').encode('utf-16-be')
+        parsed_data = self.parse_data(data)
+        self.assert_contents(parsed_data)
+        self.assertEqual(parsed_data.encoding, 'utf-16-be')
+
+    def test_utf8_with_bom(self):
+        data = codecs.BOM_UTF8 + Util.synthetic_nugget().encode('utf-8')
+        parsed_data = self.parse_data(data)
+        self.assert_contents(parsed_data)
+        self.assertEqual(parsed_data.encoding, 'utf-8')
+
+    def test_encoding_not_supported_by_expat(self):
+        nugget = Util.synthetic_nugget(declared_encoding='cp1252').replace('Synthetic class 0', u'Synthetic class €')
+        parsed_data = self.parse_data(nugget.encode('cp1252'))
+        self.assert_contents(parsed_data)
+        self.assertEqual(parsed_data.encoding, 'cp1252')
+        self.assertEqual(parsed_data.classes['ZSLPUT_CL_0'].description, u'Synthetic class €')
+
+    def test_overridden_encoding(self):
+        nugget = Util.synthetic_nugget().replace('Synthetic class 0', u'Synthetic class \xe9')
+        parsed_data = self.parse_data(nugget.encode('latin-1'), encoding='latin-1')
+        self.assertEqual(parsed_data.encoding, 'iso8859-1')
+        self.assertEqual(parsed_data.classes['ZSLPUT_CL_0'].description, u'Synthetic class \xe9')
+
+
+if __name__ == '__main__':
+    unittest.main()
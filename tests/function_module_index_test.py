@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+
+import pickle
+import unittest
+from tests.context import slpyser, Util
+from slpyser.model.abap_objects.AbapFunctionGroup import AbapFunctionModule
+
+class TestFunctionModuleIndex(unittest.TestCase):
+
+
+    def setUp(self):
+        self.parsed_data = slpyser.parse_bytes(Util.synthetic_nugget(copies=12).encode('utf-8'))
+
+    def test_lookups(self):
+        index = self.parsed_data.function_module_index
+        function_group = self.parsed_data.function_groups['ZSLPUT_FG_3']
+        self.assertEqual(len(index), 12)
+        self.assertIn('Z_SLPUT_FM_3', index)
+        self.assertIs(index.get('Z_SLPUT_FM_3'), function_group.function_modules['Z_SLPUT_FM_3'])
+        self.assertIsNone(index.get('z_slput_fm_3'))
+        self.assertIs(index.get('z_slput_fm_3', CaseSensitive=False), index.get('Z_SLPUT_FM_3'))
+        self.assertIs(index.function_group('z_slput_fm_3', CaseSensitive=False), function_group)
+        self.assertIsNone(index.function_group('Z_SLPUT_FM_99'))
+        self.assertEqual(index.with_prefix('Z_SLPUT_FM_1'),
+                         ['Z_SLPUT_FM_1', 'Z_SLPUT_FM_10', 'Z_SLPUT_FM_11'])
+        self.assertEqual(index.with_prefix('z_slput_fm_1', CaseSensitive=False),
+                         ['Z_SLPUT_FM_1', 'Z_SLPUT_FM_10', 'Z_SLPUT_FM_11'])
+        self.assertEqual(index.with_prefix('Y'), [])
+        self.assertIs(self.parsed_data.function_modules, index.function_modules)
+
+    def test_replaced(self):
+        index = self.parsed_data.function_module_index
+        self.assertIs(self.parsed_data.function_module_index, index)
+        self.assertIn('Z_SLPUT_FM_3', index)
+        function_group = self.parsed_data.function_groups['ZSLPUT_FG_3']
+        replacement = AbapFunctionModule(FunctionGroup=function_group, Name='Z_SLPUT_FM_3',
+                                         Description='Replaced')
+        function_group.function_modules['Z_SLPUT_FM_3'] = replacement
+        self.assertIs(index.get('Z_SLPUT_FM_3'), replacement)
+        self.assertIs(index.get('z_slput_fm_3', CaseSensitive=False), replacement)
+        self.assertIs(self.parsed_data.function_modules['Z_SLPUT_FM_3'], replacement)
+
+    def test_renamed(self):
+        index = self.parsed_data.function_module_index
+        self.assertIn('Z_SLPUT_FM_3', index)
+        function_group = self.parsed_data.function_groups['ZSLPUT_FG_3']
+        function_module = function_group.function_modules.pop('Z_SLPUT_FM_3')
+        function_group.function_modules['Z_SLPUT_FM_RENAMED'] = function_module
+        # Same amount of function modules, but the old name is gone at once.
+        self.assertIsNone(index.get('Z_SLPUT_FM_3'))
+        self.assertNotIn('Z_SLPUT_FM_3', self.parsed_data.function_modules)
+        self.assertEqual(index.with_prefix('Z_SLPUT_FM_3'), [])
+        self.assertEqual(len(index), 11)
+
+        index.invalidate()
+        self.assertIs(index.get('Z_SLPUT_FM_RENAMED'), function_module)
+        self.assertIs(index.function_group('z_slput_fm_renamed', CaseSensitive=False), function_group)
+        self.assertEqual(len(self.parsed_data.function_modules), 12)
+
+    def test_added_and_removed(self):
+        index = self.parsed_data.function_module_index
+        function_group = self.parsed_data.function_groups['ZSLPUT_FG_3']
+        function_group.function_modules['Z_SLPUT_FM_NEW'] = AbapFunctionModule(
+            FunctionGroup=function_group, Name='Z_SLPUT_FM_NEW', Description='New')
+        index.invalidate()
+        self.assertIs(self.parsed_data.function_module_index, index)
+        self.assertIs(index.function_group('Z_SLPUT_FM_NEW'), function_group)
+
+        # Replaced function groups don't keep their function modules in the file.
+        self.parsed_data.function_groups['ZSLPUT_FG_3'] = type(function_group)(
+            Name='ZSLPUT_FG_3', Description='Replaced', OriginalLanguage='E')
+        self.assertNotIn('Z_SLPUT_FM_3', self.parsed_data.function_modules)
+        del self.parsed_data.function_groups['ZSLPUT_FG_4']
+        self.assertIsNone(index.function_group('Z_SLPUT_FM_4'))
+        self.assertEqual(sorted(self.parsed_data.function_modules),
+                         sorted('Z_SLPUT_FM_%d' % number for number in range(12) if number not in (3, 4)))
+
+    def test_pickle(self):
+        self.parsed_data.function_module_index
+        loaded = pickle.loads(pickle.dumps(self.parsed_data))
+        self.assertIs(loaded.function_modules['Z_SLPUT_FM_5'],
+                      loaded.function_groups['ZSLPUT_FG_5'].function_modules['Z_SLPUT_FM_5'])
+
+
+if __name__ == '__main__':
+    unittest.main()
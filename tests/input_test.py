@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+
+import io
+import mmap
+import os
+import unittest
+from unittest import mock
+from tests.context import slpyser, Util
+from slpyser.xmlparser.SapLinkFileParser import SapLinkFileParser
+
+class TestInput(unittest.TestCase):
+
+
+    def setUp(self):
+        self.data = Util.synthetic_nugget(copies=2).encode('utf-8')
+        self.file_path = Util.write_temp_file(self.data)
+        self.addCleanup(os.remove, self.file_path)
+        self.expected = Util.dump_model(slpyser.parse(self.file_path).classes)
+
+    def test_bytes(self):
+        for backend in ('sax', 'expat', 'lxml'):
+            # Small chunks, so the file is fed in several slices of the same buffer.
+            with mock.patch.object(SapLinkFileParser, 'CHUNK_SIZE', 1000):
+                parsed_data = slpyser.parse_bytes(self.data, backend=backend)
+            self.assertIsNone(parsed_data.file_path)
+            self.assertEqual(Util.dump_model(parsed_data.classes), self.expected)
+
+        utf16_data = Util.synthetic_nugget(copies=2, declared_encoding='utf-16').encode('utf-16')
+        parsed_data = slpyser.parse_bytes(utf16_data)
+        self.assertEqual(parsed_data.encoding, 'utf-16')
+        self.assertEqual(Util.dump_model(parsed_data.classes), self.expected)
+
+    def test_stream(self):
+        with mock.patch.object(SapLinkFileParser, 'CHUNK_SIZE', 1000):
+            parsed_data = slpyser.parse_stream(io.BytesIO(self.data))
+        self.assertIsNone(parsed_data.file_path)
+        self.assertEqual(Util.dump_model(parsed_data.classes), self.expected)
+
+        with open(self.file_path, 'rb') as stream:
+            parsed_data = slpyser.parse_stream(stream)
+        self.assertEqual(parsed_data.file_path, self.file_path)
+
+        with open(self.file_path, 'r') as stream:
+            self.assertRaises(TypeError, slpyser.parse_stream, stream)
+
+    def test_mmap(self):
+        with open(self.file_path, 'rb') as stream:
+            mapped_file = mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ)
+        parsed_data = slpyser.parse_bytes(mapped_file, sources='lazy')
+        self.assertEqual(Util.dump_model(parsed_data.classes), self.expected)
+        mapped_file.close()
+
+    def test_no_source(self):
+        self.assertRaises(ValueError, SapLinkFileParser)
+        self.assertRaises(ValueError, SapLinkFileParser, FilePath=self.file_path, Data=self.data)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import unittest
+from tests.context import slpyser, Util
+from slpyser.cache import ParseCache
+
+class TestIntern(unittest.TestCase):
+
+
+    def test_intern(self):
+        data = Util.synthetic_nugget(copies=3).encode('utf-8')
+        for backend in ('sax', 'expat'):
+            parsed_data = slpyser.parse_bytes(data, backend=backend, intern=True)
+            first, second = parsed_data.classes['ZSLPUT_CL_0'], parsed_data.classes['ZSLPUT_CL_2']
+            self.assertIs(first.parent_class, second.parent_class)
+            self.assertIs(first.created_by, second.created_by)
+            report = parsed_data.parse_report
+            self.assertLess(report.distinct_values, report.interned_values)
+
+            expected = slpyser.parse_bytes(data, backend=backend)
+            self.assertIsNone(expected.parse_report.interned_values)
+            self.assertEqual(Util.dump_model(parsed_data.classes), Util.dump_model(expected.classes))
+
+    def test_global(self):
+        parsed_data = slpyser.parse_bytes(Util.synthetic_nugget().encode('utf-8'), intern='global')
+        parent_class = parsed_data.classes['ZSLPUT_CL_0'].parent_class
+        self.assertIs(parent_class, sys.intern(''.join(['ZSLPUT_CL_', 'BASE'])))
+
+    def test_cache_key(self):
+        file_path = Util.write_temp_file(Util.synthetic_nugget(copies=2))
+        self.addCleanup(os.remove, file_path)
+        cache = ParseCache()
+        plain = slpyser.parse(file_path, cache=cache)
+        interned = slpyser.parse(file_path, cache=cache, intern=True)
+        self.assertIsNot(interned, plain)
+        self.assertIsNotNone(interned.parse_report.interned_values)
+        self.assertIs(slpyser.parse(file_path, cache=cache, intern=True), interned)
+
+    def test_unknown_mode(self):
+        with self.assertRaises(ValueError):
+            slpyser.parse_bytes(Util.synthetic_nugget().encode('utf-8'), intern='process')
+
+
+if __name__ == '__main__':
+    unittest.main()
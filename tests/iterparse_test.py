@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+
+import os
+import unittest
+from tests.context import slpyser, Util
+
+class TestIterparse(unittest.TestCase):
+
+
+    def setUp(self):
+        self.file_path = Util.write_temp_file(Util.synthetic_nugget(copies=2))
+        self.addCleanup(os.remove, self.file_path)
+
+    def test_iterparse(self):
+        for backend in ('sax', 'expat', 'lxml'):
+            objects = list(slpyser.iterparse(self.file_path, backend=backend))
+            self.assertEqual([(type(abap_object).__name__, abap_object.name) for abap_object in objects[:8]],
+                             [('AbapClass', 'ZSLPUT_CL_0'),
+                              ('AbapClassInterface', 'ZSLPUT_IF_0'),
+                              ('AbapProgram', 'ZSLPUT_PROGRAM_0'),
+                              ('AbapFunctionGroup', 'ZSLPUT_FG_0'),
+                              ('AbapMessageClass', 'ZSLPUT_MSG_0'),
+                              ('AbapDomain', 'ZSLPUT_DOMAIN_0'),
+                              ('AbapDataElement', 'ZSLPUT_DATAELEMENT_0'),
+                              ('AbapTypeStructure', 'ZSLPUT_STRUCTURE_0')])
+            self.assertEqual(len(objects), 16)
+
+            parsed_data = slpyser.parse(self.file_path, backend=backend)
+            streamed_classes = {abap_object.name: abap_object for abap_object in objects
+                                if type(abap_object).__name__ in ('AbapClass', 'AbapClassInterface')}
+            self.assertEqual(Util.dump_model(streamed_classes), Util.dump_model(parsed_data.classes))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+
+import os
+import pickle
+import unittest
+from tests.context import slpyser, Util
+
+class TestModel(unittest.TestCase):
+
+
+    def test_slots(self):
+        file_path = Util.write_temp_file(Util.synthetic_nugget(copies=1))
+        self.addCleanup(os.remove, file_path)
+        parsed_data = slpyser.parse(file_path)
+        abap_class = parsed_data.classes['ZSLPUT_CL_0']
+        method = abap_class.methods['RUN']
+        function_module = parsed_data.function_modules['Z_SLPUT_FM_0']
+        data_dictionary = parsed_data.data_dictionary
+        for obj in (abap_class, parsed_data.classes['ZSLPUT_IF_0'], abap_class.attributes['MV_NAME'],
+                    method, method.parameters['IV_VALUE'], method.source_code, abap_class.text_pool,
+                    abap_class.text_pool.language_mapping['E']['I'],
+                    parsed_data.programs['ZSLPUT_PROGRAM_0'], parsed_data.function_groups['ZSLPUT_FG_0'],
+                    function_module, function_module.parameters_importing['IV_INPUT'],
+                    parsed_data.message_classes['ZSLPUT_MSG_0'],
+                    parsed_data.message_classes['ZSLPUT_MSG_0'].language_mapping['E']['000'],
+                    data_dictionary, data_dictionary.domains['ZSLPUT_DOMAIN_0'],
+                    data_dictionary.data_elements['ZSLPUT_DATAELEMENT_0'],
+                    data_dictionary.structures['ZSLPUT_STRUCTURE_0'],
+                    data_dictionary.structures['ZSLPUT_STRUCTURE_0'].fields['FIELD1']):
+            self.assertFalse(hasattr(obj, '__dict__'), type(obj).__name__)
+
+        unpickled = pickle.loads(pickle.dumps(parsed_data))
+        for attribute in ('classes', 'function_groups', 'function_modules', 'programs',
+                          'message_classes', 'data_dictionary'):
+            self.assertEqual(Util.dump_model(getattr(unpickled, attribute)),
+                             Util.dump_model(getattr(parsed_data, attribute)), attribute)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+
+import gzip
+import os
+import unittest
+from tests.context import slpyser, Util
+from slpyser.xmlparser.NuggetSplitter import NuggetSplitter
+
+class TestParseParallel(unittest.TestCase):
+
+
+    def write_temp_file(self, data):
+        file_path = Util.write_temp_file(data)
+        self.addCleanup(os.remove, file_path)
+        return file_path
+
+    def assertSameParse(self, file_path, **options):
+        expected = slpyser.parse(file_path, **options)
+        parsed_data = slpyser.parse_parallel(file_path, workers=3, **options)
+        for attribute in ('classes', 'function_groups', 'function_modules', 'programs',
+                          'message_classes', 'data_dictionary'):
+            self.assertEqual(Util.dump_model(getattr(parsed_data, attribute)),
+                             Util.dump_model(getattr(expected, attribute)), attribute)
+        self.assertEqual(list(parsed_data.classes), list(expected.classes))
+        self.assertEqual({path: (element.occurrences, element.byte_volume)
+                          for path, element in parsed_data.parse_report.unhandled.items()},
+                         {path: (element.occurrences, element.byte_volume)
+                          for path, element in expected.parse_report.unhandled.items()})
+        self.assertEqual(parsed_data.encoding, expected.encoding)
+
+    def test_split(self):
+        nugget = Util.synthetic_nugget(copies=6).replace(
+            '</nugget>', ' <ZUNKNOWN_PLUGIN NAME="Z1"><data/></ZUNKNOWN_PLUGIN>\n</nugget>').encode('utf-8')
+        splitter = NuggetSplitter(Buffer=nugget, ObjectTypes=['CLAS', 'PROG'])
+        ranges = splitter.split(Parts=3)
+        self.assertEqual(len(ranges), 3)
+        self.assertEqual(ranges[0][0], len(splitter.header))
+        self.assertEqual(ranges[-1][1], len(nugget) - len(splitter.footer))
+        for start, _ in ranges[1:]:
+            self.assertTrue(nugget[start:start + 6] in (b'<CLAS ', b'<PROG '))
+
+        file_path = self.write_temp_file(nugget)
+        self.assertSameParse(file_path)
+        self.assertSameParse(file_path, include_types=['FUGR', 'DTEL'], sources=False)
+
+    def test_fallback(self):
+        # Object-like markup inside a CDATA section makes split positions invalid.
+        cdata = '<![CDATA[' + ' <PROG NAME="FAKE"></PROG>' * 200 + ']]>'
+        nugget = Util.synthetic_nugget(copies=2).replace('START-OF-SELECTION.', cdata, 1)
+        self.assertSameParse(self.write_temp_file(nugget))
+        # Compressed and single object files are parsed sequentially.
+        self.assertSameParse(self.write_temp_file(gzip.compress(nugget.encode('utf-8'))))
+        self.assertSameParse(self.write_temp_file(
+            '<?xml version="1.0"?>\n<PROG NAME="ZSLPUT_ALONE"><source>WRITE 1.</source></PROG>'))
+
+
+if __name__ == '__main__':
+    unittest.main()
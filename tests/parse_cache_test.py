@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+
+import os
+import threading
+import unittest
+from tests.context import slpyser, Util
+from slpyser.cache.ParseCache import ParseCache
+
+class TestParseCache(unittest.TestCase):
+
+
+    def setUp(self):
+        self.file_paths = [Util.write_temp_file(Util.synthetic_nugget(copies=copies)) for copies in (1, 2)]
+        for file_path in self.file_paths:
+            self.addCleanup(os.remove, file_path)
+
+    def test_lru(self):
+        cache = ParseCache(max_entries=1)
+        first = slpyser.parse(self.file_paths[0], cache=cache)
+        self.assertIs(slpyser.parse(self.file_paths[0], cache=cache), first)
+        self.assertEqual((cache.hits, cache.misses, cache.evictions, len(cache)), (1, 1, 0, 1))
+
+        slpyser.parse(self.file_paths[1], cache=cache)
+        self.assertEqual((cache.misses, cache.evictions, len(cache)), (2, 1, 1))
+        self.assertIsNot(slpyser.parse(self.file_paths[0], cache=cache), first)
+        self.assertEqual(cache.misses, 3)
+
+        # Changed files are parsed again.
+        with open(self.file_paths[0], 'ab') as stream:
+            stream.write(b'\n' * 10)
+        slpyser.parse(self.file_paths[0], cache=cache)
+        self.assertEqual(cache.misses, 4)
+
+    def test_size(self):
+        parsed_data = slpyser.parse(self.file_paths[1])
+        size = ParseCache.estimate_size(parsed_data)
+        source_size = sum(len(method.source_code.source_code)
+                          for abap_class in parsed_data.classes.values()
+                          for method in abap_class.methods.values() if method.source_code.source_code)
+        self.assertGreater(size, source_size)
+
+        cache = ParseCache(max_bytes=int(size * 1.5))
+        slpyser.parse(self.file_paths[1], cache=cache)
+        self.assertEqual(len(cache), 1)
+        self.assertLessEqual(cache.size, int(size * 1.5))
+        slpyser.parse(self.file_paths[0], cache=cache)
+        self.assertEqual((len(cache), cache.evictions), (1, 1))
+
+        # Files bigger than the whole cache aren't kept.
+        cache = ParseCache(max_bytes=10)
+        slpyser.parse(self.file_paths[1], cache=cache)
+        self.assertEqual((len(cache), cache.size), (0, 0))
+
+    def test_package_export(self):
+        import slpyser.cache
+        cache = slpyser.cache.ParseCache(max_bytes=10, max_entries=1)
+        self.assertIsInstance(cache, ParseCache)
+        slpyser.parse(self.file_paths[1], cache=cache)
+        self.assertEqual(len(cache), 0)
+        cache = slpyser.cache.ParseCache(max_entries=1)
+        for file_path in self.file_paths:
+            slpyser.parse(file_path, cache=cache)
+        self.assertEqual((len(cache), cache.evictions), (1, 1))
+
+    def test_threads(self):
+        cache = ParseCache(max_bytes=50 * 1024 * 1024)
+        results = []
+
+        def parse_files():
+            for _ in range(5):
+                for file_path in self.file_paths:
+                    results.append(sorted(slpyser.parse(file_path, cache=cache).programs))
+
+        threads = [threading.Thread(target=parse_files) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(results), 40)
+        self.assertEqual(cache.hits + cache.misses, 40)
+        self.assertEqual(len(cache), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+
+import os
+import unittest
+from tests.context import slpyser, Util
+
+class TestParseReport(unittest.TestCase):
+
+
+    UNKNOWN_PLUGIN = '<ZUNKNOWN_PLUGIN NAME="Z1"><data>\n   some text\n  </data><empty/></ZUNKNOWN_PLUGIN>'
+
+    def setUp(self):
+        self.nugget = Util.synthetic_nugget(copies=2).replace(
+            '</nugget>', ' %s\n</nugget>' % self.UNKNOWN_PLUGIN)
+        self.file_path = self.write_temp_file(self.nugget.encode('utf-8'))
+
+    def write_temp_file(self, data):
+        file_path = Util.write_temp_file(data)
+        self.addCleanup(os.remove, file_path)
+        return file_path
+
+    def test_unhandled_elements(self):
+        for backend in ('sax', 'expat', 'lxml'):
+            with self.assertLogs('slpyser.xmlparser.SapLinkFileParser', level='WARNING') as logs:
+                parsed_data = slpyser.parse(self.file_path, backend=backend)
+            # A single summary line is logged.
+            self.assertEqual(len(logs.output), 1)
+
+            unhandled = parsed_data.parse_report.unhandled
+            self.assertEqual(sorted(unhandled),
+                             ['FUGR/INCLUDEPROGRAMS/INCLUDE/INCLUDE_SOURCE',
+                              'FUGR/MAINPROGRAM/TEXTPOOL',
+                              'ZUNKNOWN_PLUGIN'])
+            include_source = unhandled['FUGR/INCLUDEPROGRAMS/INCLUDE/INCLUDE_SOURCE']
+            self.assertEqual(include_source.occurrences, 2)
+            self.assertEqual(unhandled['ZUNKNOWN_PLUGIN'].occurrences, 1)
+            if backend == 'lxml':
+                # No byte positions are known.
+                self.assertIsNone(include_source.byte_volume)
+                continue
+            self.assertEqual(include_source.byte_volume,
+                             2 * len('<include_source>FUNCTION-POOL zslput_fg_0.</include_source>'))
+            self.assertEqual(unhandled['ZUNKNOWN_PLUGIN'].byte_volume, len(self.UNKNOWN_PLUGIN))
+
+    def test_table_type(self):
+        table_type = '<TTYP TYPENAME="ZSLPUT_TT"><dd40v TYPENAME="ZSLPUT_TT" ROWTYPE="ZSLPUT_STRUCTURE_0"/></TTYP>'
+        file_path = self.write_temp_file(self.nugget.replace('</nugget>', ' %s\n</nugget>' % table_type)
+                                         .encode('utf-8'))
+        unhandled = slpyser.parse(file_path).parse_report.unhandled
+        # Table types aren't parsed, so they're skipped as a whole.
+        self.assertEqual(unhandled['TTYP'].occurrences, 1)
+        self.assertEqual(unhandled['TTYP'].byte_volume, len(table_type))
+        self.assertNotIn('TTYP/DD40V', unhandled)
+
+    def test_byte_volume_encodings(self):
+        utf16_path = self.write_temp_file(self.nugget.replace('utf-8', 'utf-16', 1).encode('utf-16-le'))
+        for backend in ('sax', 'expat'):
+            unhandled = slpyser.parse(utf16_path, backend=backend).parse_report.unhandled
+            self.assertEqual(unhandled['ZUNKNOWN_PLUGIN'].byte_volume, 2 * len(self.UNKNOWN_PLUGIN))
+
+        # Positions on contents converted to UTF-8 aren't the ones on file.
+        cp1252_path = self.write_temp_file(self.nugget.replace('utf-8', 'cp1252', 1).encode('cp1252'))
+        unhandled = slpyser.parse(cp1252_path).parse_report.unhandled
+        self.assertEqual(unhandled['ZUNKNOWN_PLUGIN'].occurrences, 1)
+        self.assertIsNone(unhandled['ZUNKNOWN_PLUGIN'].byte_volume)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+
+import gzip
+import os
+import unittest
+from unittest import mock
+from tests.context import slpyser, Util
+from slpyser.cache.DiskCache import DiskCache
+
+class TestReparse(unittest.TestCase):
+
+
+    def write_temp_file(self, data):
+        file_path = Util.write_temp_file(data)
+        self.addCleanup(os.remove, file_path)
+        return file_path
+
+    def assertSameParse(self, parsed_data, file_path, **options):
+        expected = slpyser.parse(file_path, **options)
+        for attribute in ('classes', 'function_groups', 'function_modules', 'programs',
+                          'message_classes', 'data_dictionary'):
+            self.assertEqual(Util.dump_model(getattr(parsed_data, attribute)),
+                             Util.dump_model(getattr(expected, attribute)), attribute)
+        self.assertEqual(list(parsed_data.classes), list(expected.classes))
+        self.assertEqual(list(parsed_data.programs), list(expected.programs))
+        self.assertEqual(parsed_data.encoding, expected.encoding)
+
+    def test_reparse(self):
+        nugget = Util.synthetic_nugget(copies=3)
+        file_path = self.write_temp_file(nugget)
+        first = slpyser.reparse(None, file_path)
+        self.assertSameParse(first, file_path)
+        self.assertEqual(len(first.change_report.added), 24)
+        self.assertFalse(first.change_report.changed or first.change_report.removed)
+
+        # Nothing changed: every object is reused.
+        second = slpyser.reparse(first, file_path)
+        self.assertFalse(second.change_report)
+        self.assertIs(second.classes['ZSLPUT_CL_0'], first.classes['ZSLPUT_CL_0'])
+
+        program_2 = nugget[nugget.index(' <PROG NAME="ZSLPUT_PROGRAM_2"'):nugget.index(' <FUGR AREA="ZSLPUT_FG_2"')]
+        nugget = (nugget.replace('in copy 1', 'in copy one')
+                  .replace(program_2, program_2.replace('_2', '_NEW')))
+        with open(file_path, 'w') as changed_file:
+            changed_file.write(nugget)
+        third = slpyser.reparse(second, file_path)
+        self.assertSameParse(third, file_path)
+        self.assertEqual(third.change_report.changed, [('CLAS', 'ZSLPUT_CL_1')])
+        self.assertEqual(third.change_report.added, [('PROG', 'ZSLPUT_PROGRAM_NEW')])
+        self.assertEqual(third.change_report.removed, [('PROG', 'ZSLPUT_PROGRAM_2')])
+        self.assertEqual(len(third.change_report.unchanged), 22)
+        self.assertIs(third.classes['ZSLPUT_CL_0'], first.classes['ZSLPUT_CL_0'])
+        self.assertIs(third.function_groups['ZSLPUT_FG_1'], first.function_groups['ZSLPUT_FG_1'])
+        self.assertIsNot(third.classes['ZSLPUT_CL_1'], first.classes['ZSLPUT_CL_1'])
+
+        # Objects parsed with other options aren't reused.
+        selected = slpyser.reparse(third, file_path, include_types=['CLAS', 'PROG'], sources=False)
+        self.assertSameParse(selected, file_path, include_types=['CLAS', 'PROG'], sources=False)
+        self.assertEqual(len(selected.change_report.changed), 6)
+        self.assertFalse(selected.change_report.unchanged)
+
+    def test_fallback(self):
+        # Objects broken by an end tag inside a CDATA section can't be parsed on their own.
+        cdata = '<![CDATA[ <PROG NAME="FAKE"></PROG> ]]>'
+        nugget = Util.synthetic_nugget(copies=2).replace('START-OF-SELECTION.', cdata, 1)
+        file_path = self.write_temp_file(nugget)
+        first = slpyser.reparse(None, file_path)
+        self.assertSameParse(first, file_path)
+        with open(file_path, 'w') as changed_file:
+            changed_file.write(nugget.replace('in copy 1', 'in copy one'))
+        self.assertSameParse(slpyser.reparse(first, file_path), file_path)
+
+        compressed_path = self.write_temp_file(gzip.compress(nugget.encode('utf-8')))
+        compressed = slpyser.reparse(first, compressed_path)
+        self.assertSameParse(compressed, compressed_path)
+        self.assertIsNone(compressed.change_report)
+
+        with self.assertRaises(ValueError):
+            slpyser.reparse(None, file_path, sources='lazy')
+
+
+    def test_independent_of_cache_key(self):
+        file_path = self.write_temp_file(Util.synthetic_nugget(copies=2))
+        first = slpyser.reparse(None, file_path)
+        # Fingerprints don't depend on how caches key their entries.
+        with mock.patch.object(DiskCache, 'options_key', return_value=None):
+            second = slpyser.reparse(first, file_path)
+        self.assertFalse(second.change_report)
+        self.assertEqual(second.fingerprints, first.fingerprints)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+
+import os
+import unittest
+from tests.context import slpyser, Util
+
+class TestSelectiveParsing(unittest.TestCase):
+
+
+    def setUp(self):
+        self.file_path = Util.write_temp_file(Util.synthetic_nugget(copies=3))
+        self.addCleanup(os.remove, self.file_path)
+
+    def test_include_types(self):
+        for backend in ('sax', 'expat', 'lxml'):
+            parsed_data = slpyser.parse(self.file_path, backend=backend, include_types={'CLAS', 'INTF'})
+            self.assertEqual(sorted(parsed_data.classes),
+                             ['ZSLPUT_CL_0', 'ZSLPUT_CL_1', 'ZSLPUT_CL_2',
+                              'ZSLPUT_IF_0', 'ZSLPUT_IF_1', 'ZSLPUT_IF_2'])
+            self.assertEqual(parsed_data.programs, {})
+            self.assertEqual(parsed_data.function_groups, {})
+            self.assertEqual(parsed_data.message_classes, {})
+            # Skipped objects aren't reported as unhandled.
+            self.assertEqual(parsed_data.parse_report.unhandled, {})
+
+            full_data = slpyser.parse(self.file_path, backend=backend)
+            self.assertEqual(Util.dump_model(parsed_data.classes), Util.dump_model(full_data.classes))
+
+    def test_unknown_type(self):
+        with self.assertRaises(ValueError):
+            slpyser.parse(self.file_path, include_types={'CLAS', 'ZZZZ'})
+
+    def test_name_filter(self):
+        for backend in ('sax', 'expat', 'lxml'):
+            parsed_data = slpyser.parse(self.file_path, backend=backend, name_filter='ZSLPUT_*_1')
+            self.assertEqual(sorted(parsed_data.classes), ['ZSLPUT_CL_1', 'ZSLPUT_IF_1'])
+            self.assertEqual(sorted(parsed_data.programs), ['ZSLPUT_PROGRAM_1'])
+            self.assertEqual(sorted(parsed_data.function_groups), ['ZSLPUT_FG_1'])
+
+            objects = list(slpyser.iterparse(self.file_path, backend=backend, include_types=['prog'],
+                                             name_filter=lambda name: not name.endswith('_0')))
+            self.assertEqual([abap_object.name for abap_object in objects],
+                             ['ZSLPUT_PROGRAM_1', 'ZSLPUT_PROGRAM_2'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+
+import os
+import unittest
+from tests.context import slpyser, Util
+from slpyser.storage.Snapshot import Snapshot
+
+class TestSnapshot(unittest.TestCase):
+
+
+    def write_temp_file(self, data, suffix='.nugg'):
+        file_path = Util.write_temp_file(data, suffix=suffix)
+        self.addCleanup(os.remove, file_path)
+        return file_path
+
+    def assertSameFile(self, loaded, expected):
+        for attribute in ('classes', 'function_groups', 'function_modules', 'programs',
+                          'message_classes', 'data_dictionary'):
+            self.assertEqual(Util.dump_model(getattr(loaded, attribute)),
+                             Util.dump_model(getattr(expected, attribute)), attribute)
+        self.assertEqual(list(loaded.classes), list(expected.classes))
+        self.assertEqual(loaded.encoding, expected.encoding)
+        self.assertEqual(loaded.file_path, expected.file_path)
+        self.assertEqual({path: (element.occurrences, element.byte_volume)
+                          for path, element in loaded.parse_report.unhandled.items()},
+                         {path: (element.occurrences, element.byte_volume)
+                          for path, element in expected.parse_report.unhandled.items()})
+
+    def test_snapshot(self):
+        file_path = self.write_temp_file(Util.synthetic_nugget(copies=3))
+        snapshot_path = self.write_temp_file(b'', suffix='.snap')
+        for options in ({}, {'sources': False}, {'sources': 'lazy'}, {'sources': 'arena'},
+                        {'sources': 'compressed'}):
+            parsed_data = slpyser.parse(file_path, **options)
+            parsed_data.save_snapshot(snapshot_path)
+            loaded = slpyser.load_snapshot(snapshot_path)
+            self.assertSameFile(loaded, parsed_data)
+            function_module = loaded.function_modules['Z_SLPUT_FM_1']
+            self.assertIs(function_module.function_group, loaded.function_groups['ZSLPUT_FG_1'])
+
+        with Snapshot(snapshot_path) as snapshot:
+            self.assertEqual(snapshot.names('programs'),
+                             ['ZSLPUT_PROGRAM_0', 'ZSLPUT_PROGRAM_1', 'ZSLPUT_PROGRAM_2'])
+            program = snapshot.load('programs', 'ZSLPUT_PROGRAM_1')
+            self.assertEqual(program.source_code.source_code,
+                             parsed_data.programs['ZSLPUT_PROGRAM_1'].source_code.source_code)
+            with self.assertRaises(KeyError):
+                snapshot.load('classes', 'ZSLPUT_CL_9')
+
+    def test_foreign_class(self):
+        parsed_data = slpyser.parse_bytes(Util.synthetic_nugget().encode('utf-8'))
+        snapshot_path = self.write_temp_file(b'', suffix='.snap')
+        # Classes reachable from library modules, or imported by model modules, aren't loaded.
+        for module_name, qualified_name in (('slpyser.xmlparser.SapLinkFileParser', 'io.BytesIO'),
+                                            ('slpyser.model.saplink.SapLinkFile', 'FunctionModuleIndex'),
+                                            ('slpyser.model.saplink.SapLinkFile', 'bisect.insort')):
+            foreign = type('Foreign', (object,), {'__module__': module_name})
+            foreign.__qualname__ = qualified_name
+            parsed_data.programs['ZSLPUT_FOREIGN'] = foreign()
+            parsed_data.save_snapshot(snapshot_path)
+            with self.assertRaises(ValueError):
+                slpyser.load_snapshot(snapshot_path)
+
+    def test_not_a_snapshot(self):
+        for data in (b'', b'<?xml version="1.0"?><nugget/>'):
+            with self.assertRaises(ValueError):
+                slpyser.load_snapshot(self.write_temp_file(data, suffix='.snap'))
+
+
+if __name__ == '__main__':
+    unittest.main()
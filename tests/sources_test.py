@@ -0,0 +1,197 @@
+# -*- coding: utf-8 -*-
+
+import gc
+import os
+import pickle
+import unittest
+import weakref
+from unittest import mock
+from tests.context import slpyser, Util
+from slpyser.xmlparser.MappedFile import MappedFile
+from slpyser.xmlparser.SourceCollector import ArenaSource, CompressedSource
+
+class TestSources(unittest.TestCase):
+
+
+    def setUp(self):
+        self.file_path = Util.write_temp_file(Util.synthetic_nugget(copies=2))
+        self.addCleanup(os.remove, self.file_path)
+
+    @staticmethod
+    def source_codes(parsed_data):
+        """
+        Source codes of parsed data, by a readable path.
+        """
+        source_codes = {}
+        for class_name, abap_class in parsed_data.classes.items():
+            for section in ('public_section', 'protected_section', 'private_section',
+                            'local_implementation', 'local_types', 'local_macros'):
+                if hasattr(abap_class, section):
+                    source_codes[class_name + '/' + section] = getattr(abap_class, section)
+            for method_name, method in abap_class.methods.items():
+                source_codes[class_name + '/' + method_name] = method.source_code
+        for program_name, program in parsed_data.programs.items():
+            source_codes[program_name] = program.source_code
+        for group_name, function_group in parsed_data.function_groups.items():
+            source_codes[group_name] = function_group.main_program.source
+            for module_name, function_module in function_group.function_modules.items():
+                source_codes[group_name + '/' + module_name] = function_module.source_code
+        return source_codes
+
+    def test_metadata_only(self):
+        full_sources = self.source_codes(slpyser.parse(self.file_path))
+        self.assertEqual(full_sources['ZSLPUT_PROGRAM_1'].line_count, 4)
+
+        for backend in ('sax', 'expat', 'lxml'):
+            parsed_data = slpyser.parse(self.file_path, backend=backend, sources=False)
+            metadata_sources = self.source_codes(parsed_data)
+            self.assertEqual(sorted(metadata_sources), sorted(full_sources))
+            for path, source_code in metadata_sources.items():
+                self.assertIsNone(source_code.source_code, path)
+                self.assertEqual(source_code.length, full_sources[path].length, path)
+                self.assertEqual(source_code.line_count, full_sources[path].line_count, path)
+            # Everything else is still parsed.
+            self.assertEqual(parsed_data.function_groups['ZSLPUT_FG_0'].function_modules['Z_SLPUT_FM_0']
+                             .parameters_importing.keys(),
+                             slpyser.parse(self.file_path).function_groups['ZSLPUT_FG_0']
+                             .function_modules['Z_SLPUT_FM_0'].parameters_importing.keys())
+
+    def test_lazy(self):
+        full_sources = self.source_codes(slpyser.parse(self.file_path))
+        for backend in ('sax', 'expat'):
+            lazy_sources = self.source_codes(slpyser.parse(self.file_path, backend=backend, sources='lazy'))
+            self.assertEqual(sorted(lazy_sources), sorted(full_sources))
+            method_source = lazy_sources['ZSLPUT_CL_1/RUN']
+            self.assertFalse(method_source.loaded)
+            self.assertIn('<brackets>', method_source.source_code)
+            self.assertTrue(method_source.loaded)
+            for path, source_code in lazy_sources.items():
+                self.assertEqual(source_code.source_code, full_sources[path].source_code, path)
+
+        # Backend without byte positions keeps source code in memory.
+        with self.assertLogs('slpyser.xmlparser.SapLinkFileParser', level='WARNING'):
+            lazy_sources = self.source_codes(slpyser.parse(self.file_path, backend='lxml', sources='lazy'))
+        self.assertEqual(lazy_sources['ZSLPUT_PROGRAM_0'].source_code,
+                         full_sources['ZSLPUT_PROGRAM_0'].source_code)
+
+    def test_lazy_markup(self):
+        nugget = Util.synthetic_nugget().replace(
+            'START-OF-SELECTION.',
+            'START-OF-SELECTION. " &#xE9;&#233;\r\n<![CDATA[ <b>&amp; ]]><!-- gone -->\r\n  \u00e7 &company;')
+        nugget = nugget.replace('<nugget ', '<!DOCTYPE nugget [\n <!ENTITY company "ACME">\n]>\n<nugget ')
+        file_path = Util.write_temp_file(b'\xef\xbb\xbf' + nugget.encode('utf-8'))
+        self.addCleanup(os.remove, file_path)
+        program_source = slpyser.parse(file_path).programs['ZSLPUT_PROGRAM_0'].source_code.source_code
+        self.assertIn('\u00e9\u00e9\n <b>&amp; \n  \u00e7 ACME', program_source)
+        for backend in ('sax', 'expat'):
+            lazy_source = slpyser.parse(file_path, backend=backend, sources='lazy') \
+                .programs['ZSLPUT_PROGRAM_0'].source_code.source_code
+            self.assertEqual(lazy_source, program_source)
+
+    def test_arena(self):
+        full_sources = self.source_codes(slpyser.parse(self.file_path))
+        for backend in ('sax', 'expat', 'lxml'):
+            parsed_data = slpyser.parse(self.file_path, backend=backend, sources='arena')
+            arena_sources = self.source_codes(parsed_data)
+            self.assertEqual(sorted(arena_sources), sorted(full_sources))
+            for path, source_code in arena_sources.items():
+                expected = full_sources[path]
+                self.assertEqual(source_code.source_code, expected.source_code, path)
+                self.assertEqual(source_code.length, expected.length, path)
+                self.assertEqual(source_code.line_count, expected.line_count, path)
+                if expected.source_code is not None:
+                    self.assertEqual(source_code.source_buffer().tobytes(),
+                                     expected.source_code.encode('utf-8'), path)
+            buffer = arena_sources['ZSLPUT_PROGRAM_1'].source_buffer()
+            self.assertTrue(buffer.readonly)
+            self.assertEqual(Util.dump_model(parsed_data.programs),
+                             Util.dump_model(slpyser.parse(self.file_path).programs))
+
+        # Objects yielded before the end of file copy their bytes, as the arena still grows.
+        buffers = [abap_object.source_code.source_buffer()
+                   for abap_object in slpyser.iterparse(self.file_path, sources='arena', include_types=['PROG'])]
+        self.assertEqual([buffer.tobytes() for buffer in buffers],
+                         [full_sources[name].source_code.encode('utf-8')
+                          for name in ('ZSLPUT_PROGRAM_0', 'ZSLPUT_PROGRAM_1')])
+
+    def test_compressed(self):
+        full_sources = self.source_codes(slpyser.parse(self.file_path))
+        parsed_data = slpyser.parse(self.file_path, sources='compressed')
+        compressed_sources = self.source_codes(pickle.loads(pickle.dumps(parsed_data)))
+        self.assertEqual(sorted(compressed_sources), sorted(full_sources))
+        for path, source_code in compressed_sources.items():
+            expected = full_sources[path]
+            self.assertEqual(source_code.source_code, expected.source_code, path)
+            self.assertEqual(source_code.length, expected.length, path)
+            self.assertEqual(source_code.line_count, expected.line_count, path)
+            if expected.source_code is not None:
+                self.assertEqual(source_code.source_buffer().tobytes(),
+                                 expected.source_code.encode('utf-8'), path)
+
+        # Recently decompressed text is reused.
+        program_source = compressed_sources['ZSLPUT_PROGRAM_1']
+        self.assertIs(program_source.source_code, program_source.source_code)
+
+    def test_view_line_count(self):
+        full_sources = self.source_codes(slpyser.parse(self.file_path))
+        for sources, view in (('arena', ArenaSource), ('compressed', CompressedSource)):
+            view_sources = self.source_codes(slpyser.parse(self.file_path, sources=sources))
+            # Known since the source code was parsed, without decoding it again.
+            with mock.patch.object(view, 'text', side_effect=AssertionError('decoded')):
+                for path, source_code in view_sources.items():
+                    self.assertEqual(source_code.line_count, full_sources[path].line_count, path)
+
+    def test_compressed_release(self):
+        source = CompressedSource.compress('REPORT zslput_release.\n' * 100)
+        self.assertIs(source.text(), source.text())
+        reference = weakref.ref(source)
+        del source
+        gc.collect()
+        # Recently decompressed texts don't keep their sources alive.
+        self.assertIsNone(reference())
+
+    def test_lazy_close(self):
+        with slpyser.parse(self.file_path, sources='lazy') as parsed_data:
+            program_source = parsed_data.programs['ZSLPUT_PROGRAM_0'].source_code
+            method_source = parsed_data.classes['ZSLPUT_CL_0'].methods['RUN'].source_code
+            self.assertIn('REPORT', program_source.source_code)
+        # Source code read before closing is kept.
+        self.assertIn('REPORT', program_source.source_code)
+        with self.assertRaises(ValueError):
+            method_source.source_code
+
+    def test_lazy_pickle(self):
+        full_sources = self.source_codes(slpyser.parse(self.file_path))
+        with slpyser.parse(self.file_path, sources='lazy') as parsed_data:
+            loaded = pickle.loads(pickle.dumps(parsed_data))
+        for path, source_code in self.source_codes(loaded).items():
+            self.assertTrue(source_code.loaded, path)
+            self.assertEqual(source_code.source_code, full_sources[path].source_code, path)
+
+    def test_lazy_close_on_failure(self):
+        class RecordingMappedFile(MappedFile):
+            instances = []
+
+            def __init__(self, Stream):
+                super(RecordingMappedFile, self).__init__(Stream)
+                self.instances.append(self)
+
+        broken_path = Util.write_temp_file(Util.synthetic_nugget().replace('</nugget>', '</broken>'))
+        self.addCleanup(os.remove, broken_path)
+        with mock.patch('slpyser.xmlparser.SapLinkFileParser.MappedFile', RecordingMappedFile):
+            with self.assertRaises(Exception):
+                slpyser.parse(broken_path, sources='lazy')
+            objects = slpyser.iterparse(self.file_path, sources='lazy')
+            next(objects)
+            objects.close()
+        self.assertEqual(len(RecordingMappedFile.instances), 2)
+        for mapped_file in RecordingMappedFile.instances:
+            self.assertTrue(mapped_file.closed)
+
+    def test_unknown_mode(self):
+        with self.assertRaises(ValueError):
+            slpyser.parse(self.file_path, sources='everything')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+
+import os
+import tempfile
+import unittest
+from tests.context import slpyser, Util
+from slpyser.storage.SqliteIndex import SqliteIndex
+
+class TestSqliteIndex(unittest.TestCase):
+
+
+    def write_temp_file(self, data):
+        file_path = Util.write_temp_file(data)
+        self.addCleanup(os.remove, file_path)
+        return file_path
+
+    def test_index(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        database = os.path.join(directory.name, 'nuggets.db')
+        first_path = self.write_temp_file(Util.synthetic_nugget(copies=2))
+        second_path = self.write_temp_file(Util.synthetic_nugget(copies=1).replace('ZSLPUT_CL_BASE', 'ZSLPUT_CL_OTHER'))
+
+        with SqliteIndex(database) as index:
+            index.add_many(slpyser.parse_many([first_path, second_path, directory.name], workers=1))
+            self.assertEqual(index.names(), sorted([first_path, second_path]))
+            rows = index.query('SELECT n.path, c.name FROM classes c JOIN nuggets n ON n.id = c.nugget_id '
+                               'WHERE c.parent_class = ? ORDER BY c.name', ('ZSLPUT_CL_BASE',))
+            self.assertEqual([tuple(row) for row in rows],
+                             [(first_path, 'ZSLPUT_CL_0'), (first_path, 'ZSLPUT_CL_1')])
+            rows = index.query('SELECT DISTINCT fm.name, p.kind FROM function_module_parameters p '
+                               'JOIN function_modules fm ON fm.id = p.function_module_id '
+                               'WHERE p.type = ? ORDER BY fm.name', ('ABAP_BOOL',))
+            self.assertEqual([tuple(row) for row in rows],
+                             [('Z_SLPUT_FM_0', 'importing'), ('Z_SLPUT_FM_1', 'importing')])
+            self.assertEqual(index.query('SELECT count(*) FROM method_parameters WHERE type = ?',
+                                         ('BAPIRET2_T',))[0][0], 3)
+            self.assertEqual(index.query('SELECT count(*) FROM structure_fields')[0][0], 6)
+            self.assertEqual(index.query('SELECT count(*) FROM text_elements')[0][0], 9)
+            self.assertEqual(index.query('SELECT count(*) FROM messages')[0][0], 6)
+
+        # Adding a file again replaces its rows.
+        with SqliteIndex(database) as index:
+            index.add(slpyser.parse(first_path, include_types=['CLAS']))
+            self.assertEqual(index.query('SELECT count(*) FROM classes')[0][0], 4)
+            self.assertEqual(index.query('SELECT count(*) FROM methods')[0][0], 7)
+            index.remove(second_path)
+            self.assertEqual(index.query('SELECT count(*) FROM methods')[0][0], 4)
+            self.assertEqual(index.query('SELECT count(*) FROM function_module_parameters')[0][0], 0)
+            with self.assertRaises(ValueError):
+                index.add(slpyser.parse_bytes(Util.synthetic_nugget().encode('utf-8')))
+
+
+if __name__ == '__main__':
+    unittest.main()